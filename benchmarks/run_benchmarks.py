@@ -0,0 +1,202 @@
+"""
+Time and memory benchmarks for the debiasers.
+
+Each case runs on data from the ``examples/ate_workflow.py`` generator at
+every requested size (up to the case's own size limit, so quadratic cases
+are not run at sizes where they take hours). Wall time is the best of
+``--repeat`` runs with ``time.perf_counter``; peak memory is the largest
+``tracemalloc`` peak, which includes NumPy buffers. Results are written as
+JSON; pass ``--baseline`` with an earlier result file to print the ratios.
+
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e4 1e5 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+import importlib.util
+import json
+from pathlib import Path
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+import warnings
+
+import numpy as np
+
+import unshrink
+from unshrink import LccDebiaser, TweedieDebiaser, compare_debiasers
+
+ROOT = Path(__file__).resolve().parents[1]
+Workload = Dict[str, np.ndarray]
+
+
+def _load_generator() -> Callable[..., tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    spec = importlib.util.spec_from_file_location("ate_workflow", ROOT / "examples" / "ate_workflow.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module._simulate_workflow
+
+
+def make_workload(n: int, seed: int = 0) -> Workload:
+    """Split ``n`` simulated rows into equal calibration and trial halves."""
+    predictions, targets, treatment = _load_generator()(seed=seed, n=2 * n)
+    trial_predictions = predictions[n:]
+    trial_treatment = treatment[n:]
+    return {
+        "cal_predictions": predictions[:n],
+        "cal_targets": targets[:n],
+        "predictions": trial_predictions,
+        "treated": trial_predictions[trial_treatment == 1],
+        "control": trial_predictions[trial_treatment == 0],
+    }
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    # Builds the timed callable from a workload; fitting done here is not timed.
+    setup: Callable[[Workload], Callable[[], Any]]
+    max_n: int
+
+
+def _fitted(debiaser: Any, workload: Workload) -> Any:
+    return debiaser.fit(workload["cal_predictions"], workload["cal_targets"])
+
+
+def _fit_case(factory: Callable[[], Any]) -> Callable[[Workload], Callable[[], Any]]:
+    def setup(workload: Workload) -> Callable[[], Any]:
+        return lambda: _fitted(factory(), workload)
+
+    return setup
+
+
+def _predict_case(factory: Callable[[], Any]) -> Callable[[Workload], Callable[[], Any]]:
+    def setup(workload: Workload) -> Callable[[], Any]:
+        debiaser = _fitted(factory(), workload)
+        return lambda: debiaser.debiased_predictions(workload["predictions"])
+
+    return setup
+
+
+def _ate_case(factory: Callable[[], Any]) -> Callable[[Workload], Callable[[], Any]]:
+    def setup(workload: Workload) -> Callable[[], Any]:
+        debiaser = _fitted(factory(), workload)
+        return lambda: debiaser.debiased_ate(workload["treated"], workload["control"])
+
+    return setup
+
+
+def _compare_setup(workload: Workload) -> Callable[[], Any]:
+    return lambda: compare_debiasers(workload["cal_predictions"], workload["cal_targets"], n_contrast_draws=40)
+
+
+CASES = [
+    BenchmarkCase("lcc_fit", _fit_case(LccDebiaser), max_n=10**7),
+    BenchmarkCase("tweedie_fit", _fit_case(TweedieDebiaser), max_n=10**7),
+    BenchmarkCase("tweedie_binned_fit", _fit_case(lambda: TweedieDebiaser(engine="binned")), max_n=10**7),
+    BenchmarkCase("lcc_debiased_predictions", _predict_case(LccDebiaser), max_n=10**7),
+    BenchmarkCase("tweedie_exact_debiased_predictions", _predict_case(TweedieDebiaser), max_n=10**5),
+    BenchmarkCase(
+        "tweedie_truncated_debiased_predictions",
+        _predict_case(lambda: TweedieDebiaser(engine="truncated")),
+        max_n=10**5,
+    ),
+    BenchmarkCase(
+        "tweedie_binned_debiased_predictions",
+        _predict_case(lambda: TweedieDebiaser(engine="binned")),
+        max_n=10**7,
+    ),
+    BenchmarkCase("lcc_debiased_ate", _ate_case(LccDebiaser), max_n=10**7),
+    BenchmarkCase("tweedie_binned_debiased_ate", _ate_case(lambda: TweedieDebiaser(engine="binned")), max_n=10**7),
+    BenchmarkCase("compare_debiasers", _compare_setup, max_n=10**5),
+]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """
+    Best wall time over ``repeat`` untraced runs, and the memory peak of one
+    further run under ``tracemalloc`` (tracing slows allocations unevenly, so
+    it never overlaps the timed runs).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes: List[int], repeat: int, selected: Optional[List[str]] = None) -> Dict[str, Any]:
+    # Import the lazily loaded dependencies up front so the first case timed does not pay for them.
+    import scipy.stats  # noqa: F401
+    import sklearn.model_selection  # noqa: F401
+
+    results = []
+    for n in sizes:
+        workload = make_workload(n)
+        for case in CASES:
+            if n > case.max_n or (selected and case.name not in selected):
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", unshrink.DebiasingWarning)
+                seconds, peak_bytes = measure(case.setup(workload), repeat)
+            results.append({"case": case.name, "n": n, "seconds": seconds, "peak_bytes": peak_bytes})
+            print(f"{case.name:<40} n={n:<10} {seconds:10.4f} s {peak_bytes / 2**20:10.1f} MiB", flush=True)
+    try:
+        unshrink_version = version("unshrink")
+    except PackageNotFoundError:
+        unshrink_version = None
+    return {
+        "unshrink": unshrink_version,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print the time and memory ratio of every case also present in ``baseline``."""
+    previous = {(row["case"], row["n"]): row for row in baseline["results"]}
+    for row in report["results"]:
+        old = previous.get((row["case"], row["n"]))
+        if old is None:
+            continue
+        time_ratio = row["seconds"] / old["seconds"]
+        memory_ratio = row["peak_bytes"] / max(old["peak_bytes"], 1)
+        print(f"{row['case']:<40} n={row['n']:<10} time x{time_ratio:6.2f} memory x{memory_ratio:6.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e3, 1e4, 1e5])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="+", choices=[case.name for case in CASES])
+    parser.add_argument("--output", type=Path, default=ROOT / "benchmarks" / "results.json")
+    parser.add_argument("--baseline", type=Path)
+    arguments = parser.parse_args(argv)
+
+    report = run([int(size) for size in arguments.sizes], arguments.repeat, arguments.cases)
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+    if arguments.baseline is not None:
+        compare(report, json.loads(arguments.baseline.read_text()))
+
+
+if __name__ == "__main__":
+    main()
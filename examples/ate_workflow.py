@@ -5,9 +5,8 @@ import numpy as np
 from unshrink import LCCDebiaser, TweedieDebiaser, compare_debiasers
 
 
-def _simulate_workflow(seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+def _simulate_workflow(seed: int = 0, n: int = 2500) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     rng = np.random.default_rng(seed)
-    n = 2500
     x1 = rng.normal(0.0, 1.0, n)
     x2 = rng.normal(0.0, 1.0, n)
     treatment = rng.binomial(1, 1.0 / (1.0 + np.exp(-0.5 * x1 + 0.3 * x2)))
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_benchmark_suite_writes_json(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [
+            sys.executable,
+            str(root / "benchmarks" / "run_benchmarks.py"),
+            "--sizes",
+            "500",
+            "--repeat",
+            "1",
+            "--cases",
+            "lcc_fit",
+            "tweedie_binned_debiased_ate",
+            "--output",
+            str(output),
+        ],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    report = json.loads(output.read_text())
+    assert [(row["case"], row["n"]) for row in report["results"]] == [
+        ("lcc_fit", 500),
+        ("tweedie_binned_debiased_ate", 500),
+    ]
+    assert all(row["seconds"] > 0 and row["peak_bytes"] >= 0 for row in report["results"])
@@ -2,6 +2,21 @@ import numpy as np
 import pytest
 
 from unshrink import TweedieDebiaser, LccDebiaser
+from unshrink.base import BaseDebiaser
+from unshrink.reports import DebiasingWarning
+
+
+class MeanShiftDebiaser(BaseDebiaser):
+    """A third-party style debiaser that implements only fit and debiased_predictions."""
+
+    def fit(self, cal_predictions, cal_targets):
+        cal_predictions, cal_targets = self._validate_calibration_inputs(cal_predictions, cal_targets)
+        self.shift_ = float(np.mean(cal_targets - cal_predictions))
+        self._set_diagnostics(cal_predictions=cal_predictions, residual_std=None, warning_flags=[], details={})
+        return self
+
+    def debiased_predictions(self, predictions):
+        return self._validate_prediction_inputs(predictions) + self.shift_
 
 
 @pytest.mark.parametrize("Debiaser", [TweedieDebiaser, LccDebiaser])
@@ -124,3 +139,100 @@ def test_debiased_ate_non_finite_weights_raise(Debiaser, no_noise_data):
 
     with pytest.raises(ValueError):
         deb.debiased_ate(treated, control, iptw_treated=bad_weights)
+
+
+@pytest.mark.parametrize("Debiaser", [TweedieDebiaser, LccDebiaser])
+def test_streamed_mean_and_ate_match_in_memory(Debiaser, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = Debiaser().fit(cal_preds, cal_targets)
+    treated, control = preds[:500], preds[500:]
+    weights = np.linspace(0.2, 2.0, treated.size)
+
+    streamed_mean = deb.debiased_mean(iter(np.array_split(preds, 7)))
+    streamed_ate = deb.debiased_ate(
+        iter(np.array_split(treated, 3)),
+        control,
+        iptw_treated=iter(np.array_split(weights, 3)),
+    )
+
+    assert np.isclose(streamed_mean, deb.debiased_mean(preds))
+    assert np.isclose(streamed_ate, deb.debiased_ate(treated, control, iptw_treated=weights))
+
+
+def test_memmap_predictions_are_read_in_blocks(tmp_path, linear_shrinkage_data, monkeypatch):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    path = tmp_path / "preds.npy"
+    np.save(path, preds.astype(np.float32))
+    tiles = np.load(path, mmap_mode="r")
+    weights = np.linspace(0.5, 1.5, preds.size)
+    deb = LccDebiaser().fit(cal_preds, cal_targets)
+    monkeypatch.setattr(LccDebiaser, "_STREAM_BLOCK_ROWS", 128)
+
+    ate = deb.debiased_ate(tiles, tiles[:300], iptw_treated=weights)
+
+    expected = deb.debiased_ate(preds.astype(np.float32), preds[:300].astype(np.float32), iptw_treated=weights)
+    assert np.isclose(ate, expected)
+
+
+def test_stream_warns_once_and_checks_weight_lengths(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    deb = LccDebiaser().fit(cal_preds, cal_targets)
+    chunks = [preds[:10] + 100.0, preds[10:20] - 100.0, preds[20:30] + 100.0]
+
+    with pytest.warns(DebiasingWarning) as record:
+        deb.debiased_mean(iter(chunks))
+    assert len(record) == 1
+
+    with pytest.raises(ValueError, match="same shape"):
+        deb.debiased_ate(iter([preds[:10], preds[10:20]]), preds, iptw_treated=iter([np.ones(10)]))
+    with pytest.raises(ValueError, match="must not be empty"):
+        deb.debiased_mean(iter([]))
+
+
+@pytest.mark.parametrize("Debiaser", [TweedieDebiaser, LccDebiaser, MeanShiftDebiaser])
+def test_lists_of_chunks_are_streamed(Debiaser, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = Debiaser().fit(cal_preds, cal_targets)
+    treated, control = preds[:600], preds[600:]
+    weights = np.linspace(0.2, 2.0, treated.size)
+
+    equal_chunks = list(treated.reshape(3, -1))
+    ragged_chunks = tuple(np.array_split(control, [7, 100]))
+    streamed_ate = deb.debiased_ate(
+        equal_chunks,
+        ragged_chunks,
+        iptw_treated=list(weights.reshape(3, -1)),
+    )
+
+    assert np.isclose(deb.debiased_mean(equal_chunks), deb.debiased_mean(treated))
+    assert np.isclose(streamed_ate, deb.debiased_ate(treated, control, iptw_treated=weights))
+    assert np.isclose(deb.debiased_mean(list(preds[:5])), deb.debiased_mean(preds[:5]))
+
+
+@pytest.mark.parametrize("Debiaser", [TweedieDebiaser, LccDebiaser])
+def test_streamed_arm_with_plain_list_arm(Debiaser, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = Debiaser().fit(cal_preds, cal_targets)
+    treated, control = preds[:600], preds[600:]
+    weights = np.linspace(0.2, 2.0, control.size)
+
+    streamed = deb.debiased_ate(iter(np.array_split(treated, 4)), control.tolist(), iptw_control=weights.tolist())
+
+    assert np.isclose(streamed, deb.debiased_ate(treated, control, iptw_control=weights))
+
+
+def test_empty_chunks_inside_a_stream_are_skipped(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = TweedieDebiaser().fit(cal_preds, cal_targets)
+    weights = np.linspace(0.2, 2.0, 300)
+
+    streamed = deb.debiased_ate(
+        iter([preds[:100], np.array([]), preds[100:300]]),
+        preds[300:],
+        iptw_treated=iter([weights[:100], np.array([]), weights[100:]]),
+    )
+
+    assert np.isclose(deb.debiased_mean(iter([preds[:100], np.array([]), preds[100:]])), deb.debiased_mean(preds))
+    assert np.isclose(streamed, deb.debiased_ate(preds[:300], preds[300:], iptw_treated=weights))
+    with pytest.raises(ValueError, match="must not be empty"):
+        deb.debiased_mean(iter([np.array([]), np.array([])]))
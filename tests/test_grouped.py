@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from unshrink import GroupedDebiaser, LccDebiaser, TweedieDebiaser
+from unshrink.moments import PairedMoments
+from unshrink.reports import DebiasingWarning
+
+
+@pytest.fixture
+def grouped_data():
+    rng = np.random.default_rng(13)
+    n_groups = 40
+    slopes = rng.uniform(0.4, 0.9, n_groups)
+    intercepts = rng.normal(0.0, 0.3, n_groups)
+
+    def sample(n):
+        groups = rng.integers(0, n_groups, n)
+        targets = rng.normal(0.0, 1.0, n)
+        predictions = intercepts[groups] + slopes[groups] * targets + rng.normal(0.0, 0.1, n)
+        return predictions, targets, groups
+
+    return sample(20_000), sample(5_000)
+
+
+def test_group_moments_match_per_group_moments():
+    rng = np.random.default_rng(0)
+    predictions = rng.normal(size=500)
+    targets = predictions + rng.normal(size=500)
+    codes = rng.integers(0, 7, 500)
+
+    grouped = PairedMoments.from_groups(predictions, targets, codes, 7)
+    for code in range(7):
+        single = PairedMoments.from_arrays(predictions[codes == code], targets[codes == code])
+        for field in ("count", "target_mean", "prediction_m2", "comoment", "prediction_min", "prediction_max"):
+            assert np.isclose(getattr(grouped, field)[code], getattr(single, field))
+
+
+def test_grouped_lcc_matches_per_group_fits(grouped_data):
+    (cal_preds, cal_targets, cal_groups), (preds, _, groups) = grouped_data
+    grouped = GroupedDebiaser().fit(cal_preds, cal_targets, cal_groups)
+    corrected = grouped.debiased_predictions(preds, groups)
+
+    assert grouped.diagnostics_.details["n_groups"] == 40
+    assert grouped.diagnostics_.details["pooled_groups"] == 0
+    for label in (0, 17, 39):
+        single = LccDebiaser().fit(cal_preds[cal_groups == label], cal_targets[cal_groups == label])
+        assert np.isclose(grouped.slope_[label], single.slope_)
+        assert np.allclose(corrected[groups == label], single.debiased_predictions(preds[groups == label]))
+
+
+def test_grouped_generic_debiaser_matches_per_group_fits(grouped_data):
+    (cal_preds, cal_targets, cal_groups), (preds, _, groups) = grouped_data
+    keep = cal_groups < 3
+    grouped = GroupedDebiaser(TweedieDebiaser(engine="truncated")).fit(
+        cal_preds[keep],
+        cal_targets[keep],
+        cal_groups[keep],
+    )
+    mask = groups < 3
+
+    corrected = grouped.debiased_predictions(preds[mask], groups[mask])
+
+    single = TweedieDebiaser(engine="truncated").fit(cal_preds[cal_groups == 1], cal_targets[cal_groups == 1])
+    assert grouped.diagnostics_.details["base_method"] == "tweedie"
+    assert np.allclose(corrected[groups[mask] == 1], single.debiased_predictions(preds[groups == 1]))
+
+
+def test_small_and_unseen_groups_use_pooled_fit(grouped_data):
+    (cal_preds, cal_targets, cal_groups), _ = grouped_data
+    labels = np.where(np.arange(cal_preds.size) < 10, "tiny", "large")
+    grouped = GroupedDebiaser(min_group_size=30).fit(cal_preds, cal_targets, labels)
+    pooled = LccDebiaser().fit(cal_preds, cal_targets)
+
+    assert list(grouped.groups_) == ["large", "tiny"]
+    assert list(grouped.pooled_groups_) == [False, True]
+    assert "pooled_fallback" in grouped.diagnostics_.warning_flags
+    with pytest.warns(DebiasingWarning, match="not seen during calibration"):
+        corrected = grouped.debiased_predictions(np.array([0.1, 0.2]), np.array(["tiny", "new"]))
+    assert np.allclose(corrected, pooled.debiased_predictions(np.array([0.1, 0.2])))
+
+
+def test_grouped_mean_and_ate(grouped_data):
+    (cal_preds, cal_targets, cal_groups), (preds, targets, groups) = grouped_data
+    grouped = GroupedDebiaser().fit(cal_preds, cal_targets, cal_groups)
+
+    selected = targets > 0.5
+    naive_error = abs(preds[selected].mean() - targets[selected].mean())
+    assert abs(grouped.debiased_mean(preds[selected], groups[selected]) - targets[selected].mean()) < naive_error
+    ate = grouped.debiased_ate(preds[:2000], preds[2000:], treated_groups=groups[:2000], control_groups=groups[2000:])
+    corrected = grouped.debiased_predictions(preds, groups)
+    assert np.isclose(ate, corrected[:2000].mean() - corrected[2000:].mean())
+
+
+def test_grouped_rejects_misaligned_groups(grouped_data):
+    (cal_preds, cal_targets, cal_groups), _ = grouped_data
+    with pytest.raises(ValueError, match="groups must have the same shape"):
+        GroupedDebiaser().fit(cal_preds, cal_targets, cal_groups[:-1])
+    with pytest.raises(ValueError, match="min_group_size must be positive"):
+        GroupedDebiaser(min_group_size=0).fit(cal_preds, cal_targets, cal_groups)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+_PROBE = """
+import json, sys
+import unshrink
+from unshrink import LCCDebiaser, TweedieDebiaser, compare_debiasers
+heavy = sorted({name.split(".")[0] for name in sys.modules} & {"scipy", "sklearn"})
+print(json.dumps(heavy))
+"""
+
+
+def test_import_does_not_load_scipy_or_sklearn():
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert json.loads(result.stdout) == []
+
+
+def test_unknown_attribute_raises():
+    import unshrink
+
+    with pytest.raises(AttributeError, match="NotADebiaser"):
+        unshrink.NotADebiaser
@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from unshrink import DebiasedEstimate, LccDebiaser, TweedieDebiaser, debiased_ate_ci
+from unshrink.base import BaseDebiaser
+from unshrink.inference import _BootstrapData, _lcc_bootstrap, _tweedie_bootstrap
+
+
+class _NoResampling:
+    def multinomial(self, n, pvals, size):
+        return np.ones((size, n), dtype=int)
+
+
+class _IdentityDebiaser(BaseDebiaser):
+    def fit(self, cal_predictions, cal_targets):
+        self._set_diagnostics(
+            cal_predictions=np.asarray(cal_predictions),
+            residual_std=None,
+            warning_flags=[],
+            details={},
+        )
+        return self
+
+    def debiased_predictions(self, predictions):
+        return self._validate_prediction_inputs(predictions)
+
+
+def test_unresampled_replicates_match_point_estimates(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    treated, control = preds[:600], preds[600:]
+    weights = np.linspace(0.5, 2.0, treated.size)
+    data = _BootstrapData(cal_preds, cal_targets, treated, control, weights, np.ones_like(control))
+
+    lcc = LccDebiaser().fit(cal_preds, cal_targets)
+    tweedie = TweedieDebiaser().fit(cal_preds, cal_targets)
+    lcc_replicates = _lcc_bootstrap(data, _NoResampling(), 2)
+    tweedie_replicates = _tweedie_bootstrap(
+        data,
+        _NoResampling(),
+        2,
+        bandwidth_factor=cal_preds.size**-0.2,
+        grid_size=4096,
+        cutoff=8.0,
+    )
+
+    assert np.allclose(lcc_replicates, lcc.debiased_ate(treated, control, iptw_treated=weights))
+    assert np.allclose(tweedie_replicates, tweedie.debiased_ate(treated, control, iptw_treated=weights), atol=1e-5)
+
+
+class _EvenRowsTwice:
+    def multinomial(self, n, pvals, size):
+        return np.tile(np.arange(n) % 2 == 0, (size, 1)) * 2
+
+
+@pytest.mark.parametrize("bw_method", ["scott", "silverman", 0.3])
+def test_tweedie_replicates_match_refits_on_the_resample(bw_method, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    treated, control = preds[:600], preds[600:]
+    data = _BootstrapData(cal_preds, cal_targets, treated, control, np.ones_like(treated), np.ones_like(control))
+    tweedie = TweedieDebiaser(engine="exact", bw_method=bw_method)
+    factor = tweedie._bandwidth_factor(cal_preds.size)
+
+    replicates = _tweedie_bootstrap(data, _EvenRowsTwice(), 2, bandwidth_factor=factor, grid_size=4096, cutoff=8.0)
+
+    refit = tweedie.fit(np.repeat(cal_preds[::2], 2), np.repeat(cal_targets[::2], 2))
+    expected = refit.debiased_ate(np.repeat(treated[::2], 2), np.repeat(control[::2], 2))
+    assert np.allclose(replicates, expected, rtol=0.0, atol=1e-6)
+
+
+def test_tweedie_replicates_are_centred_on_the_exact_estimate(nonlinear_shrinkage_data):
+    from unshrink.inference import _bootstrap_batch
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    treated, control = preds[:600], preds[600:]
+    data = _BootstrapData(cal_preds, cal_targets, treated, control, np.ones_like(treated), np.ones_like(control))
+    tweedie = TweedieDebiaser(engine="exact").fit(cal_preds, cal_targets)
+    estimate = tweedie.debiased_ate(treated, control)
+
+    replicates = _bootstrap_batch(tweedie, data, np.random.SeedSequence(2), 400)
+
+    monte_carlo_error = np.std(replicates, ddof=1) / np.sqrt(replicates.size)
+    assert abs(np.mean(replicates) - estimate) < 4.0 * monte_carlo_error
+
+
+def test_lscv_and_finite_difference_bootstraps_refit(nonlinear_shrinkage_data, monkeypatch):
+    from unshrink import inference
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    refits = []
+
+    def fake_refit_bootstrap(template, data, rng, size):
+        refits.append(template)
+        return np.zeros(size)
+
+    monkeypatch.setattr(inference, "_refit_bootstrap", fake_refit_bootstrap)
+    for params in ({"bw_method": "lscv"}, {"engine": "finite_difference"}, {"bw_method": [0.2, 0.4]}):
+        debiased_ate_ci(TweedieDebiaser(**params), cal_preds, cal_targets, preds[:50], preds[50:100], n_bootstrap=2)
+    debiased_ate_ci(TweedieDebiaser(bw_method=0.3), cal_preds, cal_targets, preds[:50], preds[50:100], n_bootstrap=2)
+
+    assert len(refits) == 3
+
+
+def test_custom_debiaser_needs_only_fit_and_debiased_predictions(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    treated, control = preds[:500] + 0.3, preds[500:]
+    expected = treated.mean() - control.mean()
+    debiaser = _IdentityDebiaser().fit(cal_preds, cal_targets)
+
+    assert np.isclose(debiaser.debiased_mean(preds), preds.mean())
+    assert np.isclose(debiaser.debiased_ate(treated, control), expected)
+    result = debiased_ate_ci(_IdentityDebiaser(), cal_preds, cal_targets, treated, control, n_bootstrap=50)
+    assert np.isclose(result.estimate, expected)
+    assert result.ci_lower < expected < result.ci_upper
+
+
+@pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser, _IdentityDebiaser])
+def test_bootstrap_interval_matches_refit_loop(Debiaser, linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    treated, control = preds[:500] + 0.3, preds[500:]
+
+    result = debiased_ate_ci(Debiaser(), cal_preds, cal_targets, treated, control, n_bootstrap=400, random_state=3)
+
+    rng = np.random.default_rng(5)
+    replicates = []
+    for _ in range(400):
+        calibration = rng.integers(0, cal_preds.size, cal_preds.size)
+        treated_index = rng.integers(0, treated.size, treated.size)
+        control_index = rng.integers(0, control.size, control.size)
+        debiaser = Debiaser().fit(cal_preds[calibration], cal_targets[calibration])
+        replicates.append(debiaser.debiased_ate(treated[treated_index], control[control_index]))
+
+    assert isinstance(result, DebiasedEstimate)
+    assert result.ci_lower < result.estimate < result.ci_upper
+    assert result.standard_error == pytest.approx(np.std(replicates, ddof=1), rel=0.2)
+
+
+def test_bootstrap_is_reproducible_across_executors(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    arguments = (LccDebiaser(), cal_preds, cal_targets, preds[:500], preds[500:])
+
+    serial = debiased_ate_ci(*arguments, n_bootstrap=300, batch_size=64)
+    threaded = debiased_ate_ci(*arguments, n_bootstrap=300, batch_size=64, n_jobs=2)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processes = debiased_ate_ci(*arguments, n_bootstrap=300, batch_size=64, executor=executor)
+
+    assert serial == threaded == processes
+
+
+@pytest.mark.parametrize("engine", ["exact", "truncated", "finite_difference", "binned", "mixture"])
+def test_tweedie_bootstrap_runs_in_worker_processes(engine, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    arguments = (TweedieDebiaser(engine=engine), cal_preds, cal_targets, preds[:200], preds[200:400])
+
+    serial = debiased_ate_ci(*arguments, n_bootstrap=20, batch_size=10)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processes = debiased_ate_ci(*arguments, n_bootstrap=20, batch_size=10, executor=executor)
+
+    assert serial == processes
+
+
+def test_interval_methods_and_validation(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    arguments = (LccDebiaser(), cal_preds, cal_targets, preds[:500], preds[500:])
+    percentile = debiased_ate_ci(*arguments, n_bootstrap=200)
+    basic = debiased_ate_ci(*arguments, n_bootstrap=200, method="basic")
+    normal = debiased_ate_ci(*arguments, n_bootstrap=200, method="normal", confidence_level=0.9)
+
+    assert basic.ci_lower == pytest.approx(2 * percentile.estimate - percentile.ci_upper)
+    assert normal.ci_upper - normal.estimate == pytest.approx(1.6448536 * normal.standard_error)
+    with pytest.raises(ValueError, match="method must be one of"):
+        debiased_ate_ci(*arguments, method="bca")
+    with pytest.raises(ValueError, match="n_bootstrap"):
+        debiased_ate_ci(*arguments, n_bootstrap=1)
+    with pytest.raises(ValueError, match="n_jobs must be positive"):
+        debiased_ate_ci(*arguments, n_jobs=0)
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from unshrink import LCCDebiaser, LccDebiaser
+from unshrink import LCCDebiaser, LccDebiaser, debiased_ate_ci
 from unshrink.reports import DebiasingWarning
 
 
@@ -110,3 +110,127 @@ def test_warns_when_predicting_outside_support(linear_shrinkage_data):
     outside = np.array([cal_preds.min() - 1.0, cal_preds.max() + 1.0])
     with pytest.warns(DebiasingWarning, match="calibration support"):
         lcc.debiased_predictions(outside)
+
+
+def test_partial_fit_matches_fit(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    full = LccDebiaser().fit(cal_preds, cal_targets)
+    streamed = LccDebiaser()
+    for batch in np.array_split(np.arange(cal_preds.size), 7):
+        streamed.partial_fit(cal_preds[batch], cal_targets[batch])
+
+    assert np.isclose(streamed.slope_, full.slope_, rtol=1e-10)
+    assert np.isclose(streamed.intercept_, full.intercept_, rtol=1e-10)
+    assert np.isclose(streamed.residual_std_, full.residual_std_, rtol=1e-10)
+    assert np.isclose(streamed.r_squared_, full.r_squared_, rtol=1e-10)
+    assert streamed.diagnostics_.n_calibration == cal_preds.size
+    assert streamed.diagnostics_.prediction_min == cal_preds.min()
+    assert streamed.diagnostics_.prediction_max == cal_preds.max()
+    assert np.allclose(streamed.debiased_predictions(preds), full.debiased_predictions(preds))
+
+
+def test_partial_fit_continues_from_fit(linear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    full = LccDebiaser().fit(cal_preds, cal_targets)
+    resumed = LccDebiaser().fit(cal_preds[:500], cal_targets[:500]).partial_fit(cal_preds[500:], cal_targets[500:])
+    assert np.isclose(resumed.slope_, full.slope_, rtol=1e-10)
+    assert np.isclose(resumed.intercept_, full.intercept_, rtol=1e-10)
+
+
+def test_partial_fit_rejects_unidentifiable_batch():
+    lcc = LccDebiaser()
+    with pytest.raises(ValueError, match="cal_targets must vary"):
+        lcc.partial_fit(np.array([0.5]), np.array([1.0]))
+    assert not hasattr(lcc, "moments_")
+    lcc.partial_fit(np.array([0.1, 0.9]), np.array([0.0, 2.0]))
+    assert lcc.diagnostics_.n_calibration == 2
+
+
+def test_failed_partial_fit_keeps_previous_state():
+    lcc = LccDebiaser().fit(np.array([0.1, 0.9]), np.array([0.0, 2.0]))
+    with pytest.raises(ValueError, match="slope must be positive"):
+        lcc.partial_fit(np.array([0.1, 0.9]), np.array([10.0, -10.0]))
+    assert lcc.moments_.count == 2
+    assert lcc.diagnostics_.n_calibration == 2
+    assert np.isclose(lcc.slope_, 0.4)
+
+
+def test_merge_matches_fit_on_concatenated_shards(linear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    full = LccDebiaser().fit(cal_preds, cal_targets)
+    shards = [
+        LccDebiaser().fit(cal_preds[batch], cal_targets[batch])
+        for batch in np.array_split(np.arange(cal_preds.size), 4)
+    ]
+    combined = LccDebiaser.combine(shards)
+
+    assert np.isclose(combined.slope_, full.slope_, rtol=1e-10)
+    assert np.isclose(combined.intercept_, full.intercept_, rtol=1e-10)
+    assert combined.diagnostics_.n_calibration == full.diagnostics_.n_calibration
+    assert combined.diagnostics_.prediction_min == full.diagnostics_.prediction_min
+    assert combined.diagnostics_.prediction_max == full.diagnostics_.prediction_max
+
+
+def test_multi_column_fit_matches_column_fits(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    cal_matrix = np.column_stack([cal_preds, 0.5 * cal_preds + 1.0, cal_preds**3])
+    pred_matrix = np.column_stack([preds, 0.5 * preds + 1.0, preds**3])
+    batched = LccDebiaser().fit(cal_matrix, cal_targets)
+
+    assert batched.n_columns_ == 3
+    assert len(batched.diagnostics_) == 3
+    for index in range(3):
+        single = LccDebiaser().fit(cal_matrix[:, index], cal_targets)
+        assert np.isclose(batched.slope_[index], single.slope_)
+        assert batched.diagnostics_[index].details["slope"] == pytest.approx(single.slope_)
+        expected = single.debiased_predictions(pred_matrix[:, index])
+        assert np.allclose(batched.debiased_predictions(pred_matrix)[:, index], expected)
+
+    means = batched.debiased_mean(pred_matrix)
+    weights = np.linspace(0.5, 1.5, 100)
+    ate = batched.debiased_ate(pred_matrix[:100], pred_matrix[100:200], iptw_treated=weights)
+    single_ate = LccDebiaser().fit(cal_matrix[:, 1], cal_targets).debiased_ate(
+        pred_matrix[:100, 1],
+        pred_matrix[100:200, 1],
+        iptw_treated=weights,
+    )
+    assert means.shape == (3,)
+    assert ate.shape == (3,)
+    assert np.isclose(ate[1], single_ate)
+
+
+def test_delta_method_se_matches_bootstrap(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    treated, control = preds[:400] + 0.4, preds[400:]
+    weights = np.linspace(0.5, 2.0, treated.size)
+    lcc = LccDebiaser().fit(cal_preds, cal_targets)
+
+    ate = lcc.debiased_ate_se(treated, control, iptw_treated=weights)
+    bootstrap = debiased_ate_ci(LccDebiaser(), cal_preds, cal_targets, treated, control, weights, n_bootstrap=2000)
+
+    assert ate.interval_method == "delta"
+    assert ate.estimate == pytest.approx(lcc.debiased_ate(treated, control, iptw_treated=weights))
+    assert ate.standard_error == pytest.approx(bootstrap.standard_error, rel=0.1)
+    assert ate.ci_lower < ate.estimate < ate.ci_upper
+
+
+def test_delta_method_mean_se_covers_calibration_and_trial_noise():
+    rng = np.random.default_rng(11)
+    estimates, standard_errors = [], []
+    for _ in range(300):
+        cal_targets = rng.normal(0.0, 1.0, 200)
+        cal_preds = 0.3 + 0.6 * cal_targets + rng.normal(0.0, 0.2, 200)
+        targets = rng.normal(1.0, 1.0, 300)
+        preds = 0.3 + 0.6 * targets + rng.normal(0.0, 0.2, 300)
+        result = LccDebiaser().fit(cal_preds, cal_targets).debiased_mean_se(preds)
+        estimates.append(result.estimate)
+        standard_errors.append(result.standard_error)
+
+    assert np.mean(standard_errors) == pytest.approx(np.std(estimates), rel=0.15)
+
+
+def test_delta_method_se_requires_1d_fit(linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    lcc = LccDebiaser().fit(np.column_stack([cal_preds, cal_preds]), cal_targets)
+    with pytest.raises(ValueError, match="1D fits only"):
+        lcc.debiased_mean_se(np.column_stack([preds, preds]))
@@ -0,0 +1,122 @@
+import json
+
+import numpy as np
+import pytest
+
+from unshrink import GroupedDebiaser, LccDebiaser, TweedieDebiaser
+from unshrink.persistence import FORMAT_VERSION
+
+
+@pytest.mark.parametrize("engine", ["exact", "truncated", "finite_difference", "binned", "mixture"])
+def test_tweedie_roundtrip_is_memory_mapped(tmp_path, nonlinear_shrinkage_data, engine):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(engine=engine).fit(cal_preds, cal_targets)
+    tweedie.save(tmp_path / "tweedie")
+
+    loaded = TweedieDebiaser.load(tmp_path / "tweedie")
+
+    assert isinstance(loaded.sorted_cal_predictions_, np.memmap)
+    assert (loaded.kde_ is not None) == (engine == "finite_difference")
+    assert loaded.get_params() == tweedie.get_params()
+    assert loaded.diagnostics_ == tweedie.diagnostics_
+    assert np.allclose(loaded.debiased_predictions(preds), tweedie.debiased_predictions(preds))
+
+
+@pytest.mark.parametrize("engine", ["exact", "truncated", "finite_difference", "binned", "mixture"])
+@pytest.mark.parametrize("bw_method", ["scott", "silverman", 0.3, np.float64(0.3), np.array(0.3), [0.2, 0.4]])
+def test_fitted_tweedie_pickles(nonlinear_shrinkage_data, engine, bw_method):
+    import pickle
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(engine=engine, bw_method=bw_method).fit(cal_preds, cal_targets)
+
+    loaded = pickle.loads(pickle.dumps(tweedie))
+
+    assert (loaded.kde_ is not None) == (engine == "finite_difference")
+    assert loaded.get_params() == tweedie.get_params()
+    assert np.array_equal(loaded.debiased_predictions(preds), tweedie.debiased_predictions(preds))
+
+
+def test_loading_tweedie_does_not_import_scipy(tmp_path, nonlinear_shrinkage_data):
+    import subprocess
+    import sys
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    TweedieDebiaser(engine="truncated").fit(cal_preds, cal_targets).save(tmp_path / "tweedie")
+    probe = (
+        "import sys; from unshrink import TweedieDebiaser; "
+        f"TweedieDebiaser.load({str(tmp_path / 'tweedie')!r}).debiased_predictions([{float(preds[0])!r}]); "
+        "print('scipy' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_lcc_and_multi_column_roundtrip(tmp_path, linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    cal_matrix = np.column_stack([cal_preds, 2.0 * cal_preds])
+    pred_matrix = np.column_stack([preds, 2.0 * preds])
+    for name, debiaser in {
+        "lcc": LccDebiaser().fit(cal_preds, cal_targets),
+        "lcc_columns": LccDebiaser().fit(cal_matrix, cal_targets),
+        "tweedie_columns": TweedieDebiaser().fit(cal_matrix, cal_targets),
+    }.items():
+        debiaser.save(tmp_path / name)
+        loaded = type(debiaser).load(tmp_path / name, mmap=False)
+        inputs = preds if name == "lcc" else pred_matrix
+        assert loaded.diagnostics_ == debiaser.diagnostics_
+        assert np.allclose(loaded.debiased_predictions(inputs), debiaser.debiased_predictions(inputs))
+
+
+def test_grouped_roundtrip(tmp_path, linear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    cal_groups = np.where(cal_preds > 0.3, "high", "low")
+    groups = np.where(preds > 0.3, "high", "low")
+    for name, template in {"lcc": None, "tweedie": TweedieDebiaser(engine="truncated")}.items():
+        grouped = GroupedDebiaser(template).fit(cal_preds, cal_targets, cal_groups)
+        grouped.save(tmp_path / name)
+        loaded = GroupedDebiaser.load(tmp_path / name)
+        assert type(loaded.debiaser) is type(grouped.debiaser)
+        assert np.allclose(loaded.debiased_predictions(preds, groups), grouped.debiased_predictions(preds, groups))
+
+
+def test_load_rejects_newer_format_and_wrong_class(tmp_path, linear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    LccDebiaser().fit(cal_preds, cal_targets).save(tmp_path / "lcc")
+
+    with pytest.raises(TypeError, match="not a TweedieDebiaser"):
+        TweedieDebiaser.load(tmp_path / "lcc")
+
+    metadata_path = tmp_path / "lcc" / "debiaser.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["format_version"] = FORMAT_VERSION + 1
+    metadata_path.write_text(json.dumps(metadata))
+    with pytest.raises(ValueError, match="format version"):
+        LccDebiaser.load(tmp_path / "lcc")
+
+
+def test_save_before_fit(tmp_path):
+    with pytest.raises(RuntimeError):
+        LccDebiaser().save(tmp_path / "lcc")
+
+
+def test_tweedie_fitted_from_chunks_roundtrip(tmp_path, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    chunks = [(cal_preds[:600], cal_targets[:600]), (cal_preds[600:], cal_targets[600:])]
+    tweedie = TweedieDebiaser(engine="binned").fit(chunks)
+    tweedie.save(tmp_path / "streamed")
+
+    loaded = TweedieDebiaser.load(tmp_path / "streamed")
+
+    assert loaded.sorted_cal_predictions_ is None
+    assert loaded.diagnostics_ == tweedie.diagnostics_
+    assert np.allclose(loaded.debiased_predictions(preds), tweedie.debiased_predictions(preds))
+
+
+def test_lscv_curve_survives_roundtrip(tmp_path, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(bw_method=(0.1, 0.2, 0.4)).fit(cal_preds, cal_targets)
+    tweedie.save(tmp_path / "lscv")
+    loaded = TweedieDebiaser.load(tmp_path / "lscv")
+    assert loaded.diagnostics_ == tweedie.diagnostics_
+    assert loaded.bandwidth_ == tweedie.bandwidth_
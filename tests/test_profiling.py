@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from unshrink import LccDebiaser, TweedieDebiaser, compare_debiasers, config_context, set_profiler
+
+
+@pytest.fixture
+def calibration_data():
+    rng = np.random.default_rng(11)
+    targets = rng.normal(size=400)
+    predictions = 0.6 * targets + rng.normal(scale=0.2, size=400)
+    return predictions, targets
+
+
+@pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
+def test_profiling_is_off_by_default(Debiaser, calibration_data):
+    preds, targets = calibration_data
+    debiaser = Debiaser().fit(preds, targets)
+    debiaser.debiased_predictions(preds)
+    assert not hasattr(debiaser, "stage_timings_")
+    assert not any(key.startswith("stage_") for key in debiaser.diagnostics_.details)
+
+
+@pytest.mark.parametrize(
+    ("Debiaser", "stages"),
+    [
+        (LccDebiaser, ("validate", "moments")),
+        (TweedieDebiaser, ("validate", "sigma", "sort", "bandwidth")),
+    ],
+)
+def test_profile_config_records_fit_stage_details(Debiaser, stages, calibration_data):
+    preds, targets = calibration_data
+    with config_context(profile=True):
+        debiaser = Debiaser().fit(preds, targets)
+        diagnostics = debiaser.diagnostics_
+        debiaser.debiased_predictions(preds[:50])
+    details = debiaser.diagnostics_.details
+    for stage in stages:
+        assert details[f"stage_{stage}_seconds"] >= 0.0
+    assert details["stage_validate_elements"] == preds.size
+    assert debiaser.diagnostics_ is diagnostics
+    assert "stage_predict_validate_seconds" not in details
+    assert "stage_timings_" not in debiaser.get_params()
+
+
+@pytest.mark.parametrize(("Debiaser", "stage"), [(LccDebiaser, "debias"), (TweedieDebiaser, "score")])
+def test_prediction_stages_only_reach_the_profiler(Debiaser, stage, calibration_data):
+    preds, targets = calibration_data
+    debiaser = Debiaser().fit(preds, targets)
+    events = []
+    set_profiler(events.append)
+    try:
+        debiaser.debiased_predictions(preds[:50])
+    finally:
+        set_profiler(None)
+    assert [(event.stage, event.elements) for event in events] == [("predict_validate", 50), (stage, 50)]
+    assert not hasattr(debiaser, "stage_timings_")
+
+
+def test_set_profiler_receives_stage_events(calibration_data):
+    preds, targets = calibration_data
+    events = []
+    set_profiler(events.append)
+    try:
+        LccDebiaser().fit(preds, targets)
+    finally:
+        set_profiler(None)
+    assert [event.stage for event in events] == ["validate", "moments"]
+    assert all(event.elements == preds.size for event in events)
+    LccDebiaser().fit(preds, targets)
+    assert len(events) == 2
+
+
+def test_comparison_report_timings(calibration_data):
+    preds, targets = calibration_data
+    assert compare_debiasers(preds, targets, n_splits=2, n_contrast_draws=5).timings == {}
+    with config_context(profile=True):
+        report = compare_debiasers(preds, targets, n_splits=2, n_contrast_draws=5)
+    timings = report.timings
+    assert timings["stage_folds_elements"] == 2
+    assert timings["stage_lcc_fit_elements"] == preds.size
+    assert timings["stage_tweedie_predict_elements"] == preds.size
+    assert timings["stage_folds_seconds"] >= timings["stage_tweedie_fit_seconds"]
+    assert report.to_dict()["timings"] == timings
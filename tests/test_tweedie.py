@@ -122,3 +122,448 @@ def test_warns_when_predicting_outside_support(nonlinear_shrinkage_data):
     outside = np.array([cal_preds.min() - 1.0, cal_preds.max() + 1.0])
     with pytest.warns(DebiasingWarning, match="calibration support"):
         tweedie.debiased_predictions(outside)
+
+
+def test_exact_engine_is_default_and_matches_finite_difference(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    exact = TweedieDebiaser().fit(cal_preds, cal_targets)
+    finite_difference = TweedieDebiaser(engine="finite_difference").fit(cal_preds, cal_targets)
+
+    assert exact.engine == "exact"
+    assert exact.delta_ is None
+    assert np.allclose(exact._score(preds), finite_difference._score(preds), rtol=1e-4, atol=1e-4)
+
+
+def test_exact_engine_is_stable_far_from_support(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser().fit(cal_preds, cal_targets)
+    far = np.array([cal_preds.min() - 50.0, cal_preds.max() + 50.0])
+    expected = (np.array([cal_preds.min(), cal_preds.max()]) - far) / tweedie.bandwidth_**2
+    assert np.allclose(tweedie._score(far), expected, rtol=1e-6)
+
+
+def test_binned_engine_matches_exact(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    reference = TweedieDebiaser().fit(cal_preds, cal_targets)
+    binned = TweedieDebiaser(engine="binned").fit(cal_preds, cal_targets)
+
+    spacing_ratio = binned.diagnostics_.details["grid_spacing_ratio"]
+    tolerance = 0.5 * spacing_ratio**2 / binned.bandwidth_
+    assert np.max(np.abs(reference._score(preds) - binned._score(preds))) < tolerance
+    assert binned.diagnostics_.details["engine"] == "binned"
+
+
+def test_binned_engine_extrapolates_outside_grid(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(engine="binned").fit(cal_preds, cal_targets)
+    outside = np.array([tweedie.grid_[0] - 1.0, tweedie.grid_[-1] + 1.0])
+    with pytest.warns(DebiasingWarning, match="calibration support"):
+        corrected = tweedie.debiased_predictions(outside)
+    assert np.all(np.isfinite(corrected))
+    assert tweedie._score(outside)[0] > 0 > tweedie._score(outside)[1]
+
+
+def test_invalid_engine_raises(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    with pytest.raises(ValueError, match="engine must be one of"):
+        TweedieDebiaser(engine="unknown").fit(cal_preds, cal_targets)
+
+
+def test_single_component_mixture_has_gaussian_score():
+    rng = np.random.default_rng(3)
+    cal_preds = rng.normal(1.0, 2.0, 500)
+    tweedie = TweedieDebiaser(engine="mixture", n_components=1).fit(cal_preds, cal_preds + rng.normal(0.0, 0.5, 500))
+    points = np.linspace(-3.0, 5.0, 9)
+
+    assert np.allclose(tweedie._score(points), (cal_preds.mean() - points) / cal_preds.var(), rtol=1e-5)
+    details = tweedie.diagnostics_.details
+    assert details["n_components"] == 1
+    expected_log_likelihood = -0.5 * (np.log(2.0 * np.pi * cal_preds.var()) + 1.0)
+    assert np.isclose(details["mixture_log_likelihood"], expected_log_likelihood, rtol=1e-5)
+
+
+def test_mixture_engine_tracks_exact_kde(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    exact = TweedieDebiaser().fit(cal_preds, cal_targets)
+    mixture = TweedieDebiaser(engine="mixture", grid_size=256).fit(cal_preds, cal_targets)
+
+    details = mixture.diagnostics_.details
+    assert details["mixture_iterations"] >= 1
+    assert 0.0 < details["mixture_rms_score_deviation"] <= details["mixture_max_score_deviation"]
+    assert mixture.mixture_means_.shape == (8,) and np.isclose(mixture.mixture_weights_.sum(), 1.0)
+    bulk = np.abs(preds - np.median(cal_preds)) < np.std(cal_preds)
+    assert np.median(np.abs(mixture._score(preds[bulk]) - exact._score(preds[bulk]))) < 0.5 / exact.bandwidth_
+    assert np.isclose(mixture.debiased_mean(preds), exact.debiased_mean(preds), atol=0.05 * np.std(cal_targets))
+
+
+def test_mixture_warns_when_em_does_not_converge(nonlinear_shrinkage_data, monkeypatch):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    converged = TweedieDebiaser(engine="mixture").fit(cal_preds, cal_targets)
+    assert converged.diagnostics_.details["mixture_converged"]
+    assert "em_not_converged" not in converged.diagnostics_.warning_flags
+
+    monkeypatch.setattr(TweedieDebiaser, "_MIXTURE_MAX_ITER", 1)
+    with pytest.warns(DebiasingWarning, match="EM stopped before converging"):
+        truncated = TweedieDebiaser(engine="mixture").fit(cal_preds, cal_targets)
+
+    assert "em_not_converged" in truncated.diagnostics_.warning_flags
+    assert truncated.diagnostics_.details["mixture_iterations"] == 1
+    assert not truncated.diagnostics_.details["mixture_converged"]
+
+
+def test_truncated_engine_matches_exact(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    exact = TweedieDebiaser().fit(cal_preds, cal_targets)
+    truncated = TweedieDebiaser(engine="truncated").fit(cal_preds, cal_targets)
+
+    points = np.concatenate([preds, [cal_preds.min() - 20.0, cal_preds.max() + 20.0]])
+    assert np.allclose(truncated._score(points), exact._score(points), rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize("engine", ["exact", "truncated", "finite_difference", "binned", "mixture"])
+def test_chunked_scores_match_single_pass(engine, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    single = TweedieDebiaser(engine=engine, chunk_size=preds.size).fit(cal_preds, cal_targets)
+    chunked = TweedieDebiaser(engine=engine, chunk_size=97).fit(cal_preds, cal_targets)
+    assert np.allclose(single.debiased_predictions(preds), chunked.debiased_predictions(preds), rtol=1e-12)
+
+
+def test_max_memory_bounds_block_rows(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    budget = 2**20
+    tweedie = TweedieDebiaser(max_memory=budget).fit(cal_preds, cal_targets)
+    rows = tweedie._block_rows(cal_preds.size)
+    assert rows * cal_preds.size * 8 * TweedieDebiaser._KERNEL_TEMPORARIES <= budget
+    reference = TweedieDebiaser().fit(cal_preds, cal_targets)
+    assert np.allclose(tweedie.debiased_predictions(preds), reference.debiased_predictions(preds), rtol=1e-12)
+
+
+@pytest.mark.parametrize("params", [{"chunk_size": 0}, {"max_memory": 0}, {"cache_size": 0}, {"n_components": 0}])
+def test_invalid_evaluation_options_raise(params, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    with pytest.raises(ValueError, match="must be positive"):
+        TweedieDebiaser(**params).fit(cal_preds, cal_targets)
+
+
+def test_score_cache_reuses_quantized_values(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    quantized = np.round(preds, 1)
+    reference = TweedieDebiaser().fit(cal_preds, cal_targets)
+    cached = TweedieDebiaser(cache_size=1000).fit(cal_preds, cal_targets)
+
+    first = cached.debiased_predictions(quantized)
+    second = cached.debiased_predictions(quantized[::2])
+    n_unique = np.unique(quantized).size
+
+    assert np.allclose(first, reference.debiased_predictions(quantized), rtol=1e-12)
+    assert np.allclose(second, first[::2], rtol=1e-12)
+    assert cached.diagnostics_.details["score_cache_misses"] == n_unique
+    assert cached.diagnostics_.details["score_cache_hits"] == np.unique(quantized[::2]).size
+
+    cached.fit(cal_preds, cal_targets)
+    assert len(cached.score_cache_) == 0
+    assert cached.diagnostics_.details["score_cache_hits"] == 0
+
+
+def test_score_cache_is_bounded(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(cache_size=10).fit(cal_preds, cal_targets)
+    tweedie.debiased_predictions(preds[:50])
+    assert len(tweedie.score_cache_) == 10
+    assert list(tweedie.score_cache_) == np.sort(preds[:50])[-10:].tolist()
+
+
+def test_score_cache_holds_float64_scores_for_float32_inputs(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    values = preds[:200].astype(np.float32)
+    reference = TweedieDebiaser().fit(cal_preds, cal_targets)
+    cached = TweedieDebiaser(cache_size=1000).fit(cal_preds, cal_targets)
+
+    cached.debiased_predictions(values)
+
+    assert np.array_equal(
+        cached.debiased_predictions(values.astype(np.float64)),
+        reference.debiased_predictions(values.astype(np.float64)),
+    )
+
+
+def test_score_cache_is_thread_safe(nonlinear_shrinkage_data):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    quantized = np.round(preds, 2)
+    reference = TweedieDebiaser().fit(cal_preds, cal_targets).debiased_predictions(quantized)
+    tweedie = TweedieDebiaser(cache_size=16).fit(cal_preds, cal_targets)
+    blocks = [slice(start, start + 50) for start in range(0, quantized.size, 50)] * 8
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda block: tweedie.debiased_predictions(quantized[block]), blocks))
+
+    for block, result in zip(blocks, results):
+        assert np.allclose(result, reference[block], rtol=1e-12)
+    details = tweedie.diagnostics_.details
+    assert details["score_cache_hits"] + details["score_cache_misses"] == sum(
+        np.unique(quantized[block]).size for block in blocks
+    )
+    assert len(tweedie.score_cache_) == 16
+
+
+def test_merge_matches_fit_on_concatenated_shards(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    full = TweedieDebiaser().fit(cal_preds, cal_targets)
+    first = TweedieDebiaser().fit(cal_preds[:900], cal_targets[:900])
+    second = TweedieDebiaser().fit(cal_preds[900:], cal_targets[900:] + 0.05)
+    merged = first.merge(second)
+
+    residuals = cal_preds - cal_targets
+    residuals[900:] -= 0.05
+    pooled_sigma = np.std(residuals)
+    assert np.isclose(merged.sigma_, pooled_sigma, rtol=1e-12)
+    assert np.isclose(merged.bandwidth_, full.bandwidth_, rtol=1e-12)
+    assert np.allclose(merged._score(preds), full._score(preds), rtol=1e-10)
+    assert merged.diagnostics_.n_calibration == cal_preds.size
+
+
+def test_merge_unions_warning_flags_and_rejects_other_types(nonlinear_shrinkage_data):
+    from unshrink import LccDebiaser
+
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    with pytest.warns(DebiasingWarning, match="small calibration sample"):
+        small = TweedieDebiaser().fit(cal_preds[:50], cal_targets[:50])
+    large = TweedieDebiaser().fit(cal_preds[50:], cal_targets[50:])
+    merged = TweedieDebiaser.combine([large, small])
+
+    assert "small_calibration_sample" in merged.diagnostics_.warning_flags
+    with pytest.raises(TypeError, match="Cannot merge"):
+        large.merge(LccDebiaser().fit(cal_preds, cal_targets))
+
+
+def test_combine_fits_all_shards_once(nonlinear_shrinkage_data, monkeypatch):
+    import warnings
+
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    full = TweedieDebiaser().fit(cal_preds, cal_targets)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DebiasingWarning)
+        shards = [
+            TweedieDebiaser().fit(cal_preds[index], cal_targets[index])
+            for index in np.array_split(np.arange(cal_preds.size), 40)
+        ]
+    fits = []
+    original = TweedieDebiaser._fit_state
+
+    def counting_fit_state(self, *args, **kwargs):
+        fits.append(args[0].size)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(TweedieDebiaser, "_fit_state", counting_fit_state)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        combined = TweedieDebiaser.combine(shards)
+
+    assert fits == [cal_preds.size]
+    assert not caught
+    assert np.array_equal(combined.sorted_cal_predictions_, full.sorted_cal_predictions_)
+    assert np.isclose(combined.sigma_, full.sigma_, rtol=1e-12)
+    assert np.allclose(combined._score(preds), full._score(preds), rtol=1e-10)
+    assert "small_calibration_sample" in combined.diagnostics_.warning_flags
+
+
+@pytest.mark.parametrize("engine", ["exact", "truncated"])
+def test_multi_column_fit_matches_column_fits(engine, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    cal_matrix = np.column_stack([cal_preds, 0.8 * cal_preds, cal_targets])
+    target_matrix = np.column_stack([cal_targets, 0.8 * cal_targets, cal_targets])
+    pred_matrix = np.column_stack([preds, 0.8 * preds, preds])
+    batched = TweedieDebiaser(engine=engine, chunk_size=64).fit(cal_matrix, target_matrix)
+
+    corrected = batched.debiased_predictions(pred_matrix)
+    assert corrected.shape == pred_matrix.shape
+    assert batched.debiased_mean(pred_matrix).shape == (3,)
+    assert "zero_sigma_identity" in batched.diagnostics_[2].warning_flags
+    assert np.allclose(corrected[:, 2], preds)
+    for index in range(2):
+        single = TweedieDebiaser().fit(cal_matrix[:, index], target_matrix[:, index])
+        assert np.isclose(batched.sigma_[index], single.sigma_)
+        assert np.allclose(corrected[:, index], single.debiased_predictions(pred_matrix[:, index]), rtol=1e-10)
+
+
+@pytest.mark.parametrize("engine", ["exact", "finite_difference"])
+def test_partial_fit_matches_fit(engine, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    full = TweedieDebiaser(engine=engine).fit(cal_preds, cal_targets)
+    streamed = TweedieDebiaser(engine=engine)
+    for batch in np.array_split(np.arange(cal_preds.size), 4):
+        streamed.partial_fit(cal_preds[batch], cal_targets[batch])
+
+    assert np.array_equal(streamed.sorted_cal_predictions_, full.sorted_cal_predictions_)
+    assert np.isclose(streamed.sigma_, full.sigma_, rtol=1e-12)
+    assert np.isclose(streamed.bandwidth_, full.bandwidth_, rtol=1e-12)
+    assert streamed.diagnostics_.details["unique_predictions"] == full.diagnostics_.details["unique_predictions"]
+    assert streamed.diagnostics_.n_calibration == cal_preds.size
+    assert np.allclose(streamed.debiased_predictions(preds), full.debiased_predictions(preds), rtol=1e-9)
+
+
+def test_partial_fit_can_keep_bandwidth(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(engine="finite_difference").fit(cal_preds[:1500], cal_targets[:1500])
+    bandwidth = tweedie.bandwidth_
+    tweedie.partial_fit(cal_preds[1500:], cal_targets[1500:], refresh_bandwidth=False)
+
+    assert tweedie.bandwidth_ == bandwidth
+    assert np.isclose(np.sqrt(tweedie.kde_.covariance[0, 0]), bandwidth, rtol=1e-12)
+    assert np.isclose(tweedie.sigma_, np.std(cal_preds - cal_targets), rtol=1e-12)
+    assert tweedie.sorted_cal_predictions_.size == cal_preds.size
+
+
+def test_binned_partial_fit_updates_grid_counts(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    inside = (cal_preds > np.quantile(cal_preds, 0.05)) & (cal_preds < np.quantile(cal_preds, 0.95))
+    first = ~inside | (np.arange(cal_preds.size) < 900)
+    binned = TweedieDebiaser(engine="binned").fit(cal_preds[first], cal_targets[first])
+    grid = binned.grid_
+    binned.partial_fit(cal_preds[~first], cal_targets[~first])
+    exact = TweedieDebiaser().fit(cal_preds, cal_targets)
+
+    assert binned.grid_ is grid
+    assert np.isclose(binned.grid_counts_.sum(), cal_preds.size)
+    assert np.allclose(binned._score(preds), exact._score(preds), atol=1e-3 / exact.bandwidth_)
+
+
+@pytest.mark.parametrize("refresh_bandwidth", [True, False])
+def test_binned_partial_fit_defers_merging_sorted_predictions(refresh_bandwidth, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    inside = (cal_preds > np.quantile(cal_preds, 0.05)) & (cal_preds < np.quantile(cal_preds, 0.95))
+    first = ~inside | (np.arange(cal_preds.size) < 900)
+    binned = TweedieDebiaser(engine="binned").fit(cal_preds[first], cal_targets[first])
+    stored = binned.__dict__["sorted_cal_predictions_"]
+    repeated = cal_preds[first][:5]
+    for batch in np.array_split(np.flatnonzero(~first), 3):
+        binned.partial_fit(
+            np.append(cal_preds[batch], repeated),
+            np.append(cal_targets[batch], repeated),
+            refresh_bandwidth=refresh_bandwidth,
+        )
+
+    assert binned.__dict__["sorted_cal_predictions_"] is stored
+    assert binned.kde_ is None
+    assert binned.diagnostics_.n_calibration == cal_preds.size + 15
+    assert binned.diagnostics_.details["unique_predictions"] == np.unique(cal_preds).size
+    expected = np.sort(np.concatenate([cal_preds, np.tile(repeated, 3)]))
+    assert np.array_equal(binned.sorted_cal_predictions_, expected)
+    assert "pending_cal_predictions_" not in binned.__dict__
+    assert "pending_cal_predictions_" not in binned.get_params()
+
+
+def test_partial_fit_rejects_column_mismatch(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser().fit(np.column_stack([cal_preds, cal_preds]), cal_targets)
+    tweedie.partial_fit(np.column_stack([cal_preds[:200], cal_preds[:200]]), cal_targets[:200])
+    assert tweedie.diagnostics_[1].n_calibration == cal_preds.size + 200
+    with pytest.raises(ValueError, match="same number of columns"):
+        tweedie.partial_fit(cal_preds, cal_targets)
+
+
+def test_fit_from_chunks_matches_array_fit(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    full = TweedieDebiaser(engine="binned").fit(cal_preds, cal_targets)
+    # A narrow first chunk forces the binning lattice to grow as later chunks arrive.
+    order = np.argsort(np.abs(cal_preds - np.median(cal_preds)), kind="stable")
+    chunks = ((cal_preds[index], cal_targets[index]) for index in np.array_split(order, 9))
+    streamed = TweedieDebiaser(engine="binned").fit(chunks)
+
+    assert streamed.sorted_cal_predictions_ is None and streamed.kde_ is None
+    assert np.isclose(streamed.sigma_, full.sigma_, rtol=1e-12)
+    assert np.isclose(streamed.bandwidth_, full.bandwidth_, rtol=1e-10)
+    assert np.allclose(streamed.grid_, full.grid_)
+    assert np.isclose(streamed.grid_counts_.sum(), cal_preds.size)
+    assert np.allclose(streamed.grid_scores_, full.grid_scores_, atol=1e-3 / full.bandwidth_)
+
+    diagnostics = streamed.diagnostics_
+    assert diagnostics.n_calibration == cal_preds.size
+    assert (diagnostics.prediction_min, diagnostics.prediction_max) == (cal_preds.min(), cal_preds.max())
+    assert diagnostics.details["unique_predictions_approximate"] is True
+    assert diagnostics.details["unique_predictions"] == pytest.approx(np.unique(cal_preds).size, rel=0.1)
+    assert np.allclose(
+        streamed.debiased_mean(preds), full.debiased_mean(preds), atol=1e-3 * full.sigma_**2 / full.bandwidth_
+    )
+
+
+def test_fit_from_chunks_rejects_unsupported_setups(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    with pytest.raises(ValueError, match="requires engine='binned'"):
+        TweedieDebiaser().fit(iter([(cal_preds, cal_targets)]))
+    with pytest.raises(ValueError, match=r"\(predictions, targets\) chunks"):
+        TweedieDebiaser(engine="binned").fit(cal_preds)
+    with pytest.raises(ValueError, match="must not be empty"):
+        TweedieDebiaser(engine="binned").fit(iter([]))
+
+    streamed = TweedieDebiaser(engine="binned").fit([(cal_preds[:900], cal_targets[:900])])
+    with pytest.raises(ValueError, match="fitted from chunks"):
+        streamed.partial_fit(cal_preds[900:], cal_targets[900:])
+    with pytest.raises(ValueError, match="fitted from chunks"):
+        streamed.merge(TweedieDebiaser(engine="binned").fit(cal_preds, cal_targets))
+
+
+def test_rule_of_thumb_and_factor_bandwidths(nonlinear_shrinkage_data):
+    from scipy.stats import gaussian_kde
+
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    for bw_method in ("silverman", 0.3):
+        tweedie = TweedieDebiaser(engine="finite_difference", bw_method=bw_method).fit(cal_preds, cal_targets)
+        expected = np.sqrt(gaussian_kde(cal_preds, bw_method=bw_method).covariance[0, 0])
+        assert np.isclose(tweedie.bandwidth_, expected, rtol=1e-10)
+        assert np.isclose(np.sqrt(tweedie.kde_.covariance[0, 0]), expected, rtol=1e-10)
+    assert tweedie.diagnostics_.details["bw_method"] == "factor"
+
+
+@pytest.mark.parametrize("bw_method", [np.float64(0.3), np.array(0.3)])
+def test_numpy_scalar_bandwidths_are_factors(bw_method, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(bw_method=bw_method).fit(cal_preds, cal_targets)
+    assert tweedie.diagnostics_.details["bw_method"] == "factor"
+    assert tweedie.bandwidth_ == TweedieDebiaser(bw_method=0.3).fit(cal_preds, cal_targets).bandwidth_
+
+
+def test_lscv_bandwidth_matches_brute_force_selection(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    factors = np.geomspace(0.05, 0.6, 12)
+    tweedie = TweedieDebiaser(bw_method=factors).fit(cal_preds, cal_targets)
+
+    details = tweedie.diagnostics_.details
+    bandwidths = np.asarray(details["lscv_bandwidths"])
+    assert np.allclose(bandwidths, np.std(cal_preds, ddof=1) * factors)
+    differences = cal_preds[:, None] - cal_preds[None, :]
+    n = cal_preds.size
+
+    def pair_sum(width):
+        return np.sum(np.exp(-0.5 * np.square(differences / width))) / (np.sqrt(2.0 * np.pi) * width)
+
+    brute_force = np.array(
+        [
+            pair_sum(np.sqrt(2.0) * h) / n**2 - 2.0 * (pair_sum(h) - n / (np.sqrt(2.0 * np.pi) * h)) / (n * (n - 1))
+            for h in bandwidths
+        ]
+    )
+    assert np.allclose(details["lscv_scores"], brute_force, rtol=1e-3)
+    assert tweedie.bandwidth_ == bandwidths[np.argmin(brute_force)]
+    assert details["bw_method"] == "lscv" and not details["lscv_at_boundary"]
+
+
+def test_lscv_default_grid_and_boundary_warning(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    tweedie = TweedieDebiaser(bw_method="lscv").fit(cal_preds, cal_targets)
+    scott = TweedieDebiaser().fit(cal_preds, cal_targets)
+    assert len(tweedie.diagnostics_.details["lscv_scores"]) == 50
+    assert 0.1 * scott.bandwidth_ < tweedie.bandwidth_ < 2.0 * scott.bandwidth_
+
+    with pytest.warns(DebiasingWarning, match="edge of the candidate grid"):
+        narrow = TweedieDebiaser(bw_method=[2.0, 3.0]).fit(cal_preds, cal_targets)
+    assert "lscv_boundary" in narrow.diagnostics_.warning_flags
+
+
+@pytest.mark.parametrize("bw_method", ["unknown", 0.0, [], [0.2, -1.0], True, np.bool_(True), [True]])
+def test_invalid_bw_method_raises(bw_method, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    with pytest.raises(ValueError, match="bw_method must be"):
+        TweedieDebiaser(bw_method=bw_method).fit(cal_preds, cal_targets)
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import numpy as np
 import pytest
 
@@ -73,3 +75,97 @@ def test_compare_debiasers_rejects_bad_arguments(linear_shrinkage_data):
         compare_debiasers(cal_preds, cal_targets, n_splits=1)
     with pytest.raises(ValueError, match="n_contrast_draws must be at least 1"):
         compare_debiasers(cal_preds, cal_targets, n_contrast_draws=0)
+    with pytest.raises(ValueError, match="n_jobs must be positive"):
+        compare_debiasers(cal_preds, cal_targets, n_jobs=0)
+
+
+def test_compare_debiasers_debiases_each_fold_once(linear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+
+    class CountingLccDebiaser(LccDebiaser):
+        calls = 0
+
+        def debiased_predictions(self, predictions):
+            CountingLccDebiaser.calls += 1
+            return super().debiased_predictions(predictions)
+
+    compare_debiasers(
+        cal_preds,
+        cal_targets,
+        lcc_debiaser=CountingLccDebiaser(),
+        n_splits=3,
+        n_contrast_draws=25,
+    )
+    assert CountingLccDebiaser.calls == 3
+
+
+def test_fold_plan_contrasts_match_masked_means(linear_shrinkage_data):
+    from unshrink.utils import _FoldPlan
+
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    index = np.arange(cal_preds.size)
+    plan = _FoldPlan.build(cal_preds, cal_targets, index, index, np.random.SeedSequence(5), n_contrast_draws=200)
+    debiased = 2.0 * cal_preds + 1.0
+    truth = plan.contrasts(plan.test_targets)
+    scaled = plan.contrasts(2.0 * plan.test_predictions + 1.0)
+
+    rng = np.random.default_rng(np.random.SeedSequence(5))
+    expected_truth, expected_scaled = [], []
+    for _ in range(200):
+        lower, upper = np.quantile(cal_preds, [rng.uniform(0.05, 0.35), rng.uniform(0.65, 0.95)])
+        treated, control = cal_preds >= upper, cal_preds <= lower
+        expected_truth.append(cal_targets[treated].mean() - cal_targets[control].mean())
+        expected_scaled.append(debiased[treated].mean() - debiased[control].mean())
+
+    assert np.allclose(truth, expected_truth, atol=1e-12)
+    assert np.allclose(scaled, expected_scaled, atol=1e-12)
+
+
+def test_compare_debiasers_parallel_matches_serial(nonlinear_shrinkage_data):
+    from concurrent.futures import ProcessPoolExecutor
+
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    kwargs = {"n_splits": 4, "n_contrast_draws": 30, "random_state": 11}
+    serial = compare_debiasers(cal_preds, cal_targets, **kwargs)
+    threaded = compare_debiasers(cal_preds, cal_targets, n_jobs=3, **kwargs)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processed = compare_debiasers(cal_preds, cal_targets, executor=executor, **kwargs)
+
+    assert threaded.to_dict() == serial.to_dict()
+    assert processed.to_dict() == serial.to_dict()
+
+
+def test_compare_debiasers_accepts_candidate_mapping(nonlinear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = nonlinear_shrinkage_data
+    candidates = {
+        "lcc": LccDebiaser(),
+        "tweedie_narrow": TweedieDebiaser(bw_method=0.5),
+        "tweedie_scott": TweedieDebiaser(),
+        "tweedie_wide": TweedieDebiaser(bw_method=2.0),
+    }
+    report = compare_debiasers(cal_preds, cal_targets, debiasers=candidates, n_splits=3, n_contrast_draws=30)
+
+    assert list(report.metrics) == ["naive", *candidates]
+    assert report.recommended_method in candidates
+    default = compare_debiasers(cal_preds, cal_targets, n_splits=3, n_contrast_draws=30)
+    assert replace(report.metrics["tweedie_scott"], method="tweedie") == default.metrics["tweedie"]
+    assert report.metrics["naive"] == default.metrics["naive"]
+
+    single = compare_debiasers(cal_preds, cal_targets, debiasers={"lcc": LccDebiaser()}, n_splits=3)
+    assert single.recommended_method == "lcc"
+    assert "only candidate" in single.rationale
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error", "match"),
+    [
+        ({"debiasers": {}}, ValueError, "at least one candidate"),
+        ({"debiasers": {"naive": LccDebiaser()}}, ValueError, "reserved"),
+        ({"debiasers": {"lcc": LccDebiaser()}, "lcc_debiaser": LccDebiaser()}, ValueError, "not both"),
+        ({"debiasers": {"lcc": "lcc"}}, TypeError, "must be a BaseDebiaser"),
+    ],
+)
+def test_compare_debiasers_rejects_bad_candidates(linear_shrinkage_data, kwargs, error, match):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    with pytest.raises(error, match=match):
+        compare_debiasers(cal_preds, cal_targets, **kwargs)
@@ -1,17 +1,28 @@
 import numpy as np
 import pytest
 
-from unshrink import LccDebiaser, TweedieDebiaser
+from unshrink import LccDebiaser, TweedieDebiaser, config_context, get_config
 
 
 @pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
-def test_fit_rejects_non_1d_inputs(Debiaser):
-    cal_preds = np.ones((5, 2))
-    cal_targets = np.ones((5, 2))
-    with pytest.raises(ValueError, match="1D array"):
+def test_fit_rejects_inputs_above_2d(Debiaser):
+    cal_preds = np.ones((5, 2, 2))
+    cal_targets = np.ones((5, 2, 2))
+    with pytest.raises(ValueError, match="1D or 2D array"):
         Debiaser().fit(cal_preds, cal_targets)
 
 
+@pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
+def test_predictions_must_match_fitted_columns(Debiaser, no_noise_data):
+    preds, targets = no_noise_data
+    one_dimensional = Debiaser().fit(preds, targets)
+    two_dimensional = Debiaser().fit(np.column_stack([preds, preds]), targets)
+    with pytest.raises(ValueError, match="1D array"):
+        one_dimensional.debiased_predictions(np.column_stack([preds, preds]))
+    with pytest.raises(ValueError, match=r"shape \(n, 2\)"):
+        two_dimensional.debiased_predictions(preds)
+
+
 @pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
 def test_fit_rejects_mismatched_lengths(Debiaser):
     cal_preds = np.arange(10, dtype=float)
@@ -35,3 +46,62 @@ def test_prediction_methods_reject_empty_inputs(Debiaser, no_noise_data):
     debiaser = Debiaser().fit(preds, targets)
     with pytest.raises(ValueError, match="must not be empty"):
         debiaser.debiased_predictions(np.array([]))
+
+
+@pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
+def test_float32_predictions_stay_float32(Debiaser, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = Debiaser().fit(cal_preds, cal_targets)
+
+    corrected = deb.debiased_predictions(preds.astype(np.float32))
+
+    assert corrected.dtype == np.float32
+    assert np.allclose(corrected, deb.debiased_predictions(preds), atol=1e-4)
+
+
+@pytest.mark.parametrize("Debiaser", [LccDebiaser, TweedieDebiaser])
+def test_debiased_predictions_into_out(Debiaser, nonlinear_shrinkage_data):
+    cal_preds, cal_targets, preds, _ = nonlinear_shrinkage_data
+    deb = Debiaser().fit(cal_preds, cal_targets)
+    expected = deb.debiased_predictions(preds)
+
+    out = np.empty_like(preds)
+    assert deb.debiased_predictions(preds, out=out) is out
+    assert np.allclose(out, expected)
+
+    in_place = preds.copy()
+    deb.debiased_predictions(in_place, out=in_place)
+    assert np.allclose(in_place, expected)
+
+    with pytest.raises(ValueError, match="out must be"):
+        deb.debiased_predictions(preds, out=np.empty(preds.size + 1))
+
+
+def test_check_inputs_config_skips_finite_scan(linear_shrinkage_data):
+    cal_preds, cal_targets, _, _ = linear_shrinkage_data
+    deb = LccDebiaser().fit(cal_preds, cal_targets)
+    predictions = np.array([0.1, np.nan])
+
+    with pytest.raises(ValueError, match="finite"):
+        deb.debiased_predictions(predictions)
+    with config_context(check_inputs=False):
+        assert get_config()["check_inputs"] is False
+        corrected = deb.debiased_predictions(predictions)
+    assert np.isnan(corrected[1])
+    assert get_config()["check_inputs"] is True
+
+
+def test_debiased_ate_validates_each_arm_once(linear_shrinkage_data, monkeypatch):
+    cal_preds, cal_targets, preds, _ = linear_shrinkage_data
+    deb = LccDebiaser().fit(cal_preds, cal_targets)
+    calls = []
+    validate = LccDebiaser._validate_prediction_inputs
+    monkeypatch.setattr(
+        LccDebiaser,
+        "_validate_prediction_inputs",
+        lambda self, predictions: calls.append(1) or validate(self, predictions),
+    )
+
+    deb.debiased_ate(preds[:100], preds[100:])
+
+    assert len(calls) == 2
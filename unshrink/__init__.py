@@ -1,18 +1,77 @@
-from .lcc import LccDebiaser
-from .reports import CalibrationDiagnostics, DebiaserComparisonReport, DebiaserMetrics, DebiasingWarning
-from .tweedie import TweedieDebiaser
-from .utils import compare_debiasers, evaluate_debiaser
+from __future__ import annotations
 
-LCCDebiaser = LccDebiaser
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import config_context, get_config, set_config
+    from .grouped import GroupedDebiaser
+    from .inference import debiased_ate_ci
+    from .lcc import LccDebiaser
+    from .profiling import StageTiming, set_profiler
+    from .reports import (
+        CalibrationDiagnostics,
+        DebiasedEstimate,
+        DebiaserComparisonReport,
+        DebiaserMetrics,
+        DebiasingWarning,
+    )
+    from .tweedie import TweedieDebiaser
+    from .utils import compare_debiasers, evaluate_debiaser
+
+    LCCDebiaser = LccDebiaser
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# ``import unshrink`` stays cheap in short-lived processes.
+_LAZY_ATTRIBUTES = {
+    "CalibrationDiagnostics": ("reports", "CalibrationDiagnostics"),
+    "compare_debiasers": ("utils", "compare_debiasers"),
+    "config_context": ("config", "config_context"),
+    "debiased_ate_ci": ("inference", "debiased_ate_ci"),
+    "DebiasedEstimate": ("reports", "DebiasedEstimate"),
+    "DebiaserComparisonReport": ("reports", "DebiaserComparisonReport"),
+    "DebiaserMetrics": ("reports", "DebiaserMetrics"),
+    "DebiasingWarning": ("reports", "DebiasingWarning"),
+    "evaluate_debiaser": ("utils", "evaluate_debiaser"),
+    "get_config": ("config", "get_config"),
+    "GroupedDebiaser": ("grouped", "GroupedDebiaser"),
+    "LccDebiaser": ("lcc", "LccDebiaser"),
+    "LCCDebiaser": ("lcc", "LccDebiaser"),
+    "set_config": ("config", "set_config"),
+    "set_profiler": ("profiling", "set_profiler"),
+    "StageTiming": ("profiling", "StageTiming"),
+    "TweedieDebiaser": ("tweedie", "TweedieDebiaser"),
+}
 
 __all__ = [
     "CalibrationDiagnostics",
     "compare_debiasers",
+    "config_context",
+    "debiased_ate_ci",
+    "DebiasedEstimate",
     "DebiaserComparisonReport",
     "DebiaserMetrics",
     "DebiasingWarning",
     "evaluate_debiaser",
+    "get_config",
+    "GroupedDebiaser",
     "LccDebiaser",
     "LCCDebiaser",
+    "set_config",
+    "set_profiler",
+    "StageTiming",
     "TweedieDebiaser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,42 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Sequence
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Type, TypeVar, Union
+import os
 import warnings
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
+from .config import get_config
+from .profiling import _NO_STAGE, Stage, get_profiler, profile_stage, profiling_enabled
 from .reports import CalibrationDiagnostics, DebiasingWarning
 
+if TYPE_CHECKING:
+    from .persistence import DebiaserState
+
 FloatArray = NDArray[np.float64]
+# Prediction arrays in these dtypes are used as-is; anything else is converted to float64.
+_PRESERVED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+Estimate = Union[float, FloatArray]
+DebiaserT = TypeVar("DebiaserT", bound="BaseDebiaser")
 
 
 class BaseDebiaser(ABC):
     """
     Base class for debiasers with a sklearn-like fit/predict pattern.
+
+    Debiasers fitted on 2D ``(n, k)`` calibration arrays correct ``k`` columns
+    at once: predictions must then have ``k`` columns, means and ATEs are
+    length-``k`` arrays, and ``diagnostics_`` is a tuple with one entry per
+    column.
     """
 
     method_name = "base"
+    # Rows per block when a memory-mapped prediction array is streamed.
+    _STREAM_BLOCK_ROWS = 1 << 20
 
     @abstractmethod
     def fit(self, cal_predictions: ArrayLike, cal_targets: ArrayLike) -> "BaseDebiaser":
@@ -28,10 +47,207 @@ class BaseDebiaser(ABC):
         """Return per-observation debiased predictions."""
         raise NotImplementedError
 
-    def debiased_mean(self, predictions: ArrayLike) -> float:
+    def _debias(self, predictions: FloatArray, out: Optional[FloatArray] = None) -> FloatArray:
+        """
+        Debias already validated predictions, writing into ``out`` when given.
+
+        Built-in debiasers override this to skip the validation and support
+        checks of ``debiased_predictions`` and keep the dtype of
+        ``predictions``; the default delegates to ``debiased_predictions``.
+        """
+        corrected = np.asarray(self.debiased_predictions(predictions))
+        if out is None:
+            return corrected
+        out[...] = corrected
+        return out
+
+    def debiased_mean(self, predictions: Union[ArrayLike, Iterable[ArrayLike]]) -> Estimate:
+        """
+        Mean of the debiased predictions.
+
+        ``predictions`` may also be an iterable of array chunks (an iterator,
+        or e.g. a list of arrays) or an ``np.memmap``, which is read in blocks;
+        either is reduced with running sums in O(chunk) memory.
+        """
         self._require_is_fit("diagnostics_", method_name="debiased_mean")
+        if self._is_stream(predictions):
+            return self._stream_mean(predictions, None, weight_name="weights")
         corrected = self.debiased_predictions(predictions)
-        return float(np.mean(corrected))
+        return self._as_estimate(np.mean(corrected, axis=0, dtype=np.float64))
+
+    def _is_stream(self, values: Any) -> bool:
+        return isinstance(values, np.memmap) or self._is_chunk_iterable(values)
+
+    def _is_chunk_iterable(self, values: Any) -> bool:
+        """Whether ``values`` yields chunks: an iterator, or e.g. a list of arrays."""
+        if isinstance(values, Iterator):
+            return True
+        return self._is_chunked(values, chunk_ndim=1 if getattr(self, "n_columns_", None) is None else 2)
+
+    @staticmethod
+    def _is_chunked(values: Any, *, chunk_ndim: int) -> bool:
+        """Whether ``values`` is a non-array iterable (e.g. a list) whose first item is a ``chunk_ndim`` chunk."""
+        if values is None or isinstance(values, (np.ndarray, str, bytes)) or not isinstance(values, Iterable):
+            return False
+        first = next(iter(values), None)
+        return first is not None and np.ndim(first) == chunk_ndim
+
+    def _stream_chunks(self, values: Union[ArrayLike, Iterable[ArrayLike]]) -> Iterator[ArrayLike]:
+        if self._is_chunk_iterable(values):
+            return iter(values)
+        array = np.asarray(values)
+        block_rows = self._STREAM_BLOCK_ROWS
+        return (array[start : start + block_rows] for start in range(0, len(array), block_rows))
+
+    def _stream_mean(
+        self,
+        predictions: Union[ArrayLike, Iterable[ArrayLike]],
+        weights: Optional[Union[ArrayLike, Iterable[ArrayLike]]],
+        *,
+        weight_name: str,
+    ) -> Estimate:
+        """
+        Accumulate the (weighted) mean of debiased predictions chunk by chunk.
+
+        Weights may be matching chunks (an iterator or e.g. a list of arrays)
+        or an array that is sliced alongside the predictions. The support
+        warning is raised at most once, from the extremes of the whole stream.
+        """
+        weight_chunks = None
+        if isinstance(weights, Iterator) or self._is_chunked(weights, chunk_ndim=1):
+            weight_chunks = iter(weights)
+        weight_array = None if weights is None or weight_chunks is not None else np.asarray(weights)
+        total: Estimate = 0.0
+        weight_total = 0.0
+        lower: Optional[FloatArray] = None
+        upper: Optional[FloatArray] = None
+        n_rows = 0
+        for chunk in self._stream_chunks(predictions):
+            chunk_weights = None
+            if weight_chunks is not None:
+                chunk_weights = next(weight_chunks, None)
+                if chunk_weights is None:
+                    raise ValueError(f"{weight_name} must have the same shape as the corresponding predictions.")
+            if np.size(chunk) == 0:
+                continue
+            chunk_array = self._validate_prediction_inputs(chunk)
+            rows = chunk_array.shape[0]
+            if weight_array is not None:
+                chunk_weights = weight_array[n_rows : n_rows + rows]
+            corrected = self._debias(chunk_array)
+            if chunk_weights is None:
+                total = total + corrected.sum(axis=0, dtype=np.float64)
+                weight_total += rows
+            else:
+                chunk_weight_array = self._validate_weights(
+                    chunk_array,
+                    chunk_weights,
+                    name=weight_name,
+                    check_total=False,
+                )
+                assert chunk_weight_array is not None
+                total = total + chunk_weight_array @ corrected
+                weight_total += float(chunk_weight_array.sum())
+            chunk_lower = chunk_array.min(axis=0)
+            chunk_upper = chunk_array.max(axis=0)
+            lower = chunk_lower if lower is None else np.minimum(lower, chunk_lower)
+            upper = chunk_upper if upper is None else np.maximum(upper, chunk_upper)
+            n_rows += rows
+
+        if n_rows == 0:
+            raise ValueError("predictions must not be empty.")
+        leftover = next(weight_chunks, None) if weight_chunks is not None else None
+        if leftover is not None or (weight_array is not None and len(weight_array) != n_rows):
+            raise ValueError(f"{weight_name} must have the same shape as the corresponding predictions.")
+        if weight_total <= 0.0:
+            raise ValueError(f"{weight_name} must sum to a positive value.")
+        assert lower is not None and upper is not None
+        self._warn_if_outside_range(lower, upper, stacklevel=4)
+        return self._as_estimate(np.divide(total, weight_total))
+
+    def merge(self, other: "BaseDebiaser") -> "BaseDebiaser":
+        """Return a new debiaser fitted on the union of both calibration sets."""
+        return self._merge_all([other])
+
+    @classmethod
+    def combine(cls, debiasers: Sequence["BaseDebiaser"]) -> "BaseDebiaser":
+        """
+        Merge debiasers fitted on calibration shards into one global debiaser,
+        refitting once on the union of all shards rather than pair by pair.
+        """
+        if len(debiasers) == 0:
+            raise ValueError("combine() needs at least one fitted debiaser.")
+        first, *others = debiasers
+        return first._merge_all(others) if others else first
+
+    def _merge_all(self, others: Sequence["BaseDebiaser"]) -> "BaseDebiaser":
+        """Return a new debiaser fitted on the union of this and the ``others`` calibration sets."""
+        raise NotImplementedError(f"{type(self).__name__} does not support merge().")
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write the fitted debiaser to the directory ``path`` as a versioned, memory-mappable artifact."""
+        from .persistence import save_debiaser
+
+        self._require_is_fit("diagnostics_", method_name="save")
+        save_debiaser(self, path)
+
+    @classmethod
+    def load(cls: Type[DebiaserT], path: Union[str, "os.PathLike[str]"], mmap: bool = True) -> DebiaserT:
+        """Load a debiaser written by ``save``; ``mmap=True`` memory-maps its arrays read-only."""
+        from .persistence import load_debiaser
+
+        debiaser = load_debiaser(path, mmap=mmap)
+        if not isinstance(debiaser, cls):
+            raise TypeError(f"{path} holds a {type(debiaser).__name__}, not a {cls.__name__}.")
+        return debiaser
+
+    def _get_state(self) -> "DebiaserState":
+        raise NotImplementedError(f"{type(self).__name__} does not support save().")
+
+    def _set_state(self, state: "DebiaserState") -> None:
+        raise NotImplementedError(f"{type(self).__name__} does not support load().")
+
+    def _stage(self, name: str, elements: int = 0) -> Stage:
+        """Time a fit stage into ``stage_timings_``, which the fitted diagnostics pick up."""
+        if not profiling_enabled():
+            return _NO_STAGE
+        return profile_stage(name, self.__dict__.setdefault("stage_timings_", {}), elements, enabled=True)
+
+    @staticmethod
+    def _predict_stage(name: str, elements: int = 0) -> Stage:
+        """
+        Time a prediction stage for the registered profiler only, so predicting
+        never mutates a fitted (possibly shared) debiaser.
+        """
+        if get_profiler() is None:
+            return _NO_STAGE
+        return profile_stage(name, {}, elements, enabled=True)
+
+    def _reset_stage_timings(self) -> None:
+        self.__dict__.pop("stage_timings_", None)
+
+    def _check_mergeable(self, other: "BaseDebiaser", *attributes: str) -> None:
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot merge {type(self).__name__} with {type(other).__name__}.")
+        self._require_is_fit(*attributes, "diagnostics_", method_name="merge")
+        other._require_is_fit(*attributes, "diagnostics_", method_name="merge")
+        if self.n_columns_ != other.n_columns_:
+            raise ValueError("Cannot merge debiasers fitted on a different number of columns.")
+
+    def _inherit_warning_flags(self, *sources: "BaseDebiaser") -> None:
+        def inherit(diagnostics: CalibrationDiagnostics, *others: CalibrationDiagnostics) -> CalibrationDiagnostics:
+            flags = list(diagnostics.warning_flags)
+            for source in others:
+                flags.extend(flag for flag in source.warning_flags if flag not in flags)
+            return replace(diagnostics, warning_flags=tuple(flags))
+
+        if isinstance(self.diagnostics_, tuple):
+            self.diagnostics_ = tuple(
+                inherit(column, *(source.diagnostics_[index] for source in sources))
+                for index, column in enumerate(self.diagnostics_)
+            )
+        else:
+            self.diagnostics_ = inherit(self.diagnostics_, *(source.diagnostics_ for source in sources))
 
     def _require_is_fit(self, *attributes: str, method_name: str) -> None:
         missing = [attribute for attribute in attributes if not hasattr(self, attribute)]
@@ -39,12 +255,32 @@ class BaseDebiaser(ABC):
             raise RuntimeError(f"Call .fit() before .{method_name}().")
 
     def _as_1d_float_array(self, values: ArrayLike, *, name: str) -> FloatArray:
-        array = np.asarray(values, dtype=float)
-        if array.ndim != 1:
+        return self._as_float_array(values, name=name)
+
+    def _as_float_array(
+        self,
+        values: ArrayLike,
+        *,
+        name: str,
+        allow_2d: bool = False,
+        preserve_dtype: bool = False,
+    ) -> FloatArray:
+        """
+        Convert ``values`` to a float array without copying when possible.
+
+        With ``preserve_dtype``, float32 inputs stay float32. The finite-value
+        scan is skipped when ``set_config(check_inputs=False)`` is active.
+        """
+        array = np.asarray(values)
+        if not preserve_dtype or array.dtype not in _PRESERVED_DTYPES:
+            array = np.asarray(array, dtype=float)
+        if allow_2d and array.ndim not in (1, 2):
+            raise ValueError(f"{name} must be a 1D or 2D array.")
+        if not allow_2d and array.ndim != 1:
             raise ValueError(f"{name} must be a 1D array.")
         if array.size == 0:
             raise ValueError(f"{name} must not be empty.")
-        if not np.all(np.isfinite(array)):
+        if get_config()["check_inputs"] and not np.all(np.isfinite(array)):
             raise ValueError(f"{name} must contain only finite numeric values.")
         return array
 
@@ -52,33 +288,66 @@ class BaseDebiaser(ABC):
         self,
         cal_predictions: ArrayLike,
         cal_targets: ArrayLike,
+        *,
+        allow_2d: bool = False,
     ) -> tuple[FloatArray, FloatArray]:
-        cal_predictions_array = self._as_1d_float_array(cal_predictions, name="cal_predictions")
-        cal_targets_array = self._as_1d_float_array(cal_targets, name="cal_targets")
+        """
+        Validate calibration pairs; with ``allow_2d``, 1D targets are shared by
+        every column of 2D predictions.
+        """
+        cal_predictions_array = self._as_float_array(cal_predictions, name="cal_predictions", allow_2d=allow_2d)
+        cal_targets_array = self._as_float_array(cal_targets, name="cal_targets", allow_2d=allow_2d)
+        if (
+            cal_predictions_array.ndim == 2
+            and cal_targets_array.ndim == 1
+            and cal_targets_array.shape[0] == cal_predictions_array.shape[0]
+        ):
+            cal_targets_array = np.broadcast_to(cal_targets_array[:, None], cal_predictions_array.shape)
         if cal_predictions_array.shape != cal_targets_array.shape:
             raise ValueError("cal_predictions and cal_targets must have the same shape.")
         return cal_predictions_array, cal_targets_array
 
     def _validate_prediction_inputs(self, predictions: ArrayLike) -> FloatArray:
-        return self._as_1d_float_array(predictions, name="predictions")
+        n_columns = getattr(self, "n_columns_", None)
+        prediction_array = self._as_float_array(
+            predictions,
+            name="predictions",
+            allow_2d=n_columns is not None,
+            preserve_dtype=True,
+        )
+        if n_columns is not None and (prediction_array.ndim != 2 or prediction_array.shape[1] != n_columns):
+            raise ValueError(f"predictions must have shape (n, {n_columns}) to match the calibration data.")
+        return prediction_array
+
+    @staticmethod
+    def _check_out(out: Optional[FloatArray], predictions: FloatArray) -> Optional[FloatArray]:
+        if out is None:
+            return None
+        if not isinstance(out, np.ndarray) or out.shape != predictions.shape or out.dtype not in _PRESERVED_DTYPES:
+            raise ValueError("out must be a float32 or float64 array with the same shape as predictions.")
+        return out
+
+    @staticmethod
+    def _as_estimate(value: FloatArray) -> Estimate:
+        return float(value) if np.ndim(value) == 0 else np.asarray(value, dtype=float)
 
     def _validate_weights(
         self,
         values: FloatArray,
-        weights: Optional[Sequence[float]],
+        weights: Optional[ArrayLike],
         *,
         name: str,
+        check_total: bool = True,
     ) -> Optional[FloatArray]:
         if weights is None:
             return None
 
         weight_array = self._as_1d_float_array(weights, name=name)
-        if weight_array.shape != values.shape:
+        if weight_array.shape != values.shape[:1]:
             raise ValueError(f"{name} must have the same shape as the corresponding predictions.")
         if np.any(weight_array < 0):
             raise ValueError(f"{name} must be non-negative.")
-        total = float(weight_array.sum())
-        if total <= 0.0:
+        if check_total and float(weight_array.sum()) <= 0.0:
             raise ValueError(f"{name} must sum to a positive value.")
         return weight_array
 
@@ -88,58 +357,95 @@ class BaseDebiaser(ABC):
         weights: Optional[Sequence[float]] = None,
         *,
         weight_name: str = "weights",
-    ) -> float:
+    ) -> Estimate:
         if weights is None:
-            return float(np.mean(values))
+            return self._as_estimate(np.mean(values, axis=0, dtype=np.float64))
 
         weight_array = self._validate_weights(values, weights, name=weight_name)
         assert weight_array is not None
-        return float(np.average(values, weights=weight_array))
+        return self._as_estimate(np.average(values, axis=0, weights=weight_array))
 
     def _warn_if_outside_support(self, predictions: FloatArray) -> None:
+        self._warn_if_outside_range(predictions.min(axis=0), predictions.max(axis=0), stacklevel=4)
+
+    def _warn_if_outside_range(self, lower: FloatArray, upper: FloatArray, *, stacklevel: int) -> None:
         if not hasattr(self, "diagnostics_"):
             return
-        diagnostics: CalibrationDiagnostics = self.diagnostics_
-        if predictions.min() < diagnostics.prediction_min or predictions.max() > diagnostics.prediction_max:
+        columns = self.diagnostics_ if isinstance(self.diagnostics_, tuple) else (self.diagnostics_,)
+        support_lower = np.array([column.prediction_min for column in columns])
+        support_upper = np.array([column.prediction_max for column in columns])
+        if np.any(lower < support_lower) or np.any(upper > support_upper):
             warnings.warn(
                 "Prediction support extends beyond the calibration support; debiasing may be unstable.",
                 DebiasingWarning,
-                stacklevel=3,
+                stacklevel=stacklevel,
             )
 
-    def _set_diagnostics(
+    def _set_diagnostics(self, **kwargs: Any) -> None:
+        self.diagnostics_ = self._build_diagnostics(**kwargs)
+
+    def _build_diagnostics(
         self,
         *,
-        cal_predictions: FloatArray,
+        cal_predictions: Optional[FloatArray] = None,
         residual_std: Optional[float],
         warning_flags: Sequence[str],
         details: Dict[str, float | int | str | bool | None],
-    ) -> None:
-        self.diagnostics_ = CalibrationDiagnostics(
+        support: Optional[tuple[int, float, float]] = None,
+    ) -> CalibrationDiagnostics:
+        """
+        Build fitted diagnostics; ``support`` gives ``(n_calibration, min, max)``
+        when the calibration predictions are not available as one array.
+        """
+        if support is None:
+            assert cal_predictions is not None
+            support = (int(cal_predictions.size), float(np.min(cal_predictions)), float(np.max(cal_predictions)))
+        n_calibration, prediction_min, prediction_max = support
+        return CalibrationDiagnostics(
             method=self.method_name,
-            n_calibration=int(cal_predictions.size),
-            prediction_min=float(np.min(cal_predictions)),
-            prediction_max=float(np.max(cal_predictions)),
+            n_calibration=int(n_calibration),
+            prediction_min=float(prediction_min),
+            prediction_max=float(prediction_max),
             residual_std=None if residual_std is None else float(residual_std),
             warning_flags=tuple(warning_flags),
-            details=dict(details),
+            details={**details, **getattr(self, "stage_timings_", {})},
         )
 
+    def _update_diagnostics(self, **details: float | int | str | bool | None) -> None:
+        if isinstance(self.diagnostics_, tuple):
+            self.diagnostics_ = tuple(
+                replace(column, details={**column.details, **details}) for column in self.diagnostics_
+            )
+        else:
+            self.diagnostics_ = replace(self.diagnostics_, details={**self.diagnostics_.details, **details})
+
     def debiased_ate(
         self,
-        treated_predictions: ArrayLike,
-        control_predictions: ArrayLike,
-        iptw_treated: Optional[Sequence[float]] = None,
-        iptw_control: Optional[Sequence[float]] = None,
-    ) -> float:
-        """Compute a debiased average treatment effect between treated and control groups."""
+        treated_predictions: Union[ArrayLike, Iterable[ArrayLike]],
+        control_predictions: Union[ArrayLike, Iterable[ArrayLike]],
+        iptw_treated: Optional[Union[ArrayLike, Iterable[ArrayLike]]] = None,
+        iptw_control: Optional[Union[ArrayLike, Iterable[ArrayLike]]] = None,
+    ) -> Estimate:
+        """
+        Compute a debiased average treatment effect between treated and control groups.
+
+        Either arm may be streamed as an iterable of chunks or an ``np.memmap``
+        (see ``debiased_mean``), with IPTW weights given as matching chunks or
+        as an array.
+        """
         self._require_is_fit("diagnostics_", method_name="debiased_ate")
+        if self._is_stream(treated_predictions) or self._is_stream(control_predictions):
+            mean_treated = self._stream_mean(treated_predictions, iptw_treated, weight_name="iptw_treated")
+            mean_control = self._stream_mean(control_predictions, iptw_control, weight_name="iptw_control")
+            return self._as_estimate(np.subtract(mean_treated, mean_control))
 
         treated_array = self._validate_prediction_inputs(treated_predictions)
         control_array = self._validate_prediction_inputs(control_predictions)
+        self._warn_if_outside_support(treated_array)
+        self._warn_if_outside_support(control_array)
 
-        debiased_treated = self.debiased_predictions(treated_array)
-        debiased_control = self.debiased_predictions(control_array)
+        debiased_treated = self._debias(treated_array)
+        debiased_control = self._debias(control_array)
 
         mean_treated = self._weighted_mean(
             debiased_treated,
@@ -151,7 +457,7 @@ class BaseDebiaser(ABC):
             iptw_control,
             weight_name="iptw_control",
         )
-        return float(mean_treated - mean_control)
+        return self._as_estimate(np.subtract(mean_treated, mean_control))
 
     def get_params(self, deep: bool = True) -> Dict[str, Any]:
         del deep
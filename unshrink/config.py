@@ -0,0 +1,41 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+_config: Dict[str, Any] = {
+    "check_inputs": True,
+    "profile": False,
+}
+
+
+def get_config() -> Dict[str, Any]:
+    """Return a copy of the global unshrink configuration."""
+    return dict(_config)
+
+
+def set_config(*, check_inputs: Optional[bool] = None, profile: Optional[bool] = None) -> None:
+    """
+    Update the global unshrink configuration.
+
+    ``check_inputs=False`` skips the full ``np.isfinite`` scan of inputs for
+    trusted pipelines; shapes are still checked. Non-finite values then
+    propagate into the results instead of raising.
+
+    ``profile=True`` records per-stage wall times and element counts in
+    diagnostics and comparison reports (see ``set_profiler``).
+    """
+    if check_inputs is not None:
+        _config["check_inputs"] = bool(check_inputs)
+    if profile is not None:
+        _config["profile"] = bool(profile)
+
+
+@contextmanager
+def config_context(*, check_inputs: Optional[bool] = None, profile: Optional[bool] = None) -> Iterator[None]:
+    """Temporarily apply ``set_config`` options inside a ``with`` block."""
+    previous = get_config()
+    set_config(check_inputs=check_inputs, profile=profile)
+    try:
+        yield
+    finally:
+        _config.update(previous)
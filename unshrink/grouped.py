@@ -0,0 +1,220 @@
+from __future__ import annotations
+from typing import Optional, Sequence
+import warnings
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .base import BaseDebiaser
+from .lcc import LccDebiaser
+from .moments import PairedMoments
+from .persistence import DebiaserState, moment_arrays, moments_from_arrays
+from .reports import DebiasingWarning
+
+FloatArray = NDArray[np.float64]
+IntArray = NDArray[np.intp]
+
+
+class GroupedDebiaser(BaseDebiaser):
+    """
+    Separate calibration per group (e.g. country or survey wave).
+
+    ``debiaser`` is an unfitted template (``LccDebiaser()`` when omitted) that
+    is fitted once per group. With LCC, all groups are fitted together from
+    ``np.bincount`` group moments and predictions are corrected in one pass by
+    indexing the per-group ``slope_`` and ``intercept_`` arrays, so the cost
+    does not grow with the number of groups. Other debiasers are fitted and
+    applied group by group.
+
+    Groups smaller than ``min_group_size``, groups whose fit is not
+    identifiable, and groups not seen during calibration use a fit pooled over
+    all calibration data (``pooled_debiaser_``).
+    """
+
+    method_name = "grouped"
+
+    def __init__(self, debiaser: Optional[BaseDebiaser] = None, min_group_size: int = 30):
+        self.debiaser = debiaser
+        self.min_group_size = min_group_size
+
+    def fit(self, cal_predictions: ArrayLike, cal_targets: ArrayLike, groups: ArrayLike) -> "GroupedDebiaser":
+        cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(cal_predictions, cal_targets)
+        group_array = np.asarray(groups)
+        if group_array.shape != cal_predictions_array.shape:
+            raise ValueError("groups must have the same shape as cal_predictions.")
+        if self.min_group_size < 1:
+            raise ValueError("min_group_size must be positive.")
+
+        template = self.debiaser if self.debiaser is not None else LccDebiaser()
+        self.n_columns_ = None
+        self.groups_, codes = np.unique(group_array, return_inverse=True)
+        codes = codes.reshape(-1)
+        self.group_sizes_ = np.bincount(codes, minlength=self.groups_.size)
+        self.pooled_debiaser_ = template.__class__(**template.get_params()).fit(
+            cal_predictions_array,
+            cal_targets_array,
+        )
+        if isinstance(template, LccDebiaser):
+            self._fit_lcc_groups(cal_predictions_array, cal_targets_array, codes)
+        else:
+            self._fit_group_debiasers(template, cal_predictions_array, cal_targets_array, codes)
+
+        n_pooled = int(np.count_nonzero(self.pooled_groups_))
+        warning_flags = ["pooled_fallback"] if n_pooled else []
+        if self.group_debiasers_ is None and np.any(self.slope_[~self.pooled_groups_] < LccDebiaser._WEAK_SLOPE):
+            warning_flags.append("weak_slope")
+            warnings.warn(
+                "LCC calibration slope is small in some groups; inverse calibration may be numerically unstable.",
+                DebiasingWarning,
+                stacklevel=2,
+            )
+        self._set_diagnostics(
+            cal_predictions=cal_predictions_array,
+            residual_std=self.pooled_debiaser_.diagnostics_.residual_std,
+            warning_flags=warning_flags,
+            details={
+                "base_method": template.method_name,
+                "n_groups": int(self.groups_.size),
+                "pooled_groups": n_pooled,
+                "min_group_size": int(self.min_group_size),
+            },
+        )
+        return self
+
+    def _fit_lcc_groups(self, predictions: FloatArray, targets: FloatArray, codes: IntArray) -> None:
+        moments = PairedMoments.from_groups(predictions, targets, codes, self.groups_.size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = moments.comoment / moments.target_m2
+            intercept = moments.prediction_mean - slope * moments.target_mean
+        identifiable = (
+            (moments.count >= self.min_group_size)
+            & ~np.isclose(moments.target_std, 0.0)
+            & ~np.isclose(moments.prediction_std, 0.0)
+            & np.isfinite(slope)
+            & (slope > LccDebiaser._IDENTIFIABLE_SLOPE)
+        )
+        pooled = self.pooled_debiaser_
+        self.group_moments_ = moments
+        self.group_debiasers_ = None
+        self.pooled_groups_ = ~identifiable
+        self.slope_ = np.where(identifiable, slope, pooled.slope_)
+        self.intercept_ = np.where(identifiable, intercept, pooled.intercept_)
+
+    def _fit_group_debiasers(
+        self,
+        template: BaseDebiaser,
+        predictions: FloatArray,
+        targets: FloatArray,
+        codes: IntArray,
+    ) -> None:
+        debiasers: list[Optional[BaseDebiaser]] = []
+        for code, members in enumerate(self._split_by_code(codes)):
+            fitted = None
+            if self.group_sizes_[code] >= self.min_group_size:
+                try:
+                    fitted = template.__class__(**template.get_params()).fit(predictions[members], targets[members])
+                except ValueError:
+                    fitted = None
+            debiasers.append(fitted)
+        self.group_debiasers_ = debiasers
+        self.pooled_groups_ = np.array([debiaser is None for debiaser in debiasers])
+
+    def _get_state(self) -> DebiaserState:
+        arrays = {"groups": self.groups_, "group_sizes": self.group_sizes_, "pooled_groups": self.pooled_groups_}
+        children = {"pooled": self.pooled_debiaser_}
+        if self.group_debiasers_ is None:
+            arrays.update(slope=self.slope_, intercept=self.intercept_)
+            arrays.update(moment_arrays(self.group_moments_, "group_moments_"))
+        else:
+            for code, debiaser in enumerate(self.group_debiasers_):
+                if debiaser is not None:
+                    children[f"group_{code}"] = debiaser
+        return DebiaserState(values={"vectorized": self.group_debiasers_ is None}, arrays=arrays, children=children)
+
+    def _set_state(self, state: DebiaserState) -> None:
+        self.n_columns_ = None
+        self.groups_ = state.arrays["groups"]
+        self.group_sizes_ = state.arrays["group_sizes"]
+        self.pooled_groups_ = state.arrays["pooled_groups"]
+        self.pooled_debiaser_ = state.children["pooled"]
+        if state.values["vectorized"]:
+            self.group_debiasers_ = None
+            self.slope_ = state.arrays["slope"]
+            self.intercept_ = state.arrays["intercept"]
+            self.group_moments_ = moments_from_arrays(PairedMoments, state.arrays, "group_moments_")
+        else:
+            self.group_debiasers_ = [state.children.get(f"group_{code}") for code in range(self.groups_.size)]
+
+    @staticmethod
+    def _split_by_code(codes: IntArray) -> list[IntArray]:
+        order = np.argsort(codes, kind="stable")
+        return np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+
+    def _group_codes(self, groups: ArrayLike, predictions: FloatArray) -> IntArray:
+        """Map group labels to fitted group indices; unseen groups map to ``len(groups_)``."""
+        group_array = np.asarray(groups)
+        if group_array.shape != predictions.shape:
+            raise ValueError("groups must have the same shape as the predictions.")
+        positions = np.minimum(np.searchsorted(self.groups_, group_array), self.groups_.size - 1)
+        seen = self.groups_[positions] == group_array
+        if not np.all(seen):
+            warnings.warn(
+                "Some groups were not seen during calibration; the pooled fit is used for them.",
+                DebiasingWarning,
+                stacklevel=3,
+            )
+        return np.where(seen, positions, self.groups_.size)
+
+    def debiased_predictions(self, predictions: ArrayLike, groups: ArrayLike) -> FloatArray:
+        self._require_is_fit("groups_", "diagnostics_", method_name="debiased_predictions")
+        prediction_array = self._validate_prediction_inputs(predictions)
+        codes = self._group_codes(groups, prediction_array)
+        if self.group_debiasers_ is not None:
+            corrected = np.empty_like(prediction_array)
+            for members in self._split_by_code(codes):
+                code = int(codes[members[0]])
+                debiaser = self.group_debiasers_[code] if code < self.groups_.size else None
+                debiaser = debiaser if debiaser is not None else self.pooled_debiaser_
+                corrected[members] = debiaser.debiased_predictions(prediction_array[members])
+            return corrected
+
+        pooled = self.pooled_debiaser_
+        lower = np.append(
+            np.where(self.pooled_groups_, pooled.diagnostics_.prediction_min, self.group_moments_.prediction_min),
+            pooled.diagnostics_.prediction_min,
+        )
+        upper = np.append(
+            np.where(self.pooled_groups_, pooled.diagnostics_.prediction_max, self.group_moments_.prediction_max),
+            pooled.diagnostics_.prediction_max,
+        )
+        if np.any((prediction_array < lower[codes]) | (prediction_array > upper[codes])):
+            warnings.warn(
+                "Prediction support extends beyond the calibration support; debiasing may be unstable.",
+                DebiasingWarning,
+                stacklevel=2,
+            )
+        slope = np.append(self.slope_, pooled.slope_)
+        intercept = np.append(self.intercept_, pooled.intercept_)
+        return (prediction_array - intercept[codes]) / slope[codes]
+
+    def debiased_mean(self, predictions: ArrayLike, groups: ArrayLike) -> float:
+        self._require_is_fit("diagnostics_", method_name="debiased_mean")
+        return float(np.mean(self.debiased_predictions(predictions, groups)))
+
+    def debiased_ate(
+        self,
+        treated_predictions: ArrayLike,
+        control_predictions: ArrayLike,
+        iptw_treated: Optional[Sequence[float]] = None,
+        iptw_control: Optional[Sequence[float]] = None,
+        *,
+        treated_groups: ArrayLike,
+        control_groups: ArrayLike,
+    ) -> float:
+        """Compute a debiased average treatment effect, correcting each arm with its own group fits."""
+        self._require_is_fit("diagnostics_", method_name="debiased_ate")
+        debiased_treated = self.debiased_predictions(treated_predictions, treated_groups)
+        debiased_control = self.debiased_predictions(control_predictions, control_groups)
+        mean_treated = self._weighted_mean(debiased_treated, iptw_treated, weight_name="iptw_treated")
+        mean_control = self._weighted_mean(debiased_control, iptw_control, weight_name="iptw_control")
+        return float(mean_treated - mean_control)
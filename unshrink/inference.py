@@ -0,0 +1,271 @@
+from __future__ import annotations
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional, Sequence
+import warnings
+
+import numpy as np
+from numpy.random import Generator, SeedSequence, default_rng
+from numpy.typing import ArrayLike, NDArray
+
+from .base import BaseDebiaser
+from .kde import _FFT_RELATIVE_FLOOR, binned_density_grids, gaussian_score, interpolation_matrix
+from .lcc import LccDebiaser
+from .reports import DebiasedEstimate, DebiasingWarning
+from .tweedie import TweedieDebiaser
+from .utils import _check_n_jobs, _run_tasks
+
+FloatArray = NDArray[np.float64]
+
+_INTERVAL_METHODS = ("percentile", "basic", "normal")
+# Tweedie engines whose score the shared-grid bootstrap reproduces; the others are refitted per resample.
+_GRID_ENGINES = ("exact", "truncated", "binned")
+
+
+@dataclass(frozen=True)
+class _BootstrapData:
+    cal_predictions: FloatArray
+    cal_targets: FloatArray
+    treated: FloatArray
+    control: FloatArray
+    iptw_treated: FloatArray
+    iptw_control: FloatArray
+
+
+def _multinomial_counts(rng: Generator, n: int, size: int) -> FloatArray:
+    """Bootstrap resamples of ``n`` observations as a ``(size, n)`` matrix of multiplicities."""
+    return rng.multinomial(n, np.full(n, 1.0 / n), size=size).astype(float)
+
+
+def _resampled_means(
+    rng: Generator,
+    values: FloatArray,
+    weights: FloatArray,
+    size: int,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Resampling weights, their totals, and the weighted means of ``values`` for ``size`` resamples."""
+    resample_weights = _multinomial_counts(rng, values.size, size) * weights
+    totals = resample_weights.sum(axis=1)
+    return resample_weights, totals, resample_weights @ values / totals
+
+
+def _lcc_bootstrap(data: _BootstrapData, rng: Generator, size: int) -> FloatArray:
+    counts = _multinomial_counts(rng, data.cal_predictions.size, size)
+    n = data.cal_predictions.size
+    # Centering at the full-sample means keeps the resampled second moments well conditioned.
+    targets = data.cal_targets - data.cal_targets.mean()
+    predictions = data.cal_predictions - data.cal_predictions.mean()
+    target_mean = counts @ targets / n
+    prediction_mean = counts @ predictions / n
+    target_variance = counts @ (targets * targets) / n - target_mean**2
+    covariance = counts @ (targets * predictions) / n - target_mean * prediction_mean
+    slope = covariance / target_variance
+
+    _, _, treated_mean = _resampled_means(rng, data.treated, data.iptw_treated, size)
+    _, _, control_mean = _resampled_means(rng, data.control, data.iptw_control, size)
+    # The intercept cancels in the difference of the two debiased means.
+    return (treated_mean - control_mean) / slope
+
+
+def _tweedie_bootstrap(
+    data: _BootstrapData,
+    rng: Generator,
+    size: int,
+    *,
+    bandwidth_factor: float,
+    grid_size: int,
+    cutoff: float,
+) -> FloatArray:
+    """
+    Tweedie ATE replicates from one shared grid over the calibration range.
+
+    Each resample gets its own ``sigma`` and its own bandwidth,
+    ``bandwidth_factor`` times its sample standard deviation, as a refit
+    would select them. Trial predictions inside the grid interpolate the
+    resample's gridded score; any beyond it are scored directly from the
+    resample's binned counts. A zero ``bandwidth_factor`` marks a fit with
+    zero ``sigma``, which applies no correction.
+    """
+    counts = _multinomial_counts(rng, data.cal_predictions.size, size)
+    n = data.cal_predictions.size
+    residuals = data.cal_predictions - data.cal_targets
+    residuals = residuals - residuals.mean()
+    residual_mean = counts @ residuals / n
+    sigma_squared = np.maximum(counts @ (residuals * residuals) / n - residual_mean**2, 0.0)
+
+    treated_weights, treated_totals, treated_mean = _resampled_means(rng, data.treated, data.iptw_treated, size)
+    control_weights, control_totals, control_mean = _resampled_means(rng, data.control, data.iptw_control, size)
+    if bandwidth_factor == 0.0:
+        return treated_mean - control_mean
+
+    # The resampled sample standard deviations (ddof=1) come from two matrix-vector products.
+    predictions = data.cal_predictions - data.cal_predictions.mean()
+    prediction_mean = counts @ predictions / n
+    prediction_variance = np.maximum(counts @ (predictions * predictions) / n - prediction_mean**2, 0.0)
+    bandwidths = bandwidth_factor * np.sqrt(prediction_variance * n / (n - 1))
+
+    padding = cutoff * float(bandwidths.max())
+    lower = float(data.cal_predictions.min()) - padding
+    grid = np.linspace(lower, float(data.cal_predictions.max()) + padding, grid_size)
+    spacing = float(grid[1] - grid[0])
+
+    def bin_resamples(values: FloatArray, resample_weights: FloatArray) -> FloatArray:
+        return np.asarray(resample_weights @ interpolation_matrix(values, lower, spacing, grid_size))
+
+    cal_counts = bin_resamples(data.cal_predictions, counts)
+    treated_inside = (data.treated >= grid[0]) & (data.treated <= grid[-1])
+    control_inside = (data.control >= grid[0]) & (data.control <= grid[-1])
+    treated_counts = bin_resamples(data.treated[treated_inside], treated_weights[:, treated_inside])
+    control_counts = bin_resamples(data.control[control_inside], control_weights[:, control_inside])
+    density, derivative = binned_density_grids(cal_counts, grid, bandwidths, cutoff)
+    reliable = density > _FFT_RELATIVE_FLOOR * density.max(axis=1, keepdims=True)
+    scores = np.divide(derivative, density, out=np.zeros_like(density), where=reliable)
+    treated_score = np.einsum("ij,ij->i", treated_counts, scores)
+    control_score = np.einsum("ij,ij->i", control_counts, scores)
+
+    needed = ~reliable & ((treated_counts > 0) | (control_counts > 0))
+    treated_outside, control_outside = data.treated[~treated_inside], data.control[~control_inside]
+    outside = treated_outside.size > 0 or control_outside.size > 0
+    for row in np.flatnonzero(needed.any(axis=1) | outside):
+        occupied = cal_counts[row] > 0
+        kernel = (grid[occupied], bandwidths[row], cal_counts[row, occupied])
+        nodes = needed[row]
+        rescored = gaussian_score(grid[nodes], *kernel) - scores[row, nodes]
+        treated_score[row] += treated_counts[row, nodes] @ rescored
+        control_score[row] += control_counts[row, nodes] @ rescored
+        treated_score[row] += treated_weights[row, ~treated_inside] @ gaussian_score(treated_outside, *kernel)
+        control_score[row] += control_weights[row, ~control_inside] @ gaussian_score(control_outside, *kernel)
+
+    treated_score /= treated_totals
+    control_score /= control_totals
+    return treated_mean - control_mean - sigma_squared * (treated_score - control_score)
+
+
+def _refit_bootstrap(template: BaseDebiaser, data: _BootstrapData, rng: Generator, size: int) -> FloatArray:
+    n = data.cal_predictions.size
+    estimates = np.empty(size)
+    for index in range(size):
+        calibration = np.repeat(np.arange(n), rng.multinomial(n, np.full(n, 1.0 / n)))
+        treated = rng.integers(0, data.treated.size, data.treated.size)
+        control = rng.integers(0, data.control.size, data.control.size)
+        debiaser = template.__class__(**template.get_params())
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DebiasingWarning)
+            debiaser.fit(data.cal_predictions[calibration], data.cal_targets[calibration])
+            estimates[index] = debiaser.debiased_ate(
+                data.treated[treated],
+                data.control[control],
+                iptw_treated=data.iptw_treated[treated],
+                iptw_control=data.iptw_control[control],
+            )
+    return estimates
+
+
+def _bootstrap_batch(fitted: BaseDebiaser, data: _BootstrapData, seed: SeedSequence, size: int) -> FloatArray:
+    rng = default_rng(seed)
+    if isinstance(fitted, LccDebiaser):
+        return _lcc_bootstrap(data, rng, size)
+    if isinstance(fitted, TweedieDebiaser) and fitted.engine in _GRID_ENGINES:
+        bandwidth_factor = fitted._bandwidth_factor(data.cal_predictions.size)
+        if bandwidth_factor is not None:
+            return _tweedie_bootstrap(
+                data,
+                rng,
+                size,
+                bandwidth_factor=0.0 if fitted.sigma_ == 0.0 else bandwidth_factor,
+                grid_size=fitted.grid_size,
+                cutoff=fitted._KERNEL_CUTOFF,
+            )
+    return _refit_bootstrap(fitted, data, rng, size)
+
+
+def debiased_ate_ci(
+    debiaser: BaseDebiaser,
+    cal_predictions: ArrayLike,
+    cal_targets: ArrayLike,
+    treated_predictions: ArrayLike,
+    control_predictions: ArrayLike,
+    iptw_treated: Optional[Sequence[float]] = None,
+    iptw_control: Optional[Sequence[float]] = None,
+    *,
+    n_bootstrap: int = 2000,
+    method: str = "percentile",
+    confidence_level: float = 0.95,
+    random_state: int = 0,
+    batch_size: int = 100,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> DebiasedEstimate:
+    """
+    Debiased ATE with a bootstrap confidence interval.
+
+    ``debiaser`` is an unfitted template; a clone is fitted on the calibration
+    data for the point estimate. Calibration pairs and both trial arms are
+    resampled with multinomial weight matrices, ``batch_size`` resamples at a
+    time. LCC refits become batched moment computations. Tweedie refits with
+    the ``"exact"``, ``"truncated"`` or ``"binned"`` engine and a Scott,
+    Silverman or fixed-factor bandwidth share one binned grid over the
+    calibration range, with ``sigma`` and the bandwidth re-estimated for every
+    resample, so each batch costs a few matrix products and FFTs. Other
+    Tweedie settings (LSCV bandwidths, ``"finite_difference"``,
+    ``"mixture"``) and other debiasers are refitted resample by resample.
+
+    Batches run through ``executor`` (e.g. a ``ProcessPoolExecutor``) or on
+    ``n_jobs`` threads, each with its own ``SeedSequence`` child, so results
+    depend on ``random_state`` and ``batch_size`` but not on the worker count.
+    ``method`` is ``"percentile"``, ``"basic"`` or ``"normal"``.
+    """
+    if n_bootstrap < 2:
+        raise ValueError("n_bootstrap must be at least 2.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive.")
+    if method not in _INTERVAL_METHODS:
+        raise ValueError(f"method must be one of {', '.join(_INTERVAL_METHODS)}.")
+    if not 0.0 < confidence_level < 1.0:
+        raise ValueError("confidence_level must be between 0 and 1.")
+    _check_n_jobs(n_jobs)
+
+    fitted = debiaser.__class__(**debiaser.get_params()).fit(cal_predictions, cal_targets)
+    if getattr(fitted, "n_columns_", None) is not None:
+        raise ValueError("debiased_ate_ci supports 1D calibration data only.")
+    estimate = float(fitted.debiased_ate(treated_predictions, control_predictions, iptw_treated, iptw_control))
+
+    cal_prediction_array, cal_target_array = fitted._validate_calibration_inputs(cal_predictions, cal_targets)
+    treated_array = fitted._as_1d_float_array(treated_predictions, name="treated_predictions")
+    control_array = fitted._as_1d_float_array(control_predictions, name="control_predictions")
+    treated_weights = fitted._validate_weights(treated_array, iptw_treated, name="iptw_treated")
+    control_weights = fitted._validate_weights(control_array, iptw_control, name="iptw_control")
+    data = _BootstrapData(
+        cal_predictions=cal_prediction_array,
+        cal_targets=cal_target_array,
+        treated=treated_array,
+        control=control_array,
+        iptw_treated=np.ones_like(treated_array) if treated_weights is None else treated_weights,
+        iptw_control=np.ones_like(control_array) if control_weights is None else control_weights,
+    )
+
+    sizes = [min(batch_size, n_bootstrap - start) for start in range(0, n_bootstrap, batch_size)]
+    seeds = SeedSequence(random_state).spawn(len(sizes))
+    arguments = [(fitted, data, seed, size) for seed, size in zip(seeds, sizes)]
+    replicates = np.concatenate(_run_tasks(_bootstrap_batch, arguments, n_jobs=n_jobs, executor=executor))
+
+    standard_error = float(np.std(replicates, ddof=1))
+    alpha = 1.0 - confidence_level
+    if method == "normal":
+        half_width = NormalDist().inv_cdf(1.0 - alpha / 2.0) * standard_error
+        lower, upper = estimate - half_width, estimate + half_width
+    else:
+        lower, upper = np.quantile(replicates, [alpha / 2.0, 1.0 - alpha / 2.0])
+        if method == "basic":
+            lower, upper = 2.0 * estimate - upper, 2.0 * estimate - lower
+    return DebiasedEstimate(
+        method=fitted.method_name,
+        estimate=estimate,
+        standard_error=standard_error,
+        ci_lower=float(lower),
+        ci_upper=float(upper),
+        confidence_level=confidence_level,
+        interval_method=method,
+        n_bootstrap=n_bootstrap,
+    )
@@ -0,0 +1,310 @@
+from __future__ import annotations
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+FloatArray = NDArray[np.float64]
+
+# Grid nodes whose binned density falls below this fraction of the peak are
+# re-evaluated directly, since FFT round-off dominates the score there.
+_FFT_RELATIVE_FLOOR = 1e-6
+
+
+def gaussian_score(
+    points: FloatArray,
+    centers: FloatArray,
+    bandwidth: float | FloatArray,
+    weights: FloatArray | None = None,
+) -> FloatArray:
+    """
+    Score d/dx log p(x) of a weighted 1D Gaussian KDE, evaluated in log-sum-exp form.
+
+    2D ``(m, k)`` points with ``(n, k)`` centers and ``k`` bandwidths evaluate
+    ``k`` independent KDEs in one batched pass. Memory use is
+    O(len(points) * len(centers) * k); callers are expected to chunk.
+    """
+    differences = centers[None, ...] - points[:, None, ...]
+    log_kernels = -0.5 * np.square(differences / bandwidth)
+    if weights is not None:
+        with np.errstate(divide="ignore"):
+            log_kernels = log_kernels + np.log(weights)[None, ...]
+    log_kernels -= np.max(log_kernels, axis=1, keepdims=True)
+    kernels = np.exp(log_kernels)
+    numerator = np.sum(kernels * differences, axis=1)
+    denominator = np.sum(kernels, axis=1)
+    return numerator / (denominator * bandwidth**2)
+
+
+def truncated_gaussian_score(
+    points: FloatArray,
+    sorted_centers: FloatArray,
+    bandwidth: float,
+    cutoff: float,
+    block_size: int = 256,
+) -> FloatArray:
+    """
+    Gaussian KDE score restricted to centers within ``cutoff`` bandwidths.
+
+    Points are processed in sorted blocks spanning at most one cutoff radius
+    and ``block_size`` points; each block only sees the slice of
+    ``sorted_centers`` located with ``searchsorted``. The slice reaches one
+    radius past the nearest centers enclosing the block, so every dropped
+    center's kernel weight is below ``exp(-cutoff**2 / 2)`` of the largest one,
+    including for points far outside the support of the centers.
+    """
+    order = np.argsort(points, kind="stable")
+    sorted_points = points[order]
+    radius = cutoff * bandwidth
+    last_center = sorted_centers.size - 1
+    buckets = np.floor((sorted_points - sorted_points[0]) / radius)
+    positions = np.arange(sorted_points.size)
+    boundaries = np.flatnonzero((np.diff(buckets) != 0) | (np.diff(positions // block_size) != 0)) + 1
+    scores = np.empty_like(points, dtype=float)
+    for start, stop in zip(np.r_[0, boundaries], np.r_[boundaries, sorted_points.size]):
+        block = sorted_points[start:stop]
+        left_anchor = sorted_centers[max(int(np.searchsorted(sorted_centers, block[0], side="right")) - 1, 0)]
+        right_anchor = sorted_centers[min(int(np.searchsorted(sorted_centers, block[-1], side="left")), last_center)]
+        lower = int(np.searchsorted(sorted_centers, min(block[0], left_anchor) - radius, side="left"))
+        upper = int(np.searchsorted(sorted_centers, max(block[-1], right_anchor) + radius, side="right"))
+        scores[order[start:stop]] = gaussian_score(block, sorted_centers[lower:upper], bandwidth)
+    return scores
+
+
+def linear_binning(values: FloatArray, grid_min: float, spacing: float, grid_size: int) -> FloatArray:
+    """Spread each value linearly over its two neighbouring grid nodes."""
+    positions = np.clip((values - grid_min) / spacing, 0.0, grid_size - 1.0)
+    lower = np.minimum(np.floor(positions).astype(np.intp), grid_size - 2)
+    fraction = positions - lower
+    counts = np.bincount(lower, weights=1.0 - fraction, minlength=grid_size)
+    counts += np.bincount(lower + 1, weights=fraction, minlength=grid_size)
+    return counts
+
+
+def interpolation_matrix(values: FloatArray, grid_min: float, spacing: float, grid_size: int) -> Any:
+    """
+    Sparse ``(len(values), grid_size)`` matrix of linear-binning weights.
+
+    Row ``i`` holds the weights ``linear_binning`` gives value ``i``, which are
+    also its linear-interpolation weights, so ``counts @ matrix`` bins weighted
+    samples in batch and ``matrix @ grid_values`` interpolates a gridded curve.
+    """
+    from scipy.sparse import csr_matrix
+
+    positions = np.clip((values - grid_min) / spacing, 0.0, grid_size - 1.0)
+    lower = np.minimum(np.floor(positions).astype(np.intp), grid_size - 2)
+    fraction = positions - lower
+    rows = np.arange(values.size)
+    weights = np.concatenate([1.0 - fraction, fraction])
+    indices = (np.concatenate([rows, rows]), np.concatenate([lower, lower + 1]))
+    return csr_matrix((weights, indices), shape=(values.size, grid_size))
+
+
+def binned_density_grids(
+    counts: FloatArray,
+    grid: FloatArray,
+    bandwidth: float | FloatArray,
+    cutoff: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Unnormalized binned KDE density and its derivative on every grid node.
+
+    Both come from one FFT convolution each with a kernel truncated at
+    ``cutoff`` bandwidths. ``counts`` may hold a batch of count vectors along
+    its leading axes, with ``bandwidth`` a scalar or one bandwidth per count
+    vector; the grid is always the last axis.
+    """
+    grid_size = grid.size
+    spacing = float(grid[1] - grid[0])
+    bandwidths = np.asarray(bandwidth, dtype=float)[..., None]
+    half_width = int(min(grid_size - 1, np.ceil(cutoff * np.max(bandwidths) / spacing)))
+    offsets = np.arange(-half_width, half_width + 1) * spacing
+    kernel = np.exp(-0.5 * np.square(offsets / bandwidths))
+    kernel_derivative = -offsets / bandwidths**2 * kernel
+
+    fft_size = 1 << int(np.ceil(np.log2(grid_size + offsets.size - 1)))
+    counts_fft = np.fft.rfft(counts, fft_size, axis=-1)
+    window = slice(half_width, half_width + grid_size)
+    density = np.fft.irfft(counts_fft * np.fft.rfft(kernel, fft_size, axis=-1), fft_size, axis=-1)[..., window]
+    derivative_fft = counts_fft * np.fft.rfft(kernel_derivative, fft_size, axis=-1)
+    derivative = np.fft.irfft(derivative_fft, fft_size, axis=-1)[..., window]
+    return density, derivative
+
+
+def binned_score_grid(counts: FloatArray, grid: FloatArray, bandwidth: float, cutoff: float) -> FloatArray:
+    """
+    Score of the binned Gaussian KDE on every grid node.
+
+    The density and its derivative are obtained with one FFT convolution each,
+    using a kernel truncated at ``cutoff`` bandwidths.
+    """
+    density, derivative = binned_density_grids(counts, grid, bandwidth, cutoff)
+    scores = np.empty(grid.size, dtype=float)
+    reliable = density > _FFT_RELATIVE_FLOOR * density.max()
+    scores[reliable] = derivative[reliable] / density[reliable]
+    if not np.all(reliable):
+        occupied = counts > 0
+        scores[~reliable] = gaussian_score(grid[~reliable], grid[occupied], bandwidth, counts[occupied])
+    return scores
+
+
+class StreamingBinner:
+    """
+    Single-pass linear binning of a stream whose range is not known up front.
+
+    Values are binned onto lattice nodes ``origin + i * spacing``; values
+    beyond the current nodes extend the lattice at the same spacing. When it
+    would exceed ``max_nodes`` the spacing doubles and every odd node's mass
+    is split between its even neighbours, which is exactly linear binning of
+    the node masses. ``counts_on`` re-bins the lattice onto a final grid.
+    """
+
+    def __init__(self, max_nodes: int):
+        self.max_nodes = max_nodes
+        self.origin = 0.0
+        self.spacing = 0.0
+        self.counts = np.zeros(0)
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def add(self, values: FloatArray) -> None:
+        lower, upper = float(np.min(values)), float(np.max(values))
+        self.minimum = min(self.minimum, lower)
+        self.maximum = max(self.maximum, upper)
+        if self.counts.size == 0:
+            span = upper - lower
+            self.origin = lower
+            self.spacing = span / (self.max_nodes // 4) if span > 0.0 else max(abs(lower), 1.0) * 1e-9
+            self.counts = np.zeros(2)
+        while True:
+            left = max(int(np.ceil((self.origin - lower) / self.spacing)), 0)
+            right = max(int(np.ceil((upper - self.origin) / self.spacing)) + 2 - self.counts.size, 0)
+            if self.counts.size + left + right <= self.max_nodes:
+                break
+            self._coarsen()
+        if left or right:
+            self.origin -= left * self.spacing
+            self.counts = np.concatenate([np.zeros(left), self.counts, np.zeros(right)])
+        self.counts += linear_binning(values, self.origin, self.spacing, self.counts.size)
+
+    def _coarsen(self) -> None:
+        counts = self.counts if self.counts.size % 2 else np.append(self.counts, 0.0)
+        coarse = counts[::2].copy()
+        coarse[:-1] += 0.5 * counts[1::2]
+        coarse[1:] += 0.5 * counts[1::2]
+        self.counts = coarse if coarse.size >= 2 else np.append(coarse, 0.0)
+        self.spacing *= 2.0
+
+    def counts_on(self, grid: FloatArray) -> FloatArray:
+        occupied = np.flatnonzero(self.counts)
+        nodes = np.clip(self.origin + occupied * self.spacing, grid[0], grid[-1])
+        return np.asarray(
+            self.counts[occupied] @ interpolation_matrix(nodes, float(grid[0]), float(grid[1] - grid[0]), grid.size)
+        )
+
+
+def _mixture_log_terms(
+    points: FloatArray,
+    weights: FloatArray,
+    means: FloatArray,
+    variances: FloatArray,
+) -> tuple[FloatArray, FloatArray]:
+    """Per-component log joint densities ``(n, K)`` and their log-sum over components."""
+    log_terms = (
+        np.log(weights)
+        - 0.5 * np.log(2.0 * np.pi * variances)
+        - 0.5 * np.square(points[:, None] - means) / variances
+    )
+    peak = log_terms.max(axis=1)
+    return log_terms, peak + np.log(np.exp(log_terms - peak[:, None]).sum(axis=1))
+
+
+def fit_gaussian_mixture(
+    values: FloatArray,
+    counts: FloatArray,
+    n_components: int,
+    *,
+    max_iter: int = 200,
+    tol: float = 1e-6,
+) -> tuple[FloatArray, FloatArray, FloatArray, int, bool]:
+    """
+    EM for a 1D Gaussian mixture on sorted ``values`` with multiplicities ``counts``.
+
+    Components start at evenly spaced weighted quantiles; variances are
+    floored at ``1e-6`` of the total variance so collapsing components stay
+    finite. Iterates until the mean log-likelihood gains less than ``tol``.
+    Returns the weights, means, variances, the number of iterations and
+    whether the log-likelihood converged within ``max_iter`` iterations.
+    """
+    total = float(counts.sum())
+    overall_mean = float(counts @ values) / total
+    overall_variance = float(counts @ np.square(values - overall_mean)) / total
+    floor = 1e-6 * overall_variance
+    quantiles = (np.arange(n_components) + 0.5) / n_components
+    means = np.interp(quantiles, (np.cumsum(counts) - 0.5 * counts) / total, values)
+    variances = np.full(n_components, overall_variance / n_components**2 + floor)
+    weights = np.full(n_components, 1.0 / n_components)
+    previous = -np.inf
+    converged = False
+    for iteration in range(1, max_iter + 1):
+        log_terms, log_density = _mixture_log_terms(values, weights, means, variances)
+        log_likelihood = float(counts @ log_density) / total
+        responsibilities = np.exp(log_terms - log_density[:, None]) * counts[:, None]
+        component_counts = responsibilities.sum(axis=0) + np.finfo(float).tiny
+        weights = component_counts / total
+        means = values @ responsibilities / component_counts
+        variances = np.einsum("ik,ik->k", responsibilities, np.square(values[:, None] - means)) / component_counts
+        variances += floor
+        if log_likelihood - previous < tol:
+            converged = True
+            break
+        previous = log_likelihood
+    return weights, means, variances, iteration, converged
+
+
+def mixture_log_density(
+    points: FloatArray,
+    weights: FloatArray,
+    means: FloatArray,
+    variances: FloatArray,
+) -> FloatArray:
+    """Log density of a Gaussian mixture at every point."""
+    return _mixture_log_terms(points, weights, means, variances)[1]
+
+
+def mixture_score(points: FloatArray, weights: FloatArray, means: FloatArray, variances: FloatArray) -> FloatArray:
+    """
+    ``d/dx log p(x)`` of a Gaussian mixture, i.e. the responsibility-weighted
+    mean of ``(mean_k - x) / variance_k``, in O(K) per point.
+    """
+    log_terms, log_density = _mixture_log_terms(points, weights, means, variances)
+    responsibilities = np.exp(log_terms - log_density[:, None])
+    return responsibilities @ (means / variances) - points * (responsibilities @ (1.0 / variances))
+
+
+def lscv_scores(counts: FloatArray, spacing: float, bandwidths: FloatArray, cutoff: float = 8.0) -> FloatArray:
+    """
+    Least-squares cross-validation score of a Gaussian KDE for every candidate
+    bandwidth, from calibration points linearly binned into ``counts``.
+
+    With ``S(h) = sum_{i,j} phi_h(x_i - x_j)``, the score is
+    ``S(sqrt(2) h) / n**2 - 2 * (S(h) - n * phi_h(0)) / (n * (n - 1))``.
+    Every ``S`` is read off one pairwise-distance histogram, the FFT
+    autocorrelation of ``counts``, so each extra candidate costs O(len(counts)).
+    """
+    n = float(counts.sum())
+    fft_size = 1 << int(np.ceil(np.log2(2 * counts.size - 1)))
+    spectrum = np.fft.rfft(counts, fft_size)
+    pair_counts = np.maximum(np.fft.irfft(spectrum * np.conj(spectrum), fft_size)[: counts.size], 0.0)
+    # Both signs of every non-zero lag, truncated where the widest kernel is negligible.
+    pair_counts[1:] *= 2.0
+    lags = np.arange(counts.size) * spacing
+    within = lags <= cutoff * np.sqrt(2.0) * float(np.max(bandwidths))
+    pair_counts, lags = pair_counts[within], lags[within]
+
+    def pair_sums(widths: FloatArray) -> FloatArray:
+        kernels = np.exp(-0.5 * np.square(lags / widths[:, None])) / (np.sqrt(2.0 * np.pi) * widths[:, None])
+        return kernels @ pair_counts
+
+    self_pairs = n / (np.sqrt(2.0 * np.pi) * bandwidths)
+    return pair_sums(np.sqrt(2.0) * bandwidths) / n**2 - 2.0 * (pair_sums(bandwidths) - self_pairs) / (n * (n - 1.0))
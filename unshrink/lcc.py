@@ -1,19 +1,35 @@
 from __future__ import annotations
+from functools import partial, reduce
+from statistics import NormalDist
+from typing import Optional, Sequence
 import warnings
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from sklearn.linear_model import LinearRegression
 
 from .base import BaseDebiaser
-from .reports import DebiasingWarning
+from .moments import PairedMoments
+from .persistence import DebiaserState, moment_arrays, moments_from_arrays
+from .reports import DebiasedEstimate, DebiasingWarning
 
 FloatArray = NDArray[np.float64]
 
 
+def _column_value(values: ArrayLike, *, index: int) -> float:
+    return float(np.atleast_1d(values)[index])
+
+
 class LccDebiaser(BaseDebiaser):
     """
     Linear Calibration Correction (LCC)
+
+    The fit is the closed-form least-squares regression of predictions on
+    targets, computed from calibration moments. ``partial_fit`` accumulates
+    those moments batch by batch, so the calibration set never has to be held
+    in memory at once.
+
+    2D ``(n, k)`` calibration inputs fit ``k`` independent corrections with one
+    vectorized moment computation; 1D targets are shared by every column.
     """
 
     method_name = "lcc"
@@ -24,58 +40,231 @@ class LccDebiaser(BaseDebiaser):
         pass
 
     def fit(self, cal_predictions: ArrayLike, cal_targets: ArrayLike) -> "LccDebiaser":
-        cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
-            cal_predictions,
-            cal_targets,
+        self._reset_stage_timings()
+        with self._stage("validate") as stage:
+            cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
+                cal_predictions,
+                cal_targets,
+                allow_2d=True,
+            )
+            stage.elements = cal_predictions_array.size
+        with self._stage("moments", cal_predictions_array.size):
+            self.moments_ = PairedMoments.from_arrays(cal_predictions_array, cal_targets_array)
+        self._fit_moments(self.moments_)
+        return self
+
+    def partial_fit(self, cal_predictions: ArrayLike, cal_targets: ArrayLike) -> "LccDebiaser":
+        """
+        Update the fit with another calibration batch.
+
+        The slope, intercept, residual scale and diagnostics are refreshed from
+        the accumulated moments after every batch, so they match a single
+        ``fit`` on all batches seen so far. Raises if the accumulated data are
+        not identifiable, leaving the debiaser unchanged.
+        """
+        self._reset_stage_timings()
+        with self._stage("validate") as stage:
+            cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
+                cal_predictions,
+                cal_targets,
+                allow_2d=True,
+            )
+            stage.elements = cal_predictions_array.size
+        with self._stage("moments", cal_predictions_array.size):
+            batch_moments = PairedMoments.from_arrays(cal_predictions_array, cal_targets_array)
+        if not hasattr(self, "moments_"):
+            moments = batch_moments
+        elif np.shape(self.moments_.target_mean) != np.shape(batch_moments.target_mean):
+            raise ValueError("partial_fit batches must have the same number of columns as earlier batches.")
+        else:
+            moments = self.moments_.merge(batch_moments)
+        self._fit_moments(moments)
+        self.moments_ = moments
+        return self
+
+    def _merge_all(self, others: Sequence[BaseDebiaser]) -> "LccDebiaser":
+        """Combine fits exactly by reducing their calibration moments, then fit once."""
+        for other in others:
+            self._check_mergeable(other, "moments_")
+        merged = self.__class__(**self.get_params())
+        merged.moments_ = reduce(PairedMoments.merge, (other.moments_ for other in others), self.moments_)
+        merged._fit_moments(merged.moments_)
+        merged._inherit_warning_flags(self, *others)
+        return merged
+
+    def debiased_mean_se(
+        self,
+        predictions: ArrayLike,
+        weights: Optional[Sequence[float]] = None,
+        confidence_level: float = 0.95,
+    ) -> DebiasedEstimate:
+        """
+        Debiased (optionally weighted) mean with a delta-method standard error.
+
+        The variance adds the sampling variance of the trial mean and the
+        classical inverse-regression variance of the calibration fit,
+        ``residual_std_**2 / (n * slope_**2) * (1 + (mean - prediction_mean)**2
+        / (slope_**2 * target_var))``, which assumes homoskedastic calibration
+        residuals. Costs O(len(predictions)) on top of the cached moments.
+        """
+        self._require_is_fit("moments_", "diagnostics_", method_name="debiased_mean_se")
+        prediction_array = self._validate_single_column(predictions)
+        self._warn_if_outside_support(prediction_array)
+        mean, mean_variance = self._mean_and_variance(prediction_array, weights, weight_name="weights")
+        moments = self.moments_
+        offset = (mean - moments.prediction_mean) / self.slope_
+        calibration_variance = self.residual_std_**2 / (moments.count * self.slope_**2) * (
+            1.0 + offset**2 / moments.target_std**2
         )
-        target_std = float(np.std(cal_targets_array))
-        prediction_std = float(np.std(cal_predictions_array))
-        if np.isclose(target_std, 0.0):
-            raise ValueError("cal_targets must vary to fit LccDebiaser.")
-        if np.isclose(prediction_std, 0.0):
-            raise ValueError("cal_predictions must vary to fit LccDebiaser.")
+        return self._delta_estimate(
+            (mean - self.intercept_) / self.slope_,
+            mean_variance / self.slope_**2 + calibration_variance,
+            confidence_level,
+        )
+
+    def debiased_ate_se(
+        self,
+        treated_predictions: ArrayLike,
+        control_predictions: ArrayLike,
+        iptw_treated: Optional[Sequence[float]] = None,
+        iptw_control: Optional[Sequence[float]] = None,
+        confidence_level: float = 0.95,
+    ) -> DebiasedEstimate:
+        """
+        Debiased ATE ``(mean_treated - mean_control) / slope_`` with a
+        delta-method standard error covering both arms (with their IPTW
+        weights) and the calibration slope; see ``debiased_mean_se``.
+        """
+        self._require_is_fit("moments_", "diagnostics_", method_name="debiased_ate_se")
+        treated_array = self._validate_single_column(treated_predictions)
+        control_array = self._validate_single_column(control_predictions)
+        self._warn_if_outside_support(treated_array)
+        self._warn_if_outside_support(control_array)
+        treated_mean, treated_variance = self._mean_and_variance(
+            treated_array,
+            iptw_treated,
+            weight_name="iptw_treated",
+        )
+        control_mean, control_variance = self._mean_and_variance(
+            control_array,
+            iptw_control,
+            weight_name="iptw_control",
+        )
+        effect = (treated_mean - control_mean) / self.slope_
+        slope_variance = self.residual_std_**2 / (self.moments_.count * self.moments_.target_std**2 * self.slope_**2)
+        return self._delta_estimate(
+            effect,
+            (treated_variance + control_variance) / self.slope_**2 + effect**2 * slope_variance,
+            confidence_level,
+        )
+
+    def _validate_single_column(self, predictions: ArrayLike) -> FloatArray:
+        if self.n_columns_ is not None:
+            raise ValueError("Delta-method standard errors support 1D fits only.")
+        return self._validate_prediction_inputs(predictions)
+
+    def _mean_and_variance(
+        self,
+        values: FloatArray,
+        weights: Optional[Sequence[float]],
+        *,
+        weight_name: str,
+    ) -> tuple[float, float]:
+        """Weighted mean and the sandwich variance of that mean, treating the weights as fixed."""
+        weight_array = self._validate_weights(values, weights, name=weight_name)
+        if weight_array is None:
+            weight_array = np.ones(values.shape[0])
+        total = float(weight_array.sum())
+        mean = float(np.dot(weight_array, values)) / total
+        spread = weight_array * (values - mean)
+        return mean, float(np.dot(spread, spread)) / total**2
+
+    def _delta_estimate(self, estimate: float, variance: float, confidence_level: float) -> DebiasedEstimate:
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError("confidence_level must be between 0 and 1.")
+        standard_error = float(np.sqrt(variance))
+        half_width = NormalDist().inv_cdf(0.5 + confidence_level / 2.0) * standard_error
+        return DebiasedEstimate(
+            method=self.method_name,
+            estimate=float(estimate),
+            standard_error=standard_error,
+            ci_lower=float(estimate) - half_width,
+            ci_upper=float(estimate) + half_width,
+            confidence_level=confidence_level,
+            interval_method="delta",
+        )
+
+    def _get_state(self) -> DebiaserState:
+        return DebiaserState(arrays=moment_arrays(self.moments_, "moments_"))
 
-        model = LinearRegression()
-        model.fit(cal_targets_array.reshape(-1, 1), cal_predictions_array)
+    def _set_state(self, state: DebiaserState) -> None:
+        self.moments_ = moments_from_arrays(PairedMoments, state.arrays, "moments_")
+        with warnings.catch_warnings():
+            # Weak-slope warnings were raised when the debiaser was fitted.
+            warnings.simplefilter("ignore", DebiasingWarning)
+            self._fit_moments(self.moments_)
 
-        self.intercept_ = float(model.intercept_)
-        self.slope_ = float(model.coef_[0])
+    def _fit_moments(self, moments: PairedMoments) -> None:
+        target_std = moments.target_std
+        prediction_std = moments.prediction_std
+        if np.any(np.isclose(target_std, 0.0)):
+            raise ValueError("cal_targets must vary to fit LccDebiaser.")
+        if np.any(np.isclose(prediction_std, 0.0)):
+            raise ValueError("cal_predictions must vary to fit LccDebiaser.")
 
-        if not np.isfinite(self.slope_) or self.slope_ <= self._IDENTIFIABLE_SLOPE:
+        slope = np.divide(moments.comoment, moments.target_m2)
+        if np.any(~np.isfinite(slope) | (slope <= self._IDENTIFIABLE_SLOPE)):
             raise ValueError("LCC calibration slope must be positive and identifiable.")
+        self.slope_ = self._as_estimate(slope)
+        self.intercept_ = self._as_estimate(moments.prediction_mean - slope * moments.target_mean)
 
-        warning_flags: list[str] = []
-        if self.slope_ < self._WEAK_SLOPE:
-            warning_flags.append("weak_slope")
+        weak_slope = slope < self._WEAK_SLOPE
+        if np.any(weak_slope):
             warnings.warn(
                 "LCC calibration slope is small; inverse calibration may be numerically unstable.",
                 DebiasingWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
 
-        fitted_predictions = model.predict(cal_targets_array.reshape(-1, 1))
-        residuals = cal_predictions_array - fitted_predictions
-        self.residual_std_ = float(np.std(residuals))
-        self.r_squared_ = float(model.score(cal_targets_array.reshape(-1, 1), cal_predictions_array))
-        self._set_diagnostics(
-            cal_predictions=cal_predictions_array,
-            residual_std=self.residual_std_,
-            warning_flags=warning_flags,
-            details={
-                "intercept": self.intercept_,
-                "slope": self.slope_,
-                "prediction_std": prediction_std,
-                "target_std": target_std,
-                "r_squared": self.r_squared_,
-            },
-        )
-        return self
+        explained = np.square(moments.comoment) / moments.target_m2
+        residual_variance = np.maximum(moments.prediction_m2 - explained, 0.0) / moments.count
+        self.residual_std_ = self._as_estimate(np.sqrt(residual_variance))
+        self.r_squared_ = self._as_estimate(explained / moments.prediction_m2)
+        self.n_columns_ = None if np.ndim(slope) == 0 else int(np.size(slope))
+        columns = []
+        for index in range(self.n_columns_ or 1):
+            column = partial(_column_value, index=index)
+            columns.append(
+                self._build_diagnostics(
+                    support=(moments.count, column(moments.prediction_min), column(moments.prediction_max)),
+                    residual_std=column(self.residual_std_),
+                    warning_flags=["weak_slope"] if np.atleast_1d(weak_slope)[index] else [],
+                    details={
+                        "intercept": column(self.intercept_),
+                        "slope": column(self.slope_),
+                        "prediction_std": column(prediction_std),
+                        "target_std": column(target_std),
+                        "r_squared": column(self.r_squared_),
+                    },
+                )
+            )
+        self.diagnostics_ = columns[0] if self.n_columns_ is None else tuple(columns)
 
-    def debiased_predictions(self, predictions: ArrayLike) -> FloatArray:
+    def debiased_predictions(self, predictions: ArrayLike, out: Optional[FloatArray] = None) -> FloatArray:
+        """Return per-observation debiased predictions, in float32 for float32 inputs, optionally into ``out``."""
         self._require_is_fit("slope_", "intercept_", "diagnostics_", method_name="debiased_predictions")
-        prediction_array = self._validate_prediction_inputs(predictions)
+        with self._predict_stage("predict_validate") as stage:
+            prediction_array = self._validate_prediction_inputs(predictions)
+            stage.elements = prediction_array.size
         self._warn_if_outside_support(prediction_array)
-        return (prediction_array - self.intercept_) / self.slope_
+        with self._predict_stage("debias", prediction_array.size):
+            return self._debias(prediction_array, out=self._check_out(out, prediction_array))
+
+    def _debias(self, predictions: FloatArray, out: Optional[FloatArray] = None) -> FloatArray:
+        intercept = np.asarray(self.intercept_, dtype=predictions.dtype)
+        slope = np.asarray(self.slope_, dtype=predictions.dtype)
+        result = np.subtract(predictions, intercept, out=out)
+        return np.divide(result, slope, out=result)
 
 
 LCCDebiaser = LccDebiaser
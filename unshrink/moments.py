@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+FloatArray = NDArray[np.float64]
+IntArray = NDArray[np.intp]
+Moment = Union[float, FloatArray]
+Count = Union[int, IntArray]
+
+
+def _column_dot(left: FloatArray, right: FloatArray) -> FloatArray:
+    return np.einsum("i...,i...->...", left, right)
+
+
+def _as_moment(value: FloatArray) -> Moment:
+    return float(value) if np.ndim(value) == 0 else np.asarray(value, dtype=float)
+
+
+@dataclass(frozen=True)
+class PairedMoments:
+    """
+    Count, means, and centered second (co-)moments of calibration pairs.
+
+    Batches are combined with the pairwise update of Chan, Golub and LeVeque,
+    so moments accumulated over many batches match a single pass over the
+    concatenated data up to rounding. For 2D ``(n, k)`` inputs every field
+    except ``count`` holds one value per column; moments built with
+    ``from_groups`` hold one value per group in every field, ``count`` included.
+    """
+
+    count: Count
+    target_mean: Moment
+    prediction_mean: Moment
+    target_m2: Moment
+    prediction_m2: Moment
+    comoment: Moment
+    prediction_min: Moment
+    prediction_max: Moment
+
+    @classmethod
+    def from_arrays(cls, predictions: FloatArray, targets: FloatArray) -> "PairedMoments":
+        target_mean = np.mean(targets, axis=0)
+        prediction_mean = np.mean(predictions, axis=0)
+        target_centered = targets - target_mean
+        prediction_centered = predictions - prediction_mean
+        return cls(
+            count=int(predictions.shape[0]),
+            target_mean=_as_moment(target_mean),
+            prediction_mean=_as_moment(prediction_mean),
+            target_m2=_as_moment(_column_dot(target_centered, target_centered)),
+            prediction_m2=_as_moment(_column_dot(prediction_centered, prediction_centered)),
+            comoment=_as_moment(_column_dot(target_centered, prediction_centered)),
+            prediction_min=_as_moment(np.min(predictions, axis=0)),
+            prediction_max=_as_moment(np.max(predictions, axis=0)),
+        )
+
+    @classmethod
+    def from_groups(
+        cls,
+        predictions: FloatArray,
+        targets: FloatArray,
+        codes: IntArray,
+        n_groups: int,
+    ) -> "PairedMoments":
+        """
+        Moments of every group at once from integer group ``codes``.
+
+        Sums are accumulated with ``np.bincount`` and extrema with
+        ``reduceat`` over the code-sorted data, so the cost is O(n log n)
+        regardless of the number of groups. Every code in ``[0, n_groups)``
+        must occur at least once.
+        """
+        count = np.bincount(codes, minlength=n_groups)
+        target_mean = np.bincount(codes, weights=targets, minlength=n_groups) / count
+        prediction_mean = np.bincount(codes, weights=predictions, minlength=n_groups) / count
+        target_centered = targets - target_mean[codes]
+        prediction_centered = predictions - prediction_mean[codes]
+        sorted_predictions = predictions[np.argsort(codes, kind="stable")]
+        starts = np.concatenate([[0], np.cumsum(count)[:-1]])
+        return cls(
+            count=count,
+            target_mean=target_mean,
+            prediction_mean=prediction_mean,
+            target_m2=np.bincount(codes, weights=target_centered * target_centered, minlength=n_groups),
+            prediction_m2=np.bincount(codes, weights=prediction_centered * prediction_centered, minlength=n_groups),
+            comoment=np.bincount(codes, weights=target_centered * prediction_centered, minlength=n_groups),
+            prediction_min=np.minimum.reduceat(sorted_predictions, starts),
+            prediction_max=np.maximum.reduceat(sorted_predictions, starts),
+        )
+
+    def merge(self, other: "PairedMoments") -> "PairedMoments":
+        count = self.count + other.count
+        target_delta = other.target_mean - self.target_mean
+        prediction_delta = other.prediction_mean - self.prediction_mean
+        scale = self.count * other.count / count
+        return PairedMoments(
+            count=count,
+            target_mean=self.target_mean + target_delta * other.count / count,
+            prediction_mean=self.prediction_mean + prediction_delta * other.count / count,
+            target_m2=self.target_m2 + other.target_m2 + target_delta**2 * scale,
+            prediction_m2=self.prediction_m2 + other.prediction_m2 + prediction_delta**2 * scale,
+            comoment=self.comoment + other.comoment + target_delta * prediction_delta * scale,
+            prediction_min=_as_moment(np.minimum(self.prediction_min, other.prediction_min)),
+            prediction_max=_as_moment(np.maximum(self.prediction_max, other.prediction_max)),
+        )
+
+    @property
+    def target_std(self) -> Moment:
+        return _as_moment(np.sqrt(self.target_m2 / self.count))
+
+    @property
+    def prediction_std(self) -> Moment:
+        return _as_moment(np.sqrt(self.prediction_m2 / self.count))
+
+
+@dataclass(frozen=True)
+class RunningMoments:
+    """Count, mean, and centered second moment of a single variable, mergeable across batches."""
+
+    count: int
+    mean: float
+    m2: float
+
+    @classmethod
+    def from_array(cls, values: FloatArray) -> "RunningMoments":
+        mean = float(np.mean(values))
+        centered = values - mean
+        return cls(count=int(values.size), mean=mean, m2=float(np.dot(centered, centered)))
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return RunningMoments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta**2 * self.count * other.count / count,
+        )
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.count))
+
+
+def _mix64(bits: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """The splitmix64 finalizer, spreading float bit patterns uniformly over 64 bits."""
+    bits = bits ^ (bits >> np.uint64(30))
+    bits = bits * np.uint64(0xBF58476D1CE4E5B9)
+    bits = bits ^ (bits >> np.uint64(27))
+    bits = bits * np.uint64(0x94D049BB133111EB)
+    return bits ^ (bits >> np.uint64(31))
+
+
+@dataclass(frozen=True)
+class DistinctSketch:
+    """
+    K-minimum-values sketch of the number of distinct values, mergeable
+    across batches. Counts are exact up to ``size`` distinct values; beyond
+    that the relative error is about ``1 / sqrt(size)``.
+    """
+
+    size: int
+    hashes: NDArray[np.uint64]
+
+    @classmethod
+    def from_array(cls, values: FloatArray, size: int = 1024) -> "DistinctSketch":
+        # Adding 0.0 maps -0.0 onto 0.0 so both hash alike.
+        hashes = _mix64(np.ascontiguousarray(values + 0.0, dtype=np.float64).view(np.uint64))
+        # Partition out the smallest hashes instead of sorting them all, widening the cut when duplicates leave
+        # fewer than ``size`` distinct values below it.
+        limit = size
+        while limit < hashes.size:
+            threshold = np.partition(hashes, limit - 1)[limit - 1]
+            smallest = np.unique(hashes[hashes <= threshold])
+            if smallest.size >= size:
+                return cls(size=size, hashes=smallest[:size])
+            limit *= 4
+        return cls(size=size, hashes=np.unique(hashes)[:size])
+
+    def merge(self, other: "DistinctSketch") -> "DistinctSketch":
+        size = min(self.size, other.size)
+        return DistinctSketch(size=size, hashes=np.union1d(self.hashes, other.hashes)[:size])
+
+    @property
+    def estimate(self) -> int:
+        if self.hashes.size < self.size:
+            return int(self.hashes.size)
+        return int(round((self.size - 1) / ((float(self.hashes[-1]) + 1.0) / 2.0**64)))
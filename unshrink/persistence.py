@@ -0,0 +1,162 @@
+from __future__ import annotations
+from dataclasses import dataclass, field, fields
+from importlib import import_module
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .reports import CalibrationDiagnostics
+
+if TYPE_CHECKING:
+    from .base import BaseDebiaser
+
+PathLike = Union[str, "os.PathLike[str]"]
+MomentsT = TypeVar("MomentsT")
+
+# Bump when the artifact layout changes; loaders refuse artifacts from newer versions.
+FORMAT_VERSION = 1
+_METADATA_FILE = "debiaser.json"
+_DEBIASER_CLASSES = ("GroupedDebiaser", "LccDebiaser", "TweedieDebiaser")
+
+
+@dataclass
+class DebiaserState:
+    """Fitted state of a debiaser, split into JSON values, ``.npy`` arrays, and nested debiasers."""
+
+    values: Dict[str, Any] = field(default_factory=dict)
+    arrays: Dict[str, NDArray[Any]] = field(default_factory=dict)
+    children: Dict[str, "BaseDebiaser"] = field(default_factory=dict)
+
+
+def moment_arrays(moments: Any, prefix: str) -> Dict[str, NDArray[Any]]:
+    """Flatten a moments dataclass into named arrays."""
+    return {f"{prefix}{item.name}": np.asarray(getattr(moments, item.name)) for item in fields(moments)}
+
+
+def moments_from_arrays(moments_class: Type[MomentsT], arrays: Dict[str, NDArray[Any]], prefix: str) -> MomentsT:
+    """Rebuild a moments dataclass written by ``moment_arrays``; 0-d arrays become scalars."""
+    values = {}
+    for item in fields(moments_class):
+        value = arrays[f"{prefix}{item.name}"]
+        values[item.name] = value.item() if value.ndim == 0 else np.array(value)
+    return moments_class(**values)
+
+
+def save_debiaser(debiaser: "BaseDebiaser", path: PathLike) -> None:
+    """
+    Write a fitted debiaser to the directory ``path``.
+
+    Scalars, parameters and diagnostics go to ``debiaser.json`` together with
+    the format version; every array is a separate ``.npy`` file so that
+    ``load_debiaser`` can memory-map it. Nested debiasers (columns, groups)
+    are written to subdirectories.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    state = debiaser._get_state()
+    for name, array in state.arrays.items():
+        np.save(directory / f"{name}.npy", np.asarray(array), allow_pickle=False)
+    for name, child in state.children.items():
+        save_debiaser(child, directory / name)
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "class": type(debiaser).__name__,
+        "params": _encode_params(debiaser.get_params()),
+        "values": state.values,
+        "arrays": sorted(state.arrays),
+        "children": sorted(state.children),
+        "diagnostics": _encode_diagnostics(debiaser.diagnostics_),
+    }
+    # The metadata is written last so a partially written artifact is never loadable.
+    with open(directory / _METADATA_FILE, "w", encoding="utf-8") as handle:
+        json.dump(metadata, handle, indent=2, default=_json_default)
+
+
+def load_debiaser(path: PathLike, *, mmap: bool = True) -> "BaseDebiaser":
+    """
+    Load a debiaser written by ``save_debiaser``.
+
+    With ``mmap=True`` arrays are opened read-only with ``np.load(...,
+    mmap_mode="r")``, so processes serving the same artifact share one
+    page-cache copy instead of each holding its own.
+    """
+    directory = Path(path)
+    try:
+        with open(directory / _METADATA_FILE, encoding="utf-8") as handle:
+            metadata = json.load(handle)
+    except FileNotFoundError as exc:
+        raise ValueError(f"{directory} does not contain a saved debiaser.") from exc
+    version = metadata.get("format_version")
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError(
+            f"Saved debiaser format version {version!r} is not supported; "
+            f"this version of unshrink reads up to version {FORMAT_VERSION}."
+        )
+
+    debiaser = _debiaser_class(metadata["class"])(**_decode_params(metadata["params"]))
+    state = DebiaserState(
+        values=metadata["values"],
+        arrays={
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None, allow_pickle=False)
+            for name in metadata["arrays"]
+        },
+        children={name: load_debiaser(directory / name, mmap=mmap) for name in metadata["children"]},
+    )
+    debiaser._set_state(state)
+    debiaser.diagnostics_ = _decode_diagnostics(metadata["diagnostics"])
+    return debiaser
+
+
+def _debiaser_class(name: str) -> Type["BaseDebiaser"]:
+    if name not in _DEBIASER_CLASSES:
+        raise ValueError(f"Saved debiaser class {name!r} is not supported.")
+    return getattr(import_module("unshrink"), name)
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    from .base import BaseDebiaser
+
+    encoded = {}
+    for key, value in params.items():
+        if isinstance(value, BaseDebiaser):
+            value = {"class": type(value).__name__, "params": _encode_params(value.get_params())}
+        encoded[key] = value
+    return encoded
+
+
+def _decode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = {}
+    for key, value in params.items():
+        if isinstance(value, dict) and set(value) == {"class", "params"}:
+            value = _debiaser_class(value["class"])(**_decode_params(value["params"]))
+        decoded[key] = value
+    return decoded
+
+
+def _encode_diagnostics(diagnostics: Any) -> Any:
+    if isinstance(diagnostics, tuple):
+        return [column.to_dict() for column in diagnostics]
+    return diagnostics.to_dict()
+
+
+def _decode_diagnostics(encoded: Any) -> Any:
+    def decode(values: Dict[str, Any]) -> CalibrationDiagnostics:
+        # JSON turns tuples (flags, LSCV curves) into lists.
+        details = {key: tuple(value) if isinstance(value, list) else value for key, value in values["details"].items()}
+        return CalibrationDiagnostics(**{**values, "warning_flags": tuple(values["warning_flags"]), "details": details})
+
+    if isinstance(encoded, list):
+        return tuple(decode(column) for column in encoded)
+    return decode(encoded)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} cannot be saved.")
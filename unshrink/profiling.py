@@ -0,0 +1,112 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Union
+
+from .config import _config
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: str
+    seconds: float
+    elements: int
+
+
+Profiler = Callable[[StageTiming], None]
+StageTimings = Dict[str, Any]
+
+_profiler: Optional[Profiler] = None
+
+
+def set_profiler(profiler: Optional[Profiler]) -> None:
+    """
+    Register ``profiler`` to be called with a ``StageTiming`` at the end of
+    every instrumented stage (validation, moment and KDE construction, score
+    evaluation, fold fitting, ...); ``None`` unregisters it.
+
+    Registering a profiler also records per-stage wall times and element
+    counts of fits in ``diagnostics_.details`` and of comparisons in
+    ``DebiaserComparisonReport.timings``, as does ``set_config(profile=True)``
+    without a callback. Prediction stages are reported to the callback only,
+    so predicting never changes a fitted debiaser. Callbacks run in
+    the process that executes the stage, so folds or resamples on a process
+    pool only report their totals back.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def profiling_enabled() -> bool:
+    return _profiler is not None or _config["profile"]
+
+
+class _StageTimer:
+    """Context manager timing one stage; set ``elements`` inside the block if unknown up front."""
+
+    __slots__ = ("name", "elements", "timings", "start")
+
+    def __init__(self, name: str, elements: int, timings: StageTimings):
+        self.name = name
+        self.elements = elements
+        self.timings = timings
+
+    def __enter__(self) -> "_StageTimer":
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        seconds = perf_counter() - self.start
+        elements = int(self.elements)
+        seconds_key = f"stage_{self.name}_seconds"
+        elements_key = f"stage_{self.name}_elements"
+        self.timings[seconds_key] = self.timings.get(seconds_key, 0.0) + seconds
+        self.timings[elements_key] = self.timings.get(elements_key, 0) + elements
+        if _profiler is not None:
+            _profiler(StageTiming(stage=self.name, seconds=seconds, elements=elements))
+
+
+class _NoStage:
+    """Shared stand-in for ``_StageTimer`` while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoStage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    @property
+    def elements(self) -> int:
+        return 0
+
+    @elements.setter
+    def elements(self, value: int) -> None:
+        pass
+
+
+_NO_STAGE = _NoStage()
+Stage = Union[_StageTimer, _NoStage]
+
+
+def profile_stage(
+    name: str,
+    timings: StageTimings,
+    elements: int = 0,
+    *,
+    enabled: Optional[bool] = None,
+) -> Stage:
+    """
+    Time a stage into ``timings`` as ``stage_<name>_seconds`` and
+    ``stage_<name>_elements`` (accumulated over repeats). When profiling is
+    disabled this returns a shared no-op context, so instrumented code pays
+    one flag check per stage.
+    """
+    if not (profiling_enabled() if enabled is None else enabled):
+        return _NO_STAGE
+    return _StageTimer(name, elements, timings)
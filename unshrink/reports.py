@@ -15,7 +15,7 @@ class CalibrationDiagnostics:
     prediction_max: float
     residual_std: float | None
     warning_flags: tuple[str, ...] = ()
-    details: dict[str, float | int | str | bool | None] = field(default_factory=dict)
+    details: dict[str, float | int | str | bool | tuple[float, ...] | None] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, object]:
         return asdict(self)
@@ -45,6 +45,7 @@ class DebiaserComparisonReport:
     n_contrast_draws: int
     random_state: int
     warning_flags: tuple[str, ...] = ()
+    timings: dict[str, float | int] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -55,4 +56,20 @@ class DebiaserComparisonReport:
             "n_contrast_draws": self.n_contrast_draws,
             "random_state": self.random_state,
             "warning_flags": self.warning_flags,
+            "timings": dict(self.timings),
         }
+
+
+@dataclass(frozen=True)
+class DebiasedEstimate:
+    method: str
+    estimate: float
+    standard_error: float
+    ci_lower: float
+    ci_upper: float
+    confidence_level: float
+    interval_method: str
+    n_bootstrap: int | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
@@ -1,12 +1,28 @@
 from __future__ import annotations
+from collections import OrderedDict
+from functools import reduce
+from typing import Any, Iterable, Sequence
+import threading
 import warnings
 
 import numpy as np
 from numpy.linalg import LinAlgError
 from numpy.typing import ArrayLike, NDArray
-from scipy.stats import gaussian_kde
 
 from .base import BaseDebiaser
+from .kde import (
+    StreamingBinner,
+    binned_score_grid,
+    fit_gaussian_mixture,
+    gaussian_score,
+    linear_binning,
+    lscv_scores,
+    mixture_log_density,
+    mixture_score,
+    truncated_gaussian_score,
+)
+from .moments import DistinctSketch, RunningMoments
+from .persistence import DebiaserState, moment_arrays, moments_from_arrays
 from .reports import DebiasingWarning
 
 FloatArray = NDArray[np.float64]
@@ -15,30 +31,140 @@ FloatArray = NDArray[np.float64]
 class TweedieDebiaser(BaseDebiaser):
     """
     Tweedie's correction
+
+    ``engine`` selects how the KDE score is evaluated:
+
+    - ``"exact"`` (default): the closed-form Gaussian KDE score, i.e. the
+      kernel-weighted mean of ``(x_i - x) / h**2``, computed in a single
+      log-sum-exp stable pass over the calibration predictions. Costs
+      O(n_cal) per prediction and does not use ``delta``.
+    - ``"truncated"``: the exact score restricted to calibration predictions
+      within eight bandwidths of each prediction, located by ``searchsorted``
+      on the sorted calibration set. Cost follows the local calibration
+      density instead of n_cal; every dropped kernel weighs less than
+      ``1e-13`` of the largest one, so results match ``"exact"`` to
+      floating-point tolerance.
+    - ``"finite_difference"``: central differences of ``gaussian_kde.logpdf``
+      with step ``delta``. Costs O(n_cal) per prediction.
+    - ``"binned"``: the calibration predictions are linearly binned onto a grid
+      of ``grid_size`` nodes and convolved with the kernel via FFT at fit time;
+      predictions interpolate the gridded score in O(1) each. The absolute
+      score error is roughly ``0.4 * (spacing / bandwidth) ** 2 / bandwidth``,
+      so below ``1e-3 / bandwidth`` once the grid spacing is under a twentieth
+      of the bandwidth. ``diagnostics_.details["grid_spacing_ratio"]`` reports
+      the fitted spacing-to-bandwidth ratio.
+    - ``"mixture"``: a Gaussian mixture with ``n_components`` components is
+      fitted by EM (on the binned counts once n_cal exceeds ``grid_size``)
+      and its score is evaluated in closed form from the component
+      responsibilities, in O(n_components) per prediction whatever n_cal.
+      ``diagnostics_.details`` reports the mean log-likelihood per calibration
+      point and the largest and root-mean-square absolute gaps to the KDE
+      score over up to 256 rank-spaced calibration points.
+
+    ``bw_method`` sets the KDE bandwidth as a factor of the prediction standard
+    deviation, like ``scipy.stats.gaussian_kde``: ``"scott"`` (default),
+    ``"silverman"``, a positive float, ``"lscv"``, or a sequence of candidate
+    factors. ``"lscv"`` (50 factors from a tenth to twice Scott's) and
+    sequences pick the candidate minimizing least-squares cross-validation.
+    All candidates are scored from one FFT pairwise-distance histogram of the
+    predictions binned on ``grid_size`` nodes, so a sweep costs about one
+    binned fit. The candidates and their scores are recorded in
+    ``diagnostics_.details`` as ``lscv_bandwidths`` and ``lscv_scores``.
+
+    Scores are evaluated in blocks of predictions so the kernel intermediates
+    never exceed ``max_memory`` bytes (256 MiB when unset). ``chunk_size``
+    fixes the number of predictions per block instead.
+
+    2D ``(n, k)`` calibration inputs fit one KDE per column. With the
+    ``"exact"`` engine and no cache, the ``k`` KDEs are evaluated together in
+    one batched kernel pass; other settings score each column separately.
+
+    Except for ``"binned"`` and ``"mixture"``, scores are computed once per
+    distinct prediction value. Setting ``cache_size`` additionally keeps the
+    scores of up to that many recently used values across calls; the cache is
+    cleared on ``fit`` and its hit/miss counts are reported in
+    ``diagnostics_.details``.
+
+    With ``engine="binned"``, ``fit`` also accepts an iterable of
+    ``(predictions, targets)`` chunks in place of ``cal_predictions`` (leaving
+    ``cal_targets`` unset) and fits in one pass with memory independent of
+    the number of rows. Chunks are binned onto a lattice that grows with the
+    observed range and is re-binned onto the final grid, and the bandwidth
+    follows Scott's rule from running prediction moments. The unique count
+    in ``diagnostics_.details`` then comes from a K-minimum-values sketch.
+    Such fits keep no calibration array, so ``sorted_cal_predictions_`` and
+    ``kde_`` are ``None`` and ``merge``/``partial_fit`` are unavailable.
     """
 
     method_name = "tweedie"
+    _ENGINES = ("exact", "truncated", "finite_difference", "binned", "mixture")
+    _KERNEL_CUTOFF = 8.0
+    _DEFAULT_MAX_MEMORY = 256 * 2**20
+    # Number of float64 (block x n_centers) temporaries alive in the kernel evaluation.
+    _KERNEL_TEMPORARIES = 4
+    # Lattice nodes per final grid node kept while binning streamed chunks.
+    _STREAM_LATTICE_FACTOR = 16
+    # Calibration points on which the mixture score is compared with the KDE score.
+    _MIXTURE_PROBES = 256
+    _MIXTURE_MAX_ITER = 200
+    _BW_RULES = ("scott", "silverman", "lscv")
+    # Default LSCV candidates, as multiples of Scott's factor.
+    _LSCV_RANGE = (0.1, 2.0)
+    _LSCV_CANDIDATES = 50
 
-    def __init__(self, delta: float | None = None):
+    def __init__(
+        self,
+        delta: float | None = None,
+        engine: str = "exact",
+        grid_size: int = 4096,
+        chunk_size: int | None = None,
+        max_memory: int | None = None,
+        cache_size: int | None = None,
+        n_components: int = 8,
+        bw_method: str | float | Sequence[float] = "scott",
+    ):
         self.delta = delta
+        self.engine = engine
+        self.grid_size = grid_size
+        self.chunk_size = chunk_size
+        self.max_memory = max_memory
+        self.cache_size = cache_size
+        self.n_components = n_components
+        self.bw_method = bw_method
 
     def fit(
         self,
-        cal_predictions: ArrayLike,
-        cal_targets: ArrayLike,
+        cal_predictions: ArrayLike | Iterable[tuple[ArrayLike, ArrayLike]],
+        cal_targets: ArrayLike | None = None,
         cal_predictions_sigma: ArrayLike | None = None,
         cal_targets_sigma: ArrayLike | None = None,
     ) -> "TweedieDebiaser":
-        cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
-            cal_predictions,
-            cal_targets,
-        )
+        self._reset_stage_timings()
+        if cal_targets is None:
+            if cal_predictions_sigma is not None or cal_targets_sigma is not None:
+                raise ValueError("Separate sigma data is not supported when fitting from chunks.")
+            self._check_params()
+            if self.engine != "binned":
+                raise ValueError("Fitting from (predictions, targets) chunks requires engine='binned'.")
+            self._fit_chunks(cal_predictions)
+            return self
+
+        with self._stage("validate") as stage:
+            cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
+                cal_predictions,
+                cal_targets,
+                allow_2d=True,
+            )
+            stage.elements = cal_predictions_array.size
 
         if cal_predictions_sigma is not None and cal_targets_sigma is not None:
             sigma_prediction_array, sigma_target_array = self._validate_calibration_inputs(
                 cal_predictions_sigma,
                 cal_targets_sigma,
+                allow_2d=True,
             )
+            if sigma_prediction_array.shape[1:] != cal_predictions_array.shape[1:]:
+                raise ValueError("cal_predictions_sigma must have the same number of columns as cal_predictions.")
             sigma_source = "separate"
         elif cal_predictions_sigma is None and cal_targets_sigma is None:
             sigma_prediction_array = cal_predictions_array
@@ -47,44 +173,361 @@ class TweedieDebiaser(BaseDebiaser):
         else:
             raise ValueError("Either both or neither of cal_predictions_sigma and cal_targets_sigma must be provided.")
 
+        self._check_params()
+        if cal_predictions_array.ndim == 2:
+            columns = []
+            for index in range(cal_predictions_array.shape[1]):
+                column = self.__class__(**self.get_params())
+                sigma_arguments = ()
+                if sigma_source == "separate":
+                    sigma_arguments = (sigma_prediction_array[:, index], sigma_target_array[:, index])
+                columns.append(
+                    column.fit(cal_predictions_array[:, index], cal_targets_array[:, index], *sigma_arguments)
+                )
+            self._set_columns(columns)
+            return self
+
+        with self._stage("sigma", sigma_prediction_array.size):
+            residual_moments = RunningMoments.from_array(sigma_prediction_array - sigma_target_array)
+        with self._stage("sort", cal_predictions_array.size):
+            sorted_predictions = np.sort(cal_predictions_array)
+        self._fit_state(sorted_predictions, residual_moments, sigma_source)
+        return self
+
+    def _check_params(self) -> None:
         if self.delta is not None and self.delta <= 0:
             raise ValueError("delta must be positive when provided.")
+        if self.engine not in self._ENGINES:
+            raise ValueError(f"engine must be one of {', '.join(self._ENGINES)}.")
+        if self.grid_size < 16:
+            raise ValueError("grid_size must be at least 16.")
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError("chunk_size must be positive when provided.")
+        if self.max_memory is not None and self.max_memory <= 0:
+            raise ValueError("max_memory must be positive when provided.")
+        if self.cache_size is not None and self.cache_size < 1:
+            raise ValueError("cache_size must be positive when provided.")
+        if self.n_components < 1:
+            raise ValueError("n_components must be positive.")
+        if isinstance(self.bw_method, str):
+            valid_bw_method = self.bw_method in self._BW_RULES
+        elif np.asarray(self.bw_method).dtype.kind == "b":
+            valid_bw_method = False
+        else:
+            factors = np.asarray(self.bw_method, dtype=float)
+            positive = bool(np.all(np.isfinite(factors) & (factors > 0)))
+            valid_bw_method = factors.ndim <= 1 and factors.size > 0 and positive
+        if not valid_bw_method:
+            raise ValueError(
+                "bw_method must be 'scott', 'silverman', 'lscv', a positive factor or a sequence of positive factors."
+            )
+
+    def _fit_chunks(self, chunks: Iterable[tuple[ArrayLike, ArrayLike]]) -> None:
+        """Accumulate binned counts, moments, support and a unique-value sketch over the chunks in one pass."""
+        binner = StreamingBinner(self._STREAM_LATTICE_FACTOR * self.grid_size)
+        residual_moments = prediction_moments = sketch = None
+        for chunk in chunks:
+            try:
+                chunk_predictions, chunk_targets = chunk
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    "cal_predictions must be an iterable of (predictions, targets) chunks when cal_targets is omitted."
+                ) from exc
+            if np.size(chunk_predictions) == 0 and np.size(chunk_targets) == 0:
+                continue
+            with self._stage("validate") as stage:
+                prediction_array, target_array = self._validate_calibration_inputs(chunk_predictions, chunk_targets)
+                stage.elements = prediction_array.size
+            with self._stage("sigma", prediction_array.size):
+                chunk_residuals = RunningMoments.from_array(prediction_array - target_array)
+                chunk_moments = RunningMoments.from_array(prediction_array)
+            with self._stage("bin", prediction_array.size):
+                binner.add(prediction_array)
+                chunk_sketch = DistinctSketch.from_array(prediction_array)
+            if residual_moments is None:
+                residual_moments, prediction_moments, sketch = chunk_residuals, chunk_moments, chunk_sketch
+            else:
+                residual_moments = residual_moments.merge(chunk_residuals)
+                prediction_moments = prediction_moments.merge(chunk_moments)
+                sketch = sketch.merge(chunk_sketch)
+        if residual_moments is None:
+            raise ValueError("cal_predictions must not be empty.")
+        self._fit_state(
+            None,
+            residual_moments,
+            "calibration",
+            prediction_moments=prediction_moments,
+            unique_predictions=sketch.estimate,
+            binner=binner,
+        )
+
+    def partial_fit(
+        self,
+        cal_predictions: ArrayLike,
+        cal_targets: ArrayLike,
+        refresh_bandwidth: bool = True,
+    ) -> "TweedieDebiaser":
+        """
+        Add a calibration batch to the fit; the first call is a plain ``fit``.
+
+        ``sigma_`` is updated from the running residual moments and the sorted
+        batch is merged into ``sorted_cal_predictions_`` without re-sorting the
+        accumulated predictions. With ``refresh_bandwidth=True`` the bandwidth
+        rule is re-applied to the running prediction moments, matching ``fit``
+        on all batches up to rounding (and, for ``"binned"``, grid placement);
+        ``False`` keeps ``bandwidth_``.
+
+        For ``"binned"`` a batch inside the grid is binned into the existing
+        grid counts, and unless an LSCV bandwidth is refreshed, merging it into
+        ``sorted_cal_predictions_`` is deferred until that attribute is next
+        read (by ``save``, ``merge`` or a later batch outside the grid), so the
+        update costs O(batch + grid_size).
+        """
+        if not hasattr(self, "sigma_"):
+            return self.fit(cal_predictions, cal_targets)
+        if self.n_columns_ is None and self.diagnostics_.details["unique_predictions_approximate"]:
+            raise ValueError("partial_fit is unavailable for debiasers fitted from chunks.")
+
+        self._reset_stage_timings()
+        with self._stage("validate") as stage:
+            cal_predictions_array, cal_targets_array = self._validate_calibration_inputs(
+                cal_predictions,
+                cal_targets,
+                allow_2d=True,
+            )
+            stage.elements = cal_predictions_array.size
+        n_columns = cal_predictions_array.shape[1] if cal_predictions_array.ndim == 2 else None
+        if n_columns != self.n_columns_:
+            raise ValueError("partial_fit batches must have the same number of columns as earlier batches.")
+
+        if n_columns is not None:
+            for index, column in enumerate(self.column_debiasers_):
+                column.partial_fit(
+                    cal_predictions_array[:, index],
+                    cal_targets_array[:, index],
+                    refresh_bandwidth=refresh_bandwidth,
+                )
+            self._set_columns(self.column_debiasers_)
+            return self
+
+        with self._stage("sigma", cal_predictions_array.size):
+            residual_moments = self.residual_moments_.merge(
+                RunningMoments.from_array(cal_predictions_array - cal_targets_array)
+            )
+        bandwidth = None if refresh_bandwidth or self.bandwidth_ == 0.0 else self.bandwidth_
+        gridded = self.engine == "binned" and self.bandwidth_ != 0.0
+        with self._stage("sort", cal_predictions_array.size):
+            batch = np.sort(cal_predictions_array)
+            prediction_moments = self.prediction_moments_.merge(RunningMoments.from_array(batch))
+            unique_predictions = self._count_unique(batch)
+            deferred = (
+                gridded
+                and self.grid_[0] <= batch[0]
+                and batch[-1] <= self.grid_[-1]
+                and (bandwidth is not None or self._bandwidth_factor(prediction_moments.count) is not None)
+            )
+            if deferred:
+                pending = self.__dict__.get("pending_cal_predictions_")
+                pending = batch if pending is None else self._merge_sorted(pending, batch)
+                sorted_predictions = self.__dict__["sorted_cal_predictions_"]
+                support = (
+                    prediction_moments.count,
+                    min(self.diagnostics_.prediction_min, float(batch[0])),
+                    max(self.diagnostics_.prediction_max, float(batch[-1])),
+                )
+            else:
+                sorted_predictions = self._merge_sorted(self.sorted_cal_predictions_, batch)
+                support = None
+        source = self.diagnostics_.details["sigma_source"]
+        self._fit_state(
+            sorted_predictions,
+            residual_moments,
+            "calibration" if source == "calibration" else "mixed",
+            prediction_moments=prediction_moments,
+            unique_predictions=unique_predictions,
+            bandwidth=bandwidth,
+            grid_batch=batch if gridded else None,
+            support=support,
+        )
+        if deferred:
+            self.pending_cal_predictions_ = pending
+        return self
+
+    @property
+    def sorted_cal_predictions_(self) -> FloatArray | None:
+        """
+        The sorted calibration predictions, or ``None`` after a fit from chunks.
+        Batches whose merge a binned ``partial_fit`` deferred are merged in here.
+        """
+        state = self.__dict__
+        if "sorted_cal_predictions_" not in state:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute 'sorted_cal_predictions_'")
+        pending = state.pop("pending_cal_predictions_", None)
+        if pending is not None:
+            state["sorted_cal_predictions_"] = self._merge_sorted(state["sorted_cal_predictions_"], pending)
+        return state["sorted_cal_predictions_"]
+
+    @sorted_cal_predictions_.setter
+    def sorted_cal_predictions_(self, value: FloatArray | None) -> None:
+        self.__dict__.pop("pending_cal_predictions_", None)
+        self.__dict__["sorted_cal_predictions_"] = value
+
+    @staticmethod
+    def _merge_sorted(current: FloatArray, batch: FloatArray) -> FloatArray:
+        """Merge a sorted batch into sorted predictions without re-sorting them."""
+        return np.insert(current, np.searchsorted(current, batch, side="right"), batch)
+
+    def _count_unique(self, batch: FloatArray) -> int:
+        """The unique prediction count once the sorted ``batch`` is added, including deferred batches."""
+        values = batch[np.concatenate([[True], np.diff(batch) != 0])]
+        unseen = np.ones(values.size, dtype=bool)
+        pending = self.__dict__.get("pending_cal_predictions_")
+        for known in (self.__dict__["sorted_cal_predictions_"], pending):
+            if known is not None:
+                positions = np.minimum(np.searchsorted(known, values), known.size - 1)
+                unseen &= known[positions] != values
+        return int(self.diagnostics_.details["unique_predictions"]) + int(np.count_nonzero(unseen))
+
+    def _set_columns(self, columns: list["TweedieDebiaser"]) -> None:
+        self.column_debiasers_ = columns
+        self.n_columns_ = len(columns)
+        self.sigma_ = np.array([column.sigma_ for column in columns])
+        self.bandwidth_ = np.array([column.bandwidth_ for column in columns])
+        self.sorted_cal_predictions_ = np.column_stack([column.sorted_cal_predictions_ for column in columns])
+        self.diagnostics_ = tuple(column.diagnostics_ for column in columns)
+
+    def _merge_all(self, others: Sequence[BaseDebiaser]) -> "TweedieDebiaser":
+        """
+        Combine fits as if fitted on the concatenated calibration sets.
+
+        ``sigma_`` is pooled exactly from the residual moments of all fits and
+        the KDE, including its bandwidth, is rebuilt once on the predictions of
+        every shard, concatenated and sorted in one pass.
+        """
+        merged = self.__class__(**self.get_params())
+        if getattr(self, "n_columns_", None) is not None:
+            for other in others:
+                self._check_mergeable(other, "column_debiasers_")
+            merged._set_columns(
+                [
+                    column._merge_all([other.column_debiasers_[index] for other in others])
+                    for index, column in enumerate(self.column_debiasers_)
+                ]
+            )
+            return merged
+
+        for other in others:
+            self._check_mergeable(other, "sorted_cal_predictions_", "residual_moments_")
+        shards = [self, *others]
+        if any(shard.sorted_cal_predictions_ is None for shard in shards):
+            raise ValueError("merge is unavailable for debiasers fitted from chunks.")
+        sources = {str(shard.diagnostics_.details["sigma_source"]) for shard in shards}
+        merged._fit_state(
+            np.sort(np.concatenate([shard.sorted_cal_predictions_ for shard in shards])),
+            reduce(RunningMoments.merge, (other.residual_moments_ for other in others), self.residual_moments_),
+            sources.pop() if len(sources) == 1 else "mixed",
+        )
+        merged._inherit_warning_flags(*shards)
+        return merged
 
-        sigma_residuals = sigma_prediction_array - sigma_target_array
-        self.sigma_ = float(np.std(sigma_residuals))
+    def _fit_state(
+        self,
+        sorted_predictions: FloatArray | None,
+        residual_moments: RunningMoments,
+        sigma_source: str,
+        *,
+        prediction_moments: RunningMoments | None = None,
+        unique_predictions: int | None = None,
+        bandwidth: float | None = None,
+        grid_batch: FloatArray | None = None,
+        binner: StreamingBinner | None = None,
+        support: tuple[int, float, float] | None = None,
+    ) -> None:
+        """
+        Fit everything downstream of the sorted predictions. ``partial_fit``
+        passes its running prediction moments and unique count, an optional
+        fixed ``bandwidth``, the new ``grid_batch`` to bin into the grid, and
+        the ``support`` when batches are not yet merged into the predictions;
+        chunked fits pass no predictions but their ``binner`` instead.
+        """
+        self.n_columns_ = None
+        self.residual_moments_ = residual_moments
+        self.sigma_ = residual_moments.std
         if not np.isfinite(self.sigma_) or self.sigma_ < 0.0:
             raise ValueError("Estimated sigma must be finite and non-negative.")
 
         warning_flags: list[str] = []
-        prediction_std = float(np.std(cal_predictions_array))
-        unique_predictions = int(np.unique(cal_predictions_array).size)
+        bandwidth_details: dict[str, Any] = {}
+        mixture_details: dict[str, float | int | bool] = {}
+        self.sorted_cal_predictions_ = sorted_predictions
+        if sorted_predictions is None:
+            assert binner is not None and prediction_moments is not None and unique_predictions is not None
+            support = (prediction_moments.count, binner.minimum, binner.maximum)
+        elif support is None:
+            support = (sorted_predictions.size, sorted_predictions[0], sorted_predictions[-1])
+        if prediction_moments is None:
+            prediction_moments = RunningMoments.from_array(sorted_predictions)
+        if unique_predictions is None:
+            unique_predictions = int(np.count_nonzero(np.diff(sorted_predictions))) + 1
+        self.prediction_moments_ = prediction_moments
+        prediction_std = prediction_moments.std
         if self.sigma_ == 0.0:
             self.kde_ = None
             self.delta_ = 0.0
+            self.bandwidth_ = 0.0
             warning_flags.append("zero_sigma_identity")
         else:
             if unique_predictions < 2 or np.isclose(prediction_std, 0.0):
                 raise ValueError(
                     "cal_predictions must contain at least two unique values to fit TweedieDebiaser."
                 )
-            try:
-                self.kde_ = gaussian_kde(cal_predictions_array)
-            except (LinAlgError, ValueError) as exc:
-                raise ValueError(
-                    "Unable to fit the Tweedie KDE. Check for singular or near-constant calibration predictions."
-                ) from exc
-            self.delta_ = self._resolve_delta(cal_predictions_array)
+            # gaussian_kde scales the ddof=1 sample standard deviation by a factor, n ** -0.2 for Scott's rule.
+            sample_std = np.sqrt(prediction_moments.m2 / (prediction_moments.count - 1))
+            if bandwidth is None:
+                with self._stage("bandwidth", support[0]):
+                    bandwidth, bandwidth_details = self._select_bandwidth(
+                        sorted_predictions, binner, sample_std, support
+                    )
+                if bandwidth_details.get("lscv_at_boundary"):
+                    warning_flags.append("lscv_boundary")
+                    warnings.warn(
+                        "The LSCV bandwidth lies at the edge of the candidate grid; consider widening bw_method.",
+                        DebiasingWarning,
+                        stacklevel=3,
+                    )
+            self.bandwidth_ = float(bandwidth)
+            # Only finite differences evaluate a gaussian_kde; the other engines score from the bandwidth.
+            self.kde_ = None
+            self.delta_ = None
+            if self.engine == "finite_difference":
+                with self._stage("kde", sorted_predictions.size):
+                    self.kde_ = self._build_kde(sorted_predictions, bandwidth / sample_std)
+                self.delta_ = self._resolve_delta(prediction_std)
+            if self.engine == "binned":
+                with self._stage("grid", self.grid_size):
+                    self._fit_grid(sorted_predictions, grid_batch, binner)
+            elif self.engine == "mixture":
+                with self._stage("mixture", sorted_predictions.size):
+                    mixture_details = self._fit_mixture(sorted_predictions)
+                if not mixture_details["mixture_converged"]:
+                    warning_flags.append("em_not_converged")
+                    warnings.warn(
+                        "The mixture EM stopped before converging; the mixture scores may be inaccurate.",
+                        DebiasingWarning,
+                        stacklevel=3,
+                    )
 
-        if cal_predictions_array.size < 100:
+        if support[0] < 100:
             warning_flags.append("small_calibration_sample")
             warnings.warn(
                 "TweedieDebiaser is fitted on a small calibration sample; KDE-based corrections may be noisy.",
                 DebiasingWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
 
+        self._reset_cache()
         self._set_diagnostics(
-            cal_predictions=cal_predictions_array,
+            support=support,
             residual_std=self.sigma_,
             warning_flags=warning_flags,
             details={
@@ -92,27 +535,367 @@ class TweedieDebiaser(BaseDebiaser):
                 "delta": self.delta_,
                 "prediction_std": prediction_std,
                 "unique_predictions": unique_predictions,
+                "unique_predictions_approximate": sorted_predictions is None,
                 "sigma_source": sigma_source,
+                "engine": self.engine,
+                "bandwidth": self.bandwidth_,
+                "grid_spacing_ratio": self._grid_spacing_ratio(),
+                "score_cache_hits": self.cache_hits_,
+                "score_cache_misses": self.cache_misses_,
+                **bandwidth_details,
+                **mixture_details,
             },
         )
-        return self
 
-    def _resolve_delta(self, cal_predictions: FloatArray) -> float:
+    def _select_bandwidth(
+        self,
+        sorted_predictions: FloatArray | None,
+        binner: StreamingBinner | None,
+        sample_std: float,
+        support: tuple[int, float, float],
+    ) -> tuple[float, dict[str, Any]]:
+        """Resolve ``bw_method`` to a bandwidth and its diagnostics."""
+        count = support[0]
+        method = self.bw_method
+        factor = self._bandwidth_factor(count)
+        if factor is not None:
+            return sample_std * factor, {"bw_method": method if isinstance(method, str) else "factor"}
+
+        if isinstance(method, str):
+            factors = count**-0.2 * np.geomspace(*self._LSCV_RANGE, self._LSCV_CANDIDATES)
+        else:
+            factors = np.sort(np.atleast_1d(np.asarray(method, dtype=float)))
+        bandwidths = sample_std * factors
+        if binner is not None:
+            counts, spacing = binner.counts, binner.spacing
+        else:
+            assert sorted_predictions is not None
+            spacing = (support[2] - support[1]) / (self.grid_size - 1)
+            counts = linear_binning(sorted_predictions, support[1], spacing, self.grid_size)
+        scores = lscv_scores(counts, spacing, bandwidths, self._KERNEL_CUTOFF)
+        best = int(np.argmin(scores))
+        return float(bandwidths[best]), {
+            "bw_method": "lscv",
+            "lscv_bandwidths": tuple(bandwidths.tolist()),
+            "lscv_scores": tuple(scores.tolist()),
+            "lscv_at_boundary": factors.size > 1 and best in (0, factors.size - 1),
+        }
+
+    def _bandwidth_factor(self, count: int) -> float | None:
+        """The bandwidth as a multiple of the sample standard deviation, or ``None`` when it is chosen by LSCV."""
+        method = self.bw_method
+        if isinstance(method, str):
+            return {"scott": count**-0.2, "silverman": (0.75 * count) ** -0.2}.get(method)
+        if np.ndim(method) == 0:
+            return float(method)
+        return None
+
+    def _fit_mixture(self, sorted_predictions: FloatArray) -> dict[str, float | int | bool]:
+        if sorted_predictions.size > self.grid_size:
+            nodes = np.linspace(sorted_predictions[0], sorted_predictions[-1], self.grid_size)
+            counts = linear_binning(sorted_predictions, float(nodes[0]), float(nodes[1] - nodes[0]), self.grid_size)
+            occupied = counts > 0
+            nodes, counts = nodes[occupied], counts[occupied]
+        else:
+            nodes, counts = sorted_predictions, np.ones_like(sorted_predictions)
+        weights, means, variances, iterations, converged = fit_gaussian_mixture(
+            nodes,
+            counts,
+            self.n_components,
+            max_iter=self._MIXTURE_MAX_ITER,
+        )
+        self.mixture_weights_, self.mixture_means_, self.mixture_variances_ = weights, means, variances
+        components = (self.mixture_weights_, self.mixture_means_, self.mixture_variances_)
+
+        block_rows = self._block_rows(self.n_components)
+        log_likelihood = 0.0
+        for start in range(0, sorted_predictions.size, block_rows):
+            block = sorted_predictions[start : start + block_rows]
+            log_likelihood += float(np.sum(mixture_log_density(block, *components)))
+        ranks = np.linspace(0, sorted_predictions.size - 1, min(sorted_predictions.size, self._MIXTURE_PROBES))
+        probes = np.unique(sorted_predictions[ranks.astype(np.intp)])
+        kde_scores = truncated_gaussian_score(probes, sorted_predictions, self.bandwidth_, self._KERNEL_CUTOFF)
+        deviations = np.abs(mixture_score(probes, *components) - kde_scores)
+        return {
+            "n_components": self.n_components,
+            "mixture_iterations": iterations,
+            "mixture_converged": converged,
+            "mixture_log_likelihood": log_likelihood / sorted_predictions.size,
+            "mixture_max_score_deviation": float(np.max(deviations)),
+            "mixture_rms_score_deviation": float(np.sqrt(np.mean(np.square(deviations)))),
+        }
+
+    @staticmethod
+    def _build_kde(sorted_predictions: FloatArray, bw_method: float | None = None) -> Any:
+        from scipy.stats import gaussian_kde
+
+        try:
+            return gaussian_kde(sorted_predictions, bw_method=bw_method)
+        except (LinAlgError, ValueError) as exc:
+            raise ValueError(
+                "Unable to fit the Tweedie KDE. Check for singular or near-constant calibration predictions."
+            ) from exc
+
+    def _reset_cache(self) -> None:
+        self.cache_lock_ = threading.Lock()
+        self.score_cache_: OrderedDict[float, float] = OrderedDict()
+        self.cache_hits_ = 0
+        self.cache_misses_ = 0
+
+    def _get_state(self) -> DebiaserState:
+        if self.n_columns_ is not None:
+            return DebiaserState(
+                values={"n_columns": self.n_columns_},
+                children={f"column_{index}": column for index, column in enumerate(self.column_debiasers_)},
+            )
+        arrays = {
+            **moment_arrays(self.residual_moments_, "residual_moments_"),
+            **moment_arrays(self.prediction_moments_, "prediction_moments_"),
+        }
+        if self.sorted_cal_predictions_ is not None:
+            arrays["sorted_cal_predictions"] = self.sorted_cal_predictions_
+        if self.engine == "binned" and self.sigma_ != 0.0:
+            arrays.update(grid=self.grid_, grid_counts=self.grid_counts_, grid_scores=self.grid_scores_)
+        if self.engine == "mixture" and self.sigma_ != 0.0:
+            arrays.update(
+                mixture_weights=self.mixture_weights_,
+                mixture_means=self.mixture_means_,
+                mixture_variances=self.mixture_variances_,
+            )
+        return DebiaserState(values={"delta": self.delta_, "bandwidth": self.bandwidth_}, arrays=arrays)
+
+    def _set_state(self, state: DebiaserState) -> None:
+        """
+        Restore a saved fit around the (possibly memory-mapped) arrays without
+        copying them. Only ``"finite_difference"`` evaluates a
+        ``gaussian_kde``, so only it rebuilds ``kde_`` (and imports scipy);
+        binned grids and mixtures are used as saved.
+        """
+        if "n_columns" in state.values:
+            n_columns = int(state.values["n_columns"])
+            self._set_columns([state.children[f"column_{index}"] for index in range(n_columns)])
+            return
+        self.n_columns_ = None
+        self.residual_moments_ = moments_from_arrays(RunningMoments, state.arrays, "residual_moments_")
+        self.sigma_ = self.residual_moments_.std
+        self.sorted_cal_predictions_ = state.arrays.get("sorted_cal_predictions")
+        if "prediction_moments_count" in state.arrays:
+            self.prediction_moments_ = moments_from_arrays(RunningMoments, state.arrays, "prediction_moments_")
+        else:
+            self.prediction_moments_ = RunningMoments.from_array(self.sorted_cal_predictions_)
+        self.delta_ = state.values["delta"]
+        self.bandwidth_ = float(state.values["bandwidth"])
+        self.kde_ = self._restore_kde()
+        if "grid" in state.arrays:
+            self.grid_ = state.arrays["grid"]
+            self.grid_counts_ = state.arrays["grid_counts"]
+            self.grid_scores_ = state.arrays["grid_scores"]
+        if "mixture_means" in state.arrays:
+            self.mixture_weights_ = state.arrays["mixture_weights"]
+            self.mixture_means_ = state.arrays["mixture_means"]
+            self.mixture_variances_ = state.arrays["mixture_variances"]
+        self._reset_cache()
+
+    def _restore_kde(self) -> Any:
+        """Rebuild ``kde_`` from the stored predictions and ``bandwidth_`` (``None`` unless finite differences)."""
+        if self.engine != "finite_difference" or self.sigma_ == 0.0:
+            return None
+        moments = self.prediction_moments_
+        sample_std = np.sqrt(moments.m2 / (moments.count - 1))
+        return self._build_kde(self.sorted_cal_predictions_, self.bandwidth_ / sample_std)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # A gaussian_kde with a numeric bandwidth factor holds a local lambda and a lock cannot be
+        # pickled, so both are left out and rebuilt on unpickling.
+        state = self.__dict__.copy()
+        state.pop("cache_lock_", None)
+        if state.get("kde_") is not None:
+            state["kde_"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if "score_cache_" in state:
+            self.cache_lock_ = threading.Lock()
+        if "kde_" in state and self.n_columns_ is None:
+            self.kde_ = self._restore_kde()
+
+    def _resolve_delta(self, prediction_std: float) -> float:
         if self.delta is not None:
             return float(self.delta)
-        scale = max(float(np.std(cal_predictions)), np.finfo(float).eps ** 0.5)
+        scale = max(prediction_std, np.finfo(float).eps ** 0.5)
         return max(scale * 1e-3, 1e-8)
 
-    def _score(self, predictions: FloatArray) -> FloatArray:
-        if self.kde_ is None or self.sigma_ == 0.0:
-            return np.zeros_like(predictions)
+    def _fit_grid(
+        self,
+        cal_predictions: FloatArray | None,
+        batch: FloatArray | None = None,
+        binner: StreamingBinner | None = None,
+    ) -> None:
+        """
+        Bin onto a fresh grid, or add a sorted ``batch`` to the current counts
+        when it fits inside the grid. Chunked fits re-bin their ``binner``.
+        """
+        if batch is not None and getattr(self, "grid_counts_", None) is not None and (
+            self.grid_[0] <= batch[0] and batch[-1] <= self.grid_[-1]
+        ):
+            spacing = float(self.grid_[1] - self.grid_[0])
+            self.grid_counts_ = self.grid_counts_ + linear_binning(batch, float(self.grid_[0]), spacing, self.grid_size)
+        else:
+            if binner is not None:
+                lower, upper = binner.minimum, binner.maximum
+            else:
+                lower, upper = float(np.min(cal_predictions)), float(np.max(cal_predictions))
+            padding = self._KERNEL_CUTOFF * self.bandwidth_
+            self.grid_ = np.linspace(lower - padding, upper + padding, self.grid_size)
+            spacing = float(self.grid_[1] - self.grid_[0])
+            if binner is not None:
+                self.grid_counts_ = binner.counts_on(self.grid_)
+            else:
+                self.grid_counts_ = linear_binning(cal_predictions, float(self.grid_[0]), spacing, self.grid_size)
+        self.grid_scores_ = binned_score_grid(
+            self.grid_counts_,
+            self.grid_,
+            self.bandwidth_,
+            self._KERNEL_CUTOFF,
+        )
+
+    def _grid_spacing_ratio(self) -> float | None:
+        if self.engine != "binned" or self.bandwidth_ == 0.0:
+            return None
+        return float((self.grid_[1] - self.grid_[0]) / self.bandwidth_)
+
+    def _binned_score(self, predictions: FloatArray) -> FloatArray:
+        scores = np.interp(predictions, self.grid_, self.grid_scores_)
+        outside = (predictions < self.grid_[0]) | (predictions > self.grid_[-1])
+        if np.any(outside):
+            occupied = self.grid_counts_ > 0
+            scores[outside] = gaussian_score(
+                predictions[outside],
+                self.grid_[occupied],
+                self.bandwidth_,
+                self.grid_counts_[occupied],
+            )
+        return scores
+
+    def _block_rows(self, n_centers: int) -> int:
+        if self.chunk_size is not None:
+            return int(self.chunk_size)
+        budget = self.max_memory if self.max_memory is not None else self._DEFAULT_MAX_MEMORY
+        row_bytes = n_centers * np.dtype(float).itemsize * self._KERNEL_TEMPORARIES
+        return max(1, int(budget // row_bytes))
+
+    def _score_block(self, predictions: FloatArray, block_rows: int) -> FloatArray:
+        if self.engine == "exact":
+            return gaussian_score(predictions, self.sorted_cal_predictions_, self.bandwidth_)
+        if self.engine == "truncated":
+            return truncated_gaussian_score(
+                predictions,
+                self.sorted_cal_predictions_,
+                self.bandwidth_,
+                self._KERNEL_CUTOFF,
+                block_size=min(block_rows, 256),
+            )
+        if self.engine == "binned":
+            return self._binned_score(predictions)
+        if self.engine == "mixture":
+            return mixture_score(predictions, self.mixture_weights_, self.mixture_means_, self.mixture_variances_)
         log_p_plus = self.kde_.logpdf(predictions + self.delta_)
         log_p_minus = self.kde_.logpdf(predictions - self.delta_)
         return (log_p_plus - log_p_minus) / (2.0 * self.delta_)
 
-    def debiased_predictions(self, predictions: ArrayLike) -> FloatArray:
+    def _evaluate_scores(self, predictions: FloatArray) -> FloatArray:
+        scores = np.empty_like(predictions)
+        if self.engine == "binned":
+            n_centers = self.grid_size
+        elif self.engine == "mixture":
+            n_centers = self.n_components
+        else:
+            n_centers = self.sorted_cal_predictions_.size
+        block_rows = self._block_rows(n_centers)
+        for start in range(0, predictions.size, block_rows):
+            block = slice(start, start + block_rows)
+            scores[block] = self._score_block(predictions[block], block_rows)
+        return scores
+
+    def _cached_scores(self, values: FloatArray) -> FloatArray:
+        """
+        Scores through the LRU cache. Scores are computed and cached in float64
+        whatever the input dtype, so results do not depend on earlier calls;
+        ``cache_lock_`` serialises cache access between threads.
+        """
+        assert self.cache_size is not None
+        scores = np.empty(values.shape)
+        missing: list[int] = []
+        with self.cache_lock_:
+            for index, value in enumerate(values.tolist()):
+                cached = self.score_cache_.get(value)
+                if cached is None:
+                    missing.append(index)
+                else:
+                    self.score_cache_.move_to_end(value)
+                    scores[index] = cached
+        if missing:
+            missing_index = np.asarray(missing, dtype=np.intp)
+            scores[missing_index] = self._evaluate_scores(values[missing_index].astype(np.float64))
+        with self.cache_lock_:
+            if missing:
+                self.score_cache_.update(zip(values[missing_index].tolist(), scores[missing_index].tolist()))
+                while len(self.score_cache_) > self.cache_size:
+                    self.score_cache_.popitem(last=False)
+            self.cache_hits_ += values.size - len(missing)
+            self.cache_misses_ += len(missing)
+            self._update_diagnostics(score_cache_hits=self.cache_hits_, score_cache_misses=self.cache_misses_)
+        return scores.astype(values.dtype, copy=False)
+
+    def _score(self, predictions: FloatArray) -> FloatArray:
+        if self.sigma_ == 0.0:
+            return np.zeros_like(predictions)
+        if self.engine in ("binned", "mixture"):
+            return self._evaluate_scores(predictions)
+        values, inverse = np.unique(predictions, return_inverse=True)
+        if self.cache_size is None:
+            return self._evaluate_scores(values)[inverse]
+        return self._cached_scores(values)[inverse]
+
+    def _column_scores(self, predictions: FloatArray) -> FloatArray:
+        scores = np.zeros_like(predictions)
+        if self.engine != "exact" or self.cache_size is not None:
+            for index, column in enumerate(self.column_debiasers_):
+                scores[:, index] = column._score(predictions[:, index])
+            self.diagnostics_ = tuple(column.diagnostics_ for column in self.column_debiasers_)
+            return scores
+
+        active = self.sigma_ > 0.0
+        if not np.any(active):
+            return scores
+        centers = self.sorted_cal_predictions_[:, active]
+        bandwidths = self.bandwidth_[active]
+        block_rows = self._block_rows(centers.size)
+        for start in range(0, predictions.shape[0], block_rows):
+            block = slice(start, start + block_rows)
+            scores[block, active] = gaussian_score(predictions[block][:, active], centers, bandwidths)
+        return scores
+
+    def debiased_predictions(self, predictions: ArrayLike, out: FloatArray | None = None) -> FloatArray:
+        """
+        Return per-observation debiased predictions, optionally into ``out``.
+
+        Float32 predictions give float32 results; kernel sums are still
+        accumulated in float64 within each memory-bounded block.
+        """
         self._require_is_fit("sigma_", "diagnostics_", method_name="debiased_predictions")
-        prediction_array = self._validate_prediction_inputs(predictions)
+        with self._predict_stage("predict_validate") as stage:
+            prediction_array = self._validate_prediction_inputs(predictions)
+            stage.elements = prediction_array.size
         self._warn_if_outside_support(prediction_array)
-        scores = self._score(prediction_array)
-        return prediction_array - self.sigma_**2 * scores
+        with self._predict_stage("score", prediction_array.size):
+            return self._debias(prediction_array, out=self._check_out(out, prediction_array))
+
+    def _debias(self, predictions: FloatArray, out: FloatArray | None = None) -> FloatArray:
+        if self.n_columns_ is None:
+            scores = self._score(predictions)
+        else:
+            scores = self._column_scores(predictions)
+        scores *= -np.square(self.sigma_)
+        return np.add(predictions, scores, out=scores if out is None else out)
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
 
 import numpy as np
-from numpy.random import Generator, default_rng
+from numpy.random import Generator, SeedSequence, default_rng
 from numpy.typing import ArrayLike, NDArray
-from sklearn.model_selection import KFold
 
 from .base import BaseDebiaser
 from .lcc import LccDebiaser
+from .profiling import StageTimings, profile_stage, profiling_enabled
 from .reports import DebiaserComparisonReport, DebiaserMetrics
 from .tweedie import TweedieDebiaser
 
 FloatArray = NDArray[np.float64]
+IntArray = NDArray[np.intp]
+TaskResult = TypeVar("TaskResult")
 
 
 def _as_1d_float_array(values: ArrayLike, *, name: str) -> FloatArray:
@@ -70,51 +74,136 @@ def _summary_metrics(
     )
 
 
-def _contrast_masks(
-    predictions: FloatArray,
+def _contrast_cutoffs(
+    sorted_predictions: FloatArray,
     rng: Generator,
     *,
     n_contrast_draws: int,
-) -> list[tuple[FloatArray, FloatArray]]:
-    masks: list[tuple[FloatArray, FloatArray]] = []
-    for _ in range(n_contrast_draws):
-        lower_quantile = float(rng.uniform(0.05, 0.35))
-        upper_quantile = float(rng.uniform(0.65, 0.95))
-        lower_cutoff, upper_cutoff = np.quantile(predictions, [lower_quantile, upper_quantile])
-        control_mask = predictions <= lower_cutoff
-        treated_mask = predictions >= upper_cutoff
-        if control_mask.sum() == 0 or treated_mask.sum() == 0:
-            continue
-        masks.append((treated_mask, control_mask))
-    return masks
-
-
-def _contrast_metrics(
-    predictions: FloatArray,
-    targets: FloatArray,
-    debiasers: dict[str, BaseDebiaser],
-    rng: Generator,
-    *,
-    n_contrast_draws: int,
-) -> tuple[dict[str, list[float]], list[float]]:
-    truth_values: list[float] = []
-    estimated_values: dict[str, list[float]] = defaultdict(list)
-    for treated_mask, control_mask in _contrast_masks(
-        predictions,
-        rng,
-        n_contrast_draws=n_contrast_draws,
-    ):
-        treated_predictions = predictions[treated_mask]
-        control_predictions = predictions[control_mask]
-        truth_values.append(float(np.mean(targets[treated_mask]) - np.mean(targets[control_mask])))
-        estimated_values["naive"].append(
-            float(np.mean(treated_predictions) - np.mean(control_predictions))
+) -> tuple[IntArray, IntArray]:
+    """
+    Draw pseudo-contrasts as rank thresholds on the sorted fold predictions.
+
+    Draw ``d`` compares the first ``control_counts[d]`` sorted units (predictions
+    at or below a lower quantile) against the units from ``treated_starts[d]``
+    onwards (predictions at or above an upper quantile).
+    """
+    quantiles = rng.uniform([0.05, 0.65], [0.35, 0.95], size=(n_contrast_draws, 2))
+    cutoffs = np.quantile(sorted_predictions, quantiles)
+    control_counts = np.searchsorted(sorted_predictions, cutoffs[:, 0], side="right")
+    treated_starts = np.searchsorted(sorted_predictions, cutoffs[:, 1], side="left")
+    valid = (control_counts > 0) & (treated_starts < sorted_predictions.size)
+    return control_counts[valid], treated_starts[valid]
+
+
+@dataclass(frozen=True)
+class _FoldPlan:
+    """
+    Everything a fold shares across candidates: training pairs and test pairs
+    sorted by prediction, and the contrast cutoffs as ranks into the sorted
+    test predictions.
+    """
+
+    train_predictions: FloatArray
+    train_targets: FloatArray
+    test_predictions: FloatArray
+    test_targets: FloatArray
+    control_counts: IntArray
+    treated_starts: IntArray
+
+    @classmethod
+    def build(
+        cls,
+        predictions: FloatArray,
+        targets: FloatArray,
+        train_index: IntArray,
+        test_index: IntArray,
+        seed: SeedSequence,
+        n_contrast_draws: int,
+    ) -> "_FoldPlan":
+        train_index = train_index[np.argsort(predictions[train_index], kind="stable")]
+        test_index = test_index[np.argsort(predictions[test_index], kind="stable")]
+        control_counts, treated_starts = _contrast_cutoffs(
+            predictions[test_index],
+            default_rng(seed),
+            n_contrast_draws=n_contrast_draws,
         )
-        for name, debiaser in debiasers.items():
-            estimated_values[name].append(
-                float(debiaser.debiased_ate(treated_predictions, control_predictions))
-            )
-    return estimated_values, truth_values
+        return cls(
+            train_predictions=predictions[train_index],
+            train_targets=targets[train_index],
+            test_predictions=predictions[test_index],
+            test_targets=targets[test_index],
+            control_counts=control_counts,
+            treated_starts=treated_starts,
+        )
+
+    def contrasts(self, values: FloatArray) -> FloatArray:
+        """Treated-minus-control means of ``values`` (aligned with the sorted test set) for every draw."""
+        # Centering keeps the running sums small, so the group means stay accurate.
+        prefix_sums = np.concatenate([[0.0], np.cumsum(values - np.mean(values))])
+        control_means = prefix_sums[self.control_counts] / self.control_counts
+        treated_means = (prefix_sums[-1] - prefix_sums[self.treated_starts]) / (values.size - self.treated_starts)
+        return treated_means - control_means
+
+
+@dataclass(frozen=True)
+class _FoldResult:
+    mean_estimates: dict[str, float]
+    contrast_estimates: dict[str, FloatArray]
+    warning_flags: dict[str, tuple[str, ...]]
+    timings: StageTimings
+
+
+def _evaluate_fold(
+    templates: dict[str, BaseDebiaser],
+    plan: _FoldPlan,
+    profile: bool = False,
+) -> _FoldResult:
+    timings: StageTimings = {}
+    mean_estimates: dict[str, float] = {}
+    contrast_estimates: dict[str, FloatArray] = {}
+    warning_flags: dict[str, tuple[str, ...]] = {}
+    for name, template in templates.items():
+        debiaser = _clone_debiaser(template)
+        with profile_stage(f"{name}_fit", timings, plan.train_predictions.size, enabled=profile):
+            debiaser.fit(plan.train_predictions, plan.train_targets)
+        # Each fold debiaser is applied once; its contrasts are prefix-sum differences of this vector.
+        with profile_stage(f"{name}_predict", timings, plan.test_predictions.size, enabled=profile):
+            debiased = debiaser.debiased_predictions(plan.test_predictions)
+        mean_estimates[name] = float(np.mean(debiased))
+        contrast_estimates[name] = plan.contrasts(debiased)
+        warning_flags[name] = debiaser.diagnostics_.warning_flags
+    return _FoldResult(
+        mean_estimates=mean_estimates,
+        contrast_estimates=contrast_estimates,
+        warning_flags=warning_flags,
+        timings=timings,
+    )
+
+
+def _check_n_jobs(n_jobs: Optional[int]) -> None:
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be positive, or negative to use all cores.")
+
+
+def _run_tasks(
+    function: Callable[..., TaskResult],
+    arguments: list[tuple[Any, ...]],
+    *,
+    n_jobs: Optional[int],
+    executor: Optional[Executor],
+) -> list[TaskResult]:
+    """
+    Run ``function`` over argument tuples on ``executor`` when given, otherwise
+    on a thread pool of ``n_jobs`` workers (all cores for a negative value),
+    otherwise serially. Results keep the order of ``arguments``.
+    """
+    if executor is not None:
+        return list(executor.map(function, *zip(*arguments)))
+    if n_jobs is not None and n_jobs != 1:
+        max_workers = os.cpu_count() if n_jobs < 0 else n_jobs
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(function, *zip(*arguments)))
+    return [function(*task) for task in arguments]
 
 
 def _method_score(metrics: DebiaserMetrics, *, target_scale: float) -> float:
@@ -161,95 +250,123 @@ def compare_debiasers(
     cal_predictions: ArrayLike,
     cal_targets: ArrayLike,
     *,
+    debiasers: Optional[Mapping[str, BaseDebiaser]] = None,
     lcc_debiaser: BaseDebiaser | None = None,
     tweedie_debiaser: BaseDebiaser | None = None,
     n_splits: int = 5,
     n_contrast_draws: int = 100,
     random_state: int = 0,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ) -> DebiaserComparisonReport:
     """
-    Compare naive, LCC, and Tweedie corrections on held-out calibration folds.
+    Compare the naive estimate with candidate corrections on held-out
+    calibration folds and recommend the best candidate.
+
+    Candidates are ``debiasers``, a mapping of names to unfitted debiasers,
+    or by default ``"lcc"`` and ``"tweedie"`` (optionally configured through
+    ``lcc_debiaser`` and ``tweedie_debiaser``). The fold split, the
+    prediction-sorted fold arrays and the contrast cutoffs are computed once
+    and shared by every candidate, so comparing many candidates in one call
+    costs one fit and one prediction per candidate and fold.
+
+    Folds are evaluated on ``executor`` when given (for example a
+    ``ProcessPoolExecutor``), otherwise on a thread pool of ``n_jobs`` workers
+    (all cores for a negative value), otherwise serially. Each fold draws its
+    contrasts from its own ``SeedSequence`` child, so reports do not depend on
+    the worker count or completion order.
     """
     if n_splits < 2:
         raise ValueError("n_splits must be at least 2.")
     if n_contrast_draws < 1:
         raise ValueError("n_contrast_draws must be at least 1.")
-
-    prediction_array, target_array = _validate_pair(cal_predictions, cal_targets)
+    _check_n_jobs(n_jobs)
+    if debiasers is None:
+        templates: dict[str, BaseDebiaser] = {
+            "lcc": lcc_debiaser if lcc_debiaser is not None else LccDebiaser(),
+            "tweedie": tweedie_debiaser if tweedie_debiaser is not None else TweedieDebiaser(),
+        }
+    else:
+        if lcc_debiaser is not None or tweedie_debiaser is not None:
+            raise ValueError("Pass candidates either as debiasers or as lcc_debiaser/tweedie_debiaser, not both.")
+        templates = dict(debiasers)
+        if not templates:
+            raise ValueError("debiasers must contain at least one candidate.")
+        if "naive" in templates:
+            raise ValueError("'naive' is reserved for the uncorrected baseline.")
+        for name, template in templates.items():
+            if not isinstance(template, BaseDebiaser):
+                raise TypeError(f"debiasers[{name!r}] must be a BaseDebiaser, got {type(template).__name__}.")
+
+    # Resolved once here so folds on a process pool follow the caller's setting.
+    profile = profiling_enabled()
+    timings: StageTimings = {}
+    with profile_stage("validate", timings, enabled=profile) as stage:
+        prediction_array, target_array = _validate_pair(cal_predictions, cal_targets)
+        stage.elements = prediction_array.size
     if prediction_array.size <= n_splits:
         raise ValueError("n_splits must be smaller than the number of calibration observations.")
 
-    lcc_template = lcc_debiaser if lcc_debiaser is not None else LccDebiaser()
-    tweedie_template = tweedie_debiaser if tweedie_debiaser is not None else TweedieDebiaser()
-    master_rng = default_rng(random_state)
-    splitter = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    from sklearn.model_selection import KFold
 
-    mean_truth: list[float] = []
-    mean_estimates: dict[str, list[float]] = defaultdict(list)
-    contrast_truth: list[float] = []
-    contrast_estimates: dict[str, list[float]] = defaultdict(list)
-    warning_flags: dict[str, set[str]] = {"naive": set(), "lcc": set(), "tweedie": set()}
-
-    for train_index, test_index in splitter.split(prediction_array):
-        train_predictions = prediction_array[train_index]
-        train_targets = target_array[train_index]
-        test_predictions = prediction_array[test_index]
-        test_targets = target_array[test_index]
-
-        lcc = _clone_debiaser(lcc_template)
-        tweedie = _clone_debiaser(tweedie_template)
-        lcc.fit(train_predictions, train_targets)
-        tweedie.fit(train_predictions, train_targets)
-        warning_flags["lcc"].update(lcc.diagnostics_.warning_flags)
-        warning_flags["tweedie"].update(tweedie.diagnostics_.warning_flags)
-
-        truth_mean = float(np.mean(test_targets))
-        mean_truth.append(truth_mean)
-        mean_estimates["naive"].append(float(np.mean(test_predictions)))
-        mean_estimates["lcc"].append(float(lcc.debiased_mean(test_predictions)))
-        mean_estimates["tweedie"].append(float(tweedie.debiased_mean(test_predictions)))
-
-        contrast_rng = default_rng(int(master_rng.integers(0, 2**32 - 1)))
-        fold_contrast_estimates, fold_truth = _contrast_metrics(
-            test_predictions,
-            test_targets,
-            {"lcc": lcc, "tweedie": tweedie},
-            contrast_rng,
-            n_contrast_draws=n_contrast_draws,
-        )
-        contrast_truth.extend(fold_truth)
-        for name, values in fold_contrast_estimates.items():
-            contrast_estimates[name].extend(values)
+    splitter = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    fold_seeds = SeedSequence(random_state).spawn(n_splits)
+    with profile_stage("fold_plans", timings, prediction_array.size, enabled=profile):
+        plans = [
+            _FoldPlan.build(prediction_array, target_array, train_index, test_index, seed, n_contrast_draws)
+            for (train_index, test_index), seed in zip(splitter.split(prediction_array), fold_seeds)
+        ]
+    fold_arguments = [(templates, plan, profile) for plan in plans]
+    with profile_stage("folds", timings, n_splits, enabled=profile):
+        fold_results = _run_tasks(_evaluate_fold, fold_arguments, n_jobs=n_jobs, executor=executor)
+
+    names = ["naive", *templates]
+    mean_truth = np.array([np.mean(plan.test_targets) for plan in plans])
+    contrast_truth = np.concatenate([plan.contrasts(plan.test_targets) for plan in plans])
+    mean_estimates: dict[str, list[float]] = {"naive": [float(np.mean(plan.test_predictions)) for plan in plans]}
+    contrast_estimates: dict[str, list[FloatArray]] = {
+        "naive": [plan.contrasts(plan.test_predictions) for plan in plans]
+    }
+    warning_flags: dict[str, set[str]] = {name: set() for name in names}
+    for fold in fold_results:
+        for name in templates:
+            mean_estimates.setdefault(name, []).append(fold.mean_estimates[name])
+            contrast_estimates.setdefault(name, []).append(fold.contrast_estimates[name])
+            warning_flags[name].update(fold.warning_flags[name])
+        for key, value in fold.timings.items():
+            timings[key] = timings.get(key, 0) + value
 
-    mean_truth_array = np.asarray(mean_truth, dtype=float)
-    contrast_truth_array = np.asarray(contrast_truth, dtype=float)
     metrics = {
         name: _summary_metrics(
             name,
-            mean_truth_array,
+            mean_truth,
             np.asarray(mean_estimates[name], dtype=float),
-            contrast_truth_array,
-            np.asarray(contrast_estimates[name], dtype=float),
+            contrast_truth,
+            np.concatenate(contrast_estimates[name]),
             warning_flags[name],
         )
-        for name in ("naive", "lcc", "tweedie")
+        for name in names
     }
 
     target_scale = max(float(np.std(target_array)), np.finfo(float).eps ** 0.5)
-    candidate_scores = {
-        name: _method_score(metrics[name], target_scale=target_scale)
-        for name in ("lcc", "tweedie")
-    }
-    recommended_method = min(candidate_scores, key=candidate_scores.get)
+    candidate_scores = {name: _method_score(metrics[name], target_scale=target_scale) for name in templates}
+    ranking = sorted(candidate_scores, key=candidate_scores.get)
+    recommended_method = ranking[0]
     recommended_metrics = metrics[recommended_method]
-    runner_up = "tweedie" if recommended_method == "lcc" else "lcc"
-    runner_up_metrics = metrics[runner_up]
-    rationale = (
-        f"Recommended {recommended_method} because its pseudo-ATE RMSE "
-        f"({recommended_metrics.pseudo_ate_rmse:.4f}) and calibration slope "
-        f"({recommended_metrics.calibration_slope:.3f}) beat {runner_up}'s "
-        f"({runner_up_metrics.pseudo_ate_rmse:.4f}, {runner_up_metrics.calibration_slope:.3f})."
-    )
+    if len(ranking) == 1:
+        rationale = (
+            f"Recommended {recommended_method}, the only candidate; its pseudo-ATE RMSE is "
+            f"{recommended_metrics.pseudo_ate_rmse:.4f} against {metrics['naive'].pseudo_ate_rmse:.4f} for naive."
+        )
+    else:
+        runner_up = ranking[1]
+        runner_up_metrics = metrics[runner_up]
+        rationale = (
+            f"Recommended {recommended_method} because its pseudo-ATE RMSE "
+            f"({recommended_metrics.pseudo_ate_rmse:.4f}) and calibration slope "
+            f"({recommended_metrics.calibration_slope:.3f}) beat {runner_up}'s "
+            f"({runner_up_metrics.pseudo_ate_rmse:.4f}, {runner_up_metrics.calibration_slope:.3f})."
+        )
     aggregate_flags = tuple(sorted(set().union(*(metric.warning_flags for metric in metrics.values()))))
     return DebiaserComparisonReport(
         metrics=metrics,
@@ -259,4 +376,5 @@ def compare_debiasers(
         n_contrast_draws=n_contrast_draws,
         random_state=random_state,
         warning_flags=aggregate_flags,
+        timings=timings,
     )